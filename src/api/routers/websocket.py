@@ -244,9 +244,9 @@ async def user_websocket(
             await ws_manager.send_to_user(
                 user_id,
                 {
-                    "type": event.type.value,
-                    "data": event.data,
-                    "timestamp": event.timestamp.isoformat(),
+                    "type": event.type.wire,
+                    "data": dict(event.data),
+                    "timestamp": event.timestamp_dt.isoformat(),
                 },
             )
 
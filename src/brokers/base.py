@@ -132,6 +132,22 @@ class BaseBroker(ABC):
         :raises OrderError: If order placement fails.
         """
 
+    def build_place_order_fn(self) -> Optional[Callable[..., OrderResult]]:
+        """
+        Build a specialized order placement function for this client.
+
+        Override this to return a closure that goes straight from keyword
+        arguments to the broker's wire payload, skipping the generic
+        ``Order`` model. It is built once per session and called with the
+        keyword arguments ``tradingsymbol``, ``exchange``,
+        ``transaction_type``, ``quantity``, ``order_type``, ``product``,
+        ``price``, ``trigger_price`` and ``tag``.
+
+        :returns: Order placement function, or None to use ``place_order``.
+        :rtype: Optional[Callable[..., OrderResult]]
+        """
+        return None
+
     @abstractmethod
     def cancel_order(self, order_id: str) -> bool:
         """
@@ -10,17 +10,30 @@ the Zerodha Kite Connect REST API.
 
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 from datetime import datetime
-from urllib.parse import urljoin
 
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 import urllib3
 
 from ...config import get_config
 from ...constants import (
     API_ROUTES,
+    API_ROUTE_META,
     DEFAULT_ROOT_URI,
     DEFAULT_LOGIN_URI,
     DEFAULT_TIMEOUT,
@@ -53,6 +66,7 @@ from ...constants import (
 from ...exceptions import (
     InputException,
     DataException,
+    KiteException,
     NetworkException,
     get_exception_class,
 )
@@ -66,11 +80,105 @@ from ...utils import (
     format_datetime,
 )
 
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 log = logging.getLogger(__name__)
 
 __version__ = "1.0.0"
 __title__ = "KiteAPI"
 
+_BODY_METHODS = frozenset(("POST", "PUT"))
+
+_BASE_HEADERS = {
+    "X-Kite-Version": KITE_HEADER_VERSION,
+    "User-Agent": f"{__title__}-python/{__version__}",
+}
+
+_GTT_REQUIRED = ("transaction_type", "quantity", "order_type", "product", "price")
+_gtt_fields = itemgetter(*_GTT_REQUIRED)
+
+_EXPECTED_TRIGGERS = {
+    GTT_TYPE_SINGLE: (1, "single leg"),
+    GTT_TYPE_OCO: (2, "OCO"),
+}
+
+
+class _GTTPayload(NamedTuple):
+    """JSON encoded ``condition`` and ``orders`` form fields for a GTT."""
+
+    condition: str
+    orders: str
+
+
+def _encode_gtt_condition(
+    exchange: str,
+    tradingsymbol: str,
+    trigger_values: List[float],
+    last_price: float,
+) -> str:
+    """
+    Encode a GTT ``condition`` object as JSON.
+
+    The condition has a fixed schema, so the string is templated directly
+    instead of running the generic encoder over an intermediate dict.
+
+    :param exchange: Exchange name.
+    :param tradingsymbol: Trading symbol.
+    :param trigger_values: Trigger prices.
+    :param last_price: Last price.
+    :returns: JSON encoded condition.
+    """
+    return (
+        f'{{"exchange":{json.dumps(exchange)},'
+        f'"tradingsymbol":{json.dumps(tradingsymbol)},'
+        f'"trigger_values":{json.dumps(trigger_values)},'
+        f'"last_price":{json.dumps(last_price)}}}'
+    )
+
+
+def _encode_gtt_orders(
+    exchange: str,
+    tradingsymbol: str,
+    orders: List[Dict[str, Any]],
+) -> str:
+    """
+    Validate GTT order legs and encode them as a JSON array.
+
+    Each leg is written straight into the output string rather than
+    being copied into a fresh dict for ``json.dumps``.
+
+    :param exchange: Exchange name.
+    :param tradingsymbol: Trading symbol.
+    :param orders: Order list.
+    :returns: JSON encoded orders.
+    :raises InputException: If a leg is missing a required field.
+    """
+    prefix = (
+        f'{{"exchange":{json.dumps(exchange)},'
+        f'"tradingsymbol":{json.dumps(tradingsymbol)},'
+    )
+    parts = []
+    for order in orders:
+        try:
+            transaction_type, quantity, order_type, product, price = _gtt_fields(order)
+        except KeyError as e:
+            raise InputException(f"'{e.args[0]}' missing in orders")
+
+        parts.append(
+            f'{prefix}"transaction_type":{json.dumps(transaction_type)},'
+            f'"quantity":{int(quantity)},'
+            f'"order_type":{json.dumps(order_type)},'
+            f'"product":{json.dumps(product)},'
+            f'"price":{float(price)!r}}}'
+        )
+
+    return "[" + ",".join(parts) + "]"
+
 
 class KiteClient:
     """
@@ -188,16 +296,21 @@ class KiteClient:
         """
         config = get_config()
 
-        self.api_key = api_key or config.api_key
-        self.access_token = access_token or config.access_token
-        self.debug = debug or config.debug
-        self.disable_ssl = disable_ssl or config.disable_ssl
-        self.root = root or config.root_url or DEFAULT_ROOT_URI
-        self.timeout = timeout or config.timeout or DEFAULT_TIMEOUT
-        self.proxies = proxies or config.proxy or {}
+        self.api_key: str = api_key or config.api_key
+        self.access_token: Optional[str] = access_token or config.access_token
+        self.debug: bool = debug or config.debug
+        self.disable_ssl: bool = disable_ssl or config.disable_ssl
+        self.root: str = root or config.root_url or DEFAULT_ROOT_URI
+        self.timeout: int = timeout or config.timeout or DEFAULT_TIMEOUT
+        self.proxies: Dict[str, str] = proxies or config.proxy or {}
         self.session_expiry_hook: Optional[Callable] = None
-        self._routes = API_ROUTES
+        self._routes: Mapping[str, str] = API_ROUTES
+        self._route_meta: Mapping[str, Tuple[str, bool, Tuple[str, ...]]] = (
+            API_ROUTE_META
+        )
+        self._root_prefix: str = self.root.rstrip("/")
         self.reqsession = requests.Session()
+        self._pool_maxsize: int = (pool or {}).get("pool_maxsize", DEFAULT_POOLSIZE)
         if pool:
             reqadapter = HTTPAdapter(**pool)
             self.reqsession.mount("https://", reqadapter)
@@ -712,11 +825,12 @@ class KiteClient:
             nse_instruments = client.instruments(exchange="NSE")
         """
         if exchange:
-            data = self._get("market.instruments", url_args={"exchange": exchange})
-        else:
-            data = self._get("market.instruments.all")
-
-        return parse_instruments_csv(data)
+            return self._get(
+                "market.instruments",
+                url_args={"exchange": exchange},
+                parse_stream=parse_instruments_csv,
+            )
+        return self._get("market.instruments.all", parse_stream=parse_instruments_csv)
 
     def quote(self, *instruments: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -919,7 +1033,7 @@ class KiteClient:
                 }]
             )
         """
-        condition, gtt_orders = self._get_gtt_payload(
+        payload = self._get_gtt_payload(
             trigger_type,
             tradingsymbol,
             exchange,
@@ -931,8 +1045,8 @@ class KiteClient:
         return self._post(
             "gtt.place",
             params={
-                "condition": json.dumps(condition),
-                "orders": json.dumps(gtt_orders),
+                "condition": payload.condition,
+                "orders": payload.orders,
                 "type": trigger_type,
             },
         )
@@ -967,7 +1081,7 @@ class KiteClient:
         :returns: Modification response.
         :rtype: Dict[str, Any]
         """
-        condition, gtt_orders = self._get_gtt_payload(
+        payload = self._get_gtt_payload(
             trigger_type,
             tradingsymbol,
             exchange,
@@ -980,8 +1094,8 @@ class KiteClient:
             "gtt.modify",
             url_args={"trigger_id": trigger_id},
             params={
-                "condition": json.dumps(condition),
-                "orders": json.dumps(gtt_orders),
+                "condition": payload.condition,
+                "orders": payload.orders,
                 "type": trigger_type,
             },
         )
@@ -1005,7 +1119,7 @@ class KiteClient:
         trigger_values: List[float],
         last_price: float,
         orders: List[Dict[str, Any]],
-    ) -> tuple:
+    ) -> _GTTPayload:
         """
         Build GTT payload for API request.
 
@@ -1015,56 +1129,32 @@ class KiteClient:
         :param trigger_values: Trigger prices.
         :param last_price: Last price.
         :param orders: Order list.
-        :returns: Tuple of (condition, orders) dictionaries.
+        :returns: JSON encoded condition and orders.
         :raises InputException: If inputs are invalid.
         """
         if not isinstance(trigger_values, list):
             raise InputException("Invalid type for trigger_values")
 
-        if trigger_type == GTT_TYPE_SINGLE and len(trigger_values) != 1:
-            raise InputException("Invalid trigger_values for single leg order type")
-        elif trigger_type == GTT_TYPE_OCO and len(trigger_values) != 2:
-            raise InputException("Invalid trigger_values for OCO order type")
-
-        condition = {
-            "exchange": exchange,
-            "tradingsymbol": tradingsymbol,
-            "trigger_values": trigger_values,
-            "last_price": last_price,
-        }
-
-        gtt_orders = []
-        required_fields = [
-            "transaction_type",
-            "quantity",
-            "order_type",
-            "product",
-            "price",
-        ]
-
-        for order in orders:
-            for field in required_fields:
-                if field not in order:
-                    raise InputException(f"'{field}' missing in orders")
-
-            gtt_orders.append(
-                {
-                    "exchange": exchange,
-                    "tradingsymbol": tradingsymbol,
-                    "transaction_type": order["transaction_type"],
-                    "quantity": int(order["quantity"]),
-                    "order_type": order["order_type"],
-                    "product": order["product"],
-                    "price": float(order["price"]),
-                }
-            )
-
-        return condition, gtt_orders
+        expected = _EXPECTED_TRIGGERS.get(trigger_type)
+        if expected is None:
+            raise InputException(f"Invalid trigger_type: {trigger_type}")
+        if len(trigger_values) != expected[0]:
+            raise InputException(f"Invalid trigger_values for {expected[1]} order type")
+
+        return _GTTPayload(
+            condition=_encode_gtt_condition(
+                exchange, tradingsymbol, trigger_values, last_price
+            ),
+            orders=_encode_gtt_orders(exchange, tradingsymbol, orders),
+        )
 
     def order_margins(self, params: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Calculate margins for a list of orders.
 
+        Prefer :meth:`order_margins_batch` when margins for several legs
+        are needed; this method is the per-leg fallback.
+
         :param params: List of order parameter dictionaries.
         :type params: List[Dict[str, Any]]
         :returns: List of margin requirement details.
@@ -1072,6 +1162,67 @@ class KiteClient:
         """
         return self._post("order.margins", params=params, is_json=True)
 
+    def order_margins_batch(
+        self, params_list: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate per-leg margins for many orders in a single request.
+
+        Uses the basket margins endpoint and unpacks its per-order
+        breakdown, so N legs cost one HTTP round trip instead of N.
+
+        :param params_list: List of order parameter dictionaries.
+        :type params_list: List[Dict[str, Any]]
+        :returns: List of margin requirement details, one per order.
+        :rtype: List[Dict[str, Any]]
+
+        Example::
+
+            margins = client.order_margins_batch([leg1, leg2, leg3])
+        """
+        data = self.basket_order_margins(params_list, consider_positions=True)
+        return data.get("orders", []) if data else []
+
+    def place_orders_concurrent(
+        self,
+        params_list: List[Dict[str, Any]],
+        max_workers: int = 4,
+    ) -> List[Union[str, KiteException]]:
+        """
+        Place several orders in parallel.
+
+        Each entry is passed as keyword arguments to :meth:`place_order`.
+        Workers share this client's ``requests.Session`` so they reuse
+        its pooled TLS connections. That is safe here: the urllib3
+        connection pool and the cookie jar are locked internally, and
+        requests only read the session's settings. Workers are capped at
+        the adapter's ``pool_maxsize`` so none waits for, or discards, a
+        pooled connection.
+
+        A failed order does not stop the others; its slot in the result
+        holds the exception instead of an order ID.
+
+        :param params_list: List of ``place_order`` keyword dictionaries.
+        :type params_list: List[Dict[str, Any]]
+        :param max_workers: Maximum number of concurrent requests.
+        :type max_workers: int
+        :returns: Order ID or raised exception for each entry, in the
+            same order as ``params_list``.
+        :rtype: List[Union[str, KiteException]]
+        """
+        if not params_list:
+            return []
+
+        def place(params: Dict[str, Any]) -> Union[str, KiteException]:
+            try:
+                return self.place_order(**params)
+            except KiteException as e:
+                return e
+
+        workers = min(max_workers, len(params_list), self._pool_maxsize)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(place, params_list))
+
     def basket_order_margins(
         self,
         params: List[Dict[str, Any]],
@@ -1302,11 +1453,11 @@ class KiteClient:
         :returns: List of MF instruments.
         :rtype: List[Dict[str, Any]]
         """
-        return parse_mf_instruments_csv(self._get("mf.instruments"))
+        return self._get("mf.instruments", parse_stream=parse_mf_instruments_csv)
 
     def _user_agent(self) -> str:
         """Get user agent string for requests."""
-        return f"{__title__}-python/{__version__}"
+        return _BASE_HEADERS["User-Agent"]
 
     def _get(
         self,
@@ -1314,10 +1465,16 @@ class KiteClient:
         url_args: Optional[Dict] = None,
         params: Optional[Dict] = None,
         is_json: bool = False,
+        parse_stream: Optional[Callable[[IO[bytes]], Any]] = None,
     ) -> Any:
         """Send GET request."""
         return self._request(
-            route, "GET", url_args=url_args, params=params, is_json=is_json
+            route,
+            "GET",
+            url_args=url_args,
+            params=params,
+            is_json=is_json,
+            parse_stream=parse_stream,
         )
 
     def _post(
@@ -1373,9 +1530,10 @@ class KiteClient:
         route: str,
         method: str,
         url_args: Optional[Dict] = None,
-        params: Optional[Dict] = None,
+        params: Optional[Union[Dict, List]] = None,
         is_json: bool = False,
         query_params: Optional[Dict] = None,
+        parse_stream: Optional[Callable[[IO[bytes]], Any]] = None,
     ) -> Any:
         """
         Make an HTTP request to the API.
@@ -1386,52 +1544,55 @@ class KiteClient:
         :param params: Request parameters.
         :param is_json: Send params as JSON body.
         :param query_params: URL query parameters.
+        :param parse_stream: Parser for CSV bodies. When given, the body
+            is streamed into it instead of being buffered, and the
+            response is closed once parsing finishes.
         :returns: API response data.
         :raises KiteException: On API errors.
         """
-        if url_args:
-            uri = self._routes[route].format(**url_args)
-        else:
-            uri = self._routes[route]
-
-        url = urljoin(self.root, uri)
-        headers = {
-            "X-Kite-Version": KITE_HEADER_VERSION,
-            "User-Agent": self._user_agent(),
-        }
-
+        uri, has_template, _ = self._route_meta[route]
+        url = self._root_prefix + (uri.format_map(url_args) if has_template else uri)
+        headers = _BASE_HEADERS.copy()
         if self.api_key and self.access_token:
-            auth_header = f"{self.api_key}:{self.access_token}"
-            headers["Authorization"] = f"token {auth_header}"
+            headers["Authorization"] = f"token {self.api_key}:{self.access_token}"
 
         if self.debug:
             log.debug(f"Request: {method} {url} params={params} headers={headers}")
-        if method in ["GET", "DELETE"]:
+        json_body = data_body = None
+        if method in _BODY_METHODS:
+            if is_json:
+                json_body = params
+            else:
+                data_body = params
+        else:
             query_params = params
 
         try:
             response = self.reqsession.request(
                 method,
                 url,
-                json=params if (method in ["POST", "PUT"] and is_json) else None,
-                data=params if (method in ["POST", "PUT"] and not is_json) else None,
+                json=json_body,
+                data=data_body,
                 params=query_params,
                 headers=headers,
                 verify=not self.disable_ssl,
                 allow_redirects=True,
                 timeout=self.timeout,
                 proxies=self.proxies,
+                stream=parse_stream is not None,
             )
         except Exception as e:
             raise NetworkException(f"Network error: {str(e)}")
 
-        if self.debug:
-            log.debug(f"Response: {response.status_code} {response.content[:500]}")
-        if "json" in response.headers.get("content-type", ""):
+        content_type = response.headers.get("content-type", "").lower()
+        if content_type.startswith("application/json"):
+            content = response.content
+            if self.debug:
+                log.debug(f"Response: {response.status_code} {content[:500]}")
             try:
-                data = response.json()
+                data = _json_loads(content)
             except ValueError:
-                raise DataException(f"Couldn't parse JSON response: {response.content}")
+                raise DataException(f"Couldn't parse JSON response: {content}")
             if data.get("status") == "error" or data.get("error_type"):
                 if (
                     self.session_expiry_hook
@@ -1450,10 +1611,20 @@ class KiteClient:
 
             return data.get("data")
 
-        elif "csv" in response.headers.get("content-type", ""):
-            return response.content
+        elif content_type.startswith("text/csv"):
+            if parse_stream is not None:
+                if self.debug:
+                    log.debug(f"Response: {response.status_code} <streamed csv>")
+                with response:
+                    response.raw.decode_content = True
+                    return parse_stream(response.raw)
+            content = response.content
+            if self.debug:
+                log.debug(f"Response: {response.status_code} {content[:500]}")
+            return content
 
         else:
-            raise DataException(
-                f"Unknown Content-Type: {response.headers.get('content-type')}"
-            )
+            if self.debug:
+                log.debug(f"Response: {response.status_code} {content_type}")
+            response.close()
+            raise DataException(f"Unknown Content-Type: {content_type}")
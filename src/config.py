@@ -2,17 +2,91 @@
 Configuration module for Kite Connect API.
 
 This module handles loading environment variables and configuration
-settings from .env file using python-dotenv.
+settings from an optional .env file using python-dotenv.
 
 :copyright: (c) 2025
 :license: MIT
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
-from dotenv import load_dotenv
 
-load_dotenv()
+
+def load_env_file(override: bool = False) -> None:
+    """
+    Load variables from a local ``.env`` file into the environment.
+
+    ``python-dotenv`` is only imported when a ``.env`` file exists in the
+    working directory, and loading is skipped entirely when
+    ``KITE_SKIP_DOTENV`` is set (e.g. containers that inject real env vars).
+
+    :param override: Override variables that are already set.
+    :type override: bool
+    """
+    if os.getenv("KITE_SKIP_DOTENV") or not os.path.exists(".env"):
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(".env", override=override)
+
+
+load_env_file()
+
+
+@lru_cache(maxsize=None)
+def _parse_bool(value: str) -> bool:
+    """
+    Parse a boolean environment value.
+
+    :param value: Raw environment value.
+    :type value: str
+    :returns: True if the value is ``"true"`` (case-insensitive).
+    :rtype: bool
+    """
+    return value.lower() == "true"
+
+
+@lru_cache(maxsize=None)
+def _parse_int(value: str) -> int:
+    """
+    Parse an integer environment value.
+
+    :param value: Raw environment value.
+    :type value: str
+    :returns: Parsed integer.
+    :rtype: int
+    """
+    return int(value)
+
+
+def _bool_env(key: str, default: str) -> bool:
+    """
+    Read a boolean setting from the environment.
+
+    :param key: Environment variable name.
+    :type key: str
+    :param default: Raw default used when the variable is unset.
+    :type default: str
+    :returns: Parsed boolean value.
+    :rtype: bool
+    """
+    return _parse_bool(os.environ.get(key, default))
+
+
+def _int_env(key: str, default: str) -> int:
+    """
+    Read an integer setting from the environment.
+
+    :param key: Environment variable name.
+    :type key: str
+    :param default: Raw default used when the variable is unset.
+    :type default: str
+    :returns: Parsed integer value.
+    :rtype: int
+    """
+    return _parse_int(os.environ.get(key, default))
 
 
 class Config:
@@ -49,24 +123,18 @@ class Config:
             "KITE_LOGIN_URL", "https://kite.zerodha.com/connect/login"
         )
         self.websocket_url: str = os.getenv("KITE_WEBSOCKET_URL", "wss://ws.kite.trade")
-        self.debug: bool = os.getenv("KITE_DEBUG", "false").lower() == "true"
-        self.timeout: int = int(os.getenv("KITE_TIMEOUT", "7"))
-        self.disable_ssl: bool = (
-            os.getenv("KITE_DISABLE_SSL", "false").lower() == "true"
-        )
-        self.ws_reconnect: bool = (
-            os.getenv("KITE_WS_RECONNECT", "true").lower() == "true"
-        )
-        self.ws_reconnect_max_tries: int = int(
-            os.getenv("KITE_WS_RECONNECT_MAX_TRIES", "50")
-        )
-        self.ws_reconnect_max_delay: int = int(
-            os.getenv("KITE_WS_RECONNECT_MAX_DELAY", "60")
-        )
-        self.ws_connect_timeout: int = int(os.getenv("KITE_WS_CONNECT_TIMEOUT", "30"))
+        self.debug: bool = _bool_env("KITE_DEBUG", "false")
+        self.timeout: int = _int_env("KITE_TIMEOUT", "7")
+        self.disable_ssl: bool = _bool_env("KITE_DISABLE_SSL", "false")
+        self.ws_reconnect: bool = _bool_env("KITE_WS_RECONNECT", "true")
+        self.ws_reconnect_max_tries: int = _int_env("KITE_WS_RECONNECT_MAX_TRIES", "50")
+        self.ws_reconnect_max_delay: int = _int_env("KITE_WS_RECONNECT_MAX_DELAY", "60")
+        self.ws_connect_timeout: int = _int_env("KITE_WS_CONNECT_TIMEOUT", "30")
         self.proxy_host: Optional[str] = os.getenv("KITE_PROXY_HOST")
         proxy_port_str = os.getenv("KITE_PROXY_PORT")
-        self.proxy_port: Optional[int] = int(proxy_port_str) if proxy_port_str else None
+        self.proxy_port: Optional[int] = (
+            _parse_int(proxy_port_str) if proxy_port_str else None
+        )
 
     @property
     def proxy(self) -> Optional[dict]:
@@ -141,6 +209,6 @@ def reload_config() -> Config:
     :rtype: Config
     """
     global config
-    load_dotenv(override=True)
+    load_env_file(override=True)
     config = Config()
     return config
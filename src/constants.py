@@ -8,6 +8,9 @@ including products, order types, exchanges, validity types, and API routes.
 :license: MIT
 """
 
+import re
+from types import MappingProxyType
+
 DEFAULT_ROOT_URI = "https://api.kite.trade"
 DEFAULT_LOGIN_URI = "https://kite.zerodha.com/connect/login"
 DEFAULT_TIMEOUT = 7
@@ -107,17 +110,19 @@ EXCHANGE_BCD = "BCD"
 """BSE Currency Derivatives."""
 
 
-EXCHANGE_MAP = {
-    "nse": 1,
-    "nfo": 2,
-    "cds": 3,
-    "bse": 4,
-    "bfo": 5,
-    "bcd": 6,
-    "mcx": 7,
-    "mcxsx": 8,
-    "indices": 9,
-}
+EXCHANGE_MAP = MappingProxyType(
+    {
+        "nse": 1,
+        "nfo": 2,
+        "cds": 3,
+        "bse": 4,
+        "bfo": 5,
+        "bcd": 6,
+        "mcx": 7,
+        "mcxsx": 8,
+        "indices": 9,
+    }
+)
 
 
 MARGIN_EQUITY = "equity"
@@ -185,52 +190,62 @@ MODE_LTP = "ltp"
 """LTP mode - only last traded price."""
 
 
-API_ROUTES = {
-    "api.token": "/session/token",
-    "api.token.invalidate": "/session/token",
-    "api.token.renew": "/session/refresh_token",
-    "user.profile": "/user/profile",
-    "user.margins": "/user/margins",
-    "user.margins.segment": "/user/margins/{segment}",
-    "orders": "/orders",
-    "trades": "/trades",
-    "order.info": "/orders/{order_id}",
-    "order.place": "/orders/{variety}",
-    "order.modify": "/orders/{variety}/{order_id}",
-    "order.cancel": "/orders/{variety}/{order_id}",
-    "order.trades": "/orders/{order_id}/trades",
-    "portfolio.positions": "/portfolio/positions",
-    "portfolio.holdings": "/portfolio/holdings",
-    "portfolio.holdings.auction": "/portfolio/holdings/auctions",
-    "portfolio.positions.convert": "/portfolio/positions",
-    "mf.orders": "/mf/orders",
-    "mf.order.info": "/mf/orders/{order_id}",
-    "mf.order.place": "/mf/orders",
-    "mf.order.cancel": "/mf/orders/{order_id}",
-    "mf.sips": "/mf/sips",
-    "mf.sip.info": "/mf/sips/{sip_id}",
-    "mf.sip.place": "/mf/sips",
-    "mf.sip.modify": "/mf/sips/{sip_id}",
-    "mf.sip.cancel": "/mf/sips/{sip_id}",
-    "mf.holdings": "/mf/holdings",
-    "mf.instruments": "/mf/instruments",
-    "market.instruments.all": "/instruments",
-    "market.instruments": "/instruments/{exchange}",
-    "market.margins": "/margins/{segment}",
-    "market.historical": "/instruments/historical/{instrument_token}/{interval}",
-    "market.trigger_range": "/instruments/trigger_range/{transaction_type}",
-    "market.quote": "/quote",
-    "market.quote.ohlc": "/quote/ohlc",
-    "market.quote.ltp": "/quote/ltp",
-    "gtt": "/gtt/triggers",
-    "gtt.place": "/gtt/triggers",
-    "gtt.info": "/gtt/triggers/{trigger_id}",
-    "gtt.modify": "/gtt/triggers/{trigger_id}",
-    "gtt.delete": "/gtt/triggers/{trigger_id}",
-    "order.margins": "/margins/orders",
-    "order.margins.basket": "/margins/basket",
-    "order.contract_note": "/charges/orders",
-}
+API_ROUTES = MappingProxyType(
+    {
+        "api.token": "/session/token",
+        "api.token.invalidate": "/session/token",
+        "api.token.renew": "/session/refresh_token",
+        "user.profile": "/user/profile",
+        "user.margins": "/user/margins",
+        "user.margins.segment": "/user/margins/{segment}",
+        "orders": "/orders",
+        "trades": "/trades",
+        "order.info": "/orders/{order_id}",
+        "order.place": "/orders/{variety}",
+        "order.modify": "/orders/{variety}/{order_id}",
+        "order.cancel": "/orders/{variety}/{order_id}",
+        "order.trades": "/orders/{order_id}/trades",
+        "portfolio.positions": "/portfolio/positions",
+        "portfolio.holdings": "/portfolio/holdings",
+        "portfolio.holdings.auction": "/portfolio/holdings/auctions",
+        "portfolio.positions.convert": "/portfolio/positions",
+        "mf.orders": "/mf/orders",
+        "mf.order.info": "/mf/orders/{order_id}",
+        "mf.order.place": "/mf/orders",
+        "mf.order.cancel": "/mf/orders/{order_id}",
+        "mf.sips": "/mf/sips",
+        "mf.sip.info": "/mf/sips/{sip_id}",
+        "mf.sip.place": "/mf/sips",
+        "mf.sip.modify": "/mf/sips/{sip_id}",
+        "mf.sip.cancel": "/mf/sips/{sip_id}",
+        "mf.holdings": "/mf/holdings",
+        "mf.instruments": "/mf/instruments",
+        "market.instruments.all": "/instruments",
+        "market.instruments": "/instruments/{exchange}",
+        "market.margins": "/margins/{segment}",
+        "market.historical": "/instruments/historical/{instrument_token}/{interval}",
+        "market.trigger_range": "/instruments/trigger_range/{transaction_type}",
+        "market.quote": "/quote",
+        "market.quote.ohlc": "/quote/ohlc",
+        "market.quote.ltp": "/quote/ltp",
+        "gtt": "/gtt/triggers",
+        "gtt.place": "/gtt/triggers",
+        "gtt.info": "/gtt/triggers/{trigger_id}",
+        "gtt.modify": "/gtt/triggers/{trigger_id}",
+        "gtt.delete": "/gtt/triggers/{trigger_id}",
+        "order.margins": "/margins/orders",
+        "order.margins.basket": "/margins/basket",
+        "order.contract_note": "/charges/orders",
+    }
+)
+
+API_ROUTE_META = MappingProxyType(
+    {
+        route: (uri, "{" in uri, tuple(re.findall(r"\{(\w+)\}", uri)))
+        for route, uri in API_ROUTES.items()
+    }
+)
+"""Per-route ``(uri, has_template, required_args)`` computed once at import."""
 
 
 INTERVAL_MINUTE = "minute"
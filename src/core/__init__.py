@@ -9,6 +9,7 @@ a scalable, extensible trading system:
 - **sessions**: Multi-user session management
 - **container**: Dependency injection container
 - **services**: Business logic service layer
+- **ringbuf**: Pre-allocated ring buffer for tick delivery
 
 :copyright: (c) 2025
 :license: MIT
@@ -67,6 +68,7 @@ from src.core.repositories import (
     SessionRepository,
     TradeLogRepository,
 )
+from src.core.ringbuf import Ring, RingConsumer, TickSlot
 from src.core.services import (
     BaseService,
     RuleExecutionService,
@@ -92,6 +94,9 @@ __all__ = [
     "SessionRepository",
     "RulesRepository",
     "TradeLogRepository",
+    "Ring",
+    "RingConsumer",
+    "TickSlot",
     "BaseService",
     "TradingService",
     "RuleExecutionService",
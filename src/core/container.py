@@ -9,12 +9,22 @@ service dependencies and their lifecycle.
 """
 
 import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
+from functools import cache, lru_cache, partial
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
     Dict,
+    ForwardRef,
+    FrozenSet,
+    Iterator,
+    Mapping,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -25,6 +35,41 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_current_scope: ContextVar[Optional[str]] = ContextVar("scope", default=None)
+"""Scope ID used by scoped resolution when none is passed explicitly."""
+
+
+@lru_cache(maxsize=None)
+def _ctor_hints(cls: Type) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Get the annotated constructor parameters of a class.
+
+    Results are memoized per class. Classes inheriting
+    ``object.__init__`` or with an unannotated constructor skip
+    introspection entirely. The raw ``__annotations__`` are used
+    directly when they are all real types; ``get_type_hints`` is only
+    needed to resolve string or ``ForwardRef`` annotations.
+
+    :param cls: Class to inspect.
+    :type cls: Type
+    :returns: Tuple of ``(param_name, param_type)`` pairs.
+    :rtype: Tuple[Tuple[str, Any], ...]
+    """
+    init = cls.__init__
+    if init is object.__init__:
+        return ()
+    hints = getattr(init, "__annotations__", None)
+    if not hints:
+        return ()
+
+    if any(isinstance(hint, (str, ForwardRef)) for hint in hints.values()):
+        try:
+            hints = get_type_hints(init)
+        except NameError:
+            return ()
+
+    return tuple((name, hint) for name, hint in hints.items() if name != "return")
+
 
 class Lifecycle(Enum):
     """
@@ -48,8 +93,11 @@ class ServiceDescriptor:
     :ivar factory: Factory function or class to create instance.
     :ivar lifecycle: Service lifecycle.
     :ivar instance: Cached singleton instance.
+    :ivar resolver: Compiled resolution function taking a scope ID.
     """
 
+    __slots__ = ("service_type", "factory", "lifecycle", "instance", "resolver")
+
     def __init__(
         self,
         service_type: Type,
@@ -70,6 +118,7 @@ class ServiceDescriptor:
         self.factory = factory
         self.lifecycle = lifecycle
         self.instance: Optional[Any] = None
+        self.resolver: Optional[Callable[[Optional[str]], Any]] = None
 
 
 class Container:
@@ -93,10 +142,110 @@ class Container:
         repo = container.resolve(UserRepository)
     """
 
-    def __init__(self) -> None:
-        """Initialize empty container."""
-        self._services: Dict[Type, ServiceDescriptor] = {}
-        self._scoped_instances: Dict[str, Dict[Type, Any]] = {}
+    def __init__(self, max_scopes: int = 1024) -> None:
+        """
+        Initialize empty container.
+
+        Registrations are keyed by ``id(service_type)``; each descriptor
+        keeps a reference to its type, so the IDs stay valid while
+        registered.
+
+        :param max_scopes: Maximum number of live scopes. When a new scope
+            would exceed it, the least recently used scope and its
+            instances are evicted, bounding memory if ``clear_scope`` is
+            never called.
+        :type max_scopes: int
+        """
+        self._services: Mapping[int, ServiceDescriptor] = {}
+        self._service_ids: Optional[FrozenSet[int]] = None
+        self._scoped_instances: "OrderedDict[str, Dict[int, Any]]" = OrderedDict()
+        self._max_scopes = max_scopes
+        self._plans: Dict[Type, Tuple[Tuple[str, Callable], ...]] = {}
+
+    def _add(self, descriptor: ServiceDescriptor) -> "Container":
+        """
+        Store a descriptor and compile its resolver.
+
+        Injection plans capture the resolvers of registered dependencies,
+        so they are invalidated whenever the registrations change.
+
+        :param descriptor: Service descriptor.
+        :type descriptor: ServiceDescriptor
+        :returns: Self for chaining.
+        :rtype: Container
+        :raises RuntimeError: If the container has been sealed.
+        """
+        if self._service_ids is not None:
+            raise RuntimeError(
+                f"Cannot register {descriptor.service_type.__name__}: "
+                "container is sealed"
+            )
+        descriptor.resolver = self._build_resolver(descriptor)
+        self._services[id(descriptor.service_type)] = descriptor
+        self._plans.clear()
+        return self
+
+    def _build_resolver(
+        self, descriptor: ServiceDescriptor
+    ) -> Callable[[Optional[str]], Any]:
+        """
+        Compile a resolution function for a service.
+
+        Lifecycle and factory kind are inspected once here, so resolving
+        a service is a single call without branching on the descriptor.
+
+        :param descriptor: Service descriptor.
+        :type descriptor: ServiceDescriptor
+        :returns: Function resolving the service for a scope ID.
+        :rtype: Callable[[Optional[str]], Any]
+        """
+        factory = descriptor.factory
+        if isinstance(factory, type):
+            cls = factory
+
+            def create() -> Any:
+                return self._create_with_injection(cls)
+
+        else:
+            create = factory
+
+        if descriptor.lifecycle == Lifecycle.SINGLETON:
+
+            def resolve_singleton(scope_id: Optional[str]) -> Any:
+                if descriptor.instance is None:
+                    descriptor.instance = create()
+                return descriptor.instance
+
+            return resolve_singleton
+
+        if descriptor.lifecycle == Lifecycle.SCOPED:
+            type_id = id(descriptor.service_type)
+            scoped_instances = self._scoped_instances
+            max_scopes = self._max_scopes
+
+            def resolve_scoped(scope_id: Optional[str]) -> Any:
+                if scope_id is None:
+                    scope_id = _current_scope.get()
+                    if scope_id is None:
+                        raise ValueError("Scope ID required for scoped services")
+                instances = scoped_instances.get(scope_id)
+                if instances is None:
+                    instances = scoped_instances[scope_id] = {}
+                    if len(scoped_instances) > max_scopes:
+                        scoped_instances.popitem(last=False)
+                else:
+                    scoped_instances.move_to_end(scope_id)
+                instance = instances.get(type_id)
+                if instance is None:
+                    instance = instances[type_id] = create()
+                return instance
+
+            return resolve_scoped
+
+        def resolve_transient(scope_id: Optional[str]) -> Any:
+            return create()
+
+        return resolve_transient
 
     def register(
         self,
@@ -122,12 +271,13 @@ class Container:
             container.register(Config)
         """
         factory = implementation or service_type
-        self._services[service_type] = ServiceDescriptor(
-            service_type=service_type,
-            factory=factory,
-            lifecycle=lifecycle,
+        return self._add(
+            ServiceDescriptor(
+                service_type=service_type,
+                factory=factory,
+                lifecycle=lifecycle,
+            )
         )
-        return self
 
     def register_instance(
         self,
@@ -155,8 +305,7 @@ class Container:
             lifecycle=Lifecycle.SINGLETON,
         )
         descriptor.instance = instance
-        self._services[service_type] = descriptor
-        return self
+        return self._add(descriptor)
 
     def register_factory(
         self,
@@ -183,13 +332,55 @@ class Container:
                 lambda c: Database(c.resolve(Config).db_url)
             )
         """
-        self._services[service_type] = ServiceDescriptor(
-            service_type=service_type,
-            factory=lambda: factory(self),
-            lifecycle=lifecycle,
+        return self._add(
+            ServiceDescriptor(
+                service_type=service_type,
+                factory=partial(factory, self),
+                lifecycle=lifecycle,
+            )
         )
+
+    def seal(self) -> "Container":
+        """
+        Freeze the registrations once the application is wired.
+
+        The service table becomes a read-only mapping and the registered
+        type IDs are materialized into a frozenset used for membership
+        checks. Any later registration raises ``RuntimeError``.
+
+        :returns: Self for chaining.
+        :rtype: Container
+        """
+        if self._service_ids is None:
+            self._service_ids = frozenset(self._services)
+            self._services = MappingProxyType(dict(self._services))
         return self
 
+    @contextmanager
+    def enter_scope(self, scope_id: str) -> Iterator[str]:
+        """
+        Make a scope current for the enclosed block.
+
+        Scoped services resolved without an explicit ``scope_id`` inside
+        the block, including those injected into constructors, use this
+        scope. The previous scope is restored on exit.
+
+        :param scope_id: Scope ID to enter.
+        :type scope_id: str
+        :returns: Context manager yielding the scope ID.
+        :rtype: Iterator[str]
+
+        Example::
+
+            with container.enter_scope(request_id):
+                repo = container.resolve(UserRepository)
+        """
+        token = _current_scope.set(scope_id)
+        try:
+            yield scope_id
+        finally:
+            _current_scope.reset(token)
+
     def resolve(
         self,
         service_type: Type[T],
@@ -200,7 +391,8 @@ class Container:
 
         :param service_type: The type to resolve.
         :type service_type: Type[T]
-        :param scope_id: Scope ID for scoped services.
+        :param scope_id: Scope ID for scoped services, defaulting to the
+            scope entered with ``enter_scope``.
         :type scope_id: Optional[str]
         :returns: Service instance.
         :rtype: T
@@ -210,44 +402,11 @@ class Container:
 
             user_service = container.resolve(IUserService)
         """
-        if service_type not in self._services:
+        descriptor = self._services.get(id(service_type))
+        if descriptor is None:
             raise KeyError(f"Service {service_type.__name__} not registered")
 
-        descriptor = self._services[service_type]
-
-        if descriptor.lifecycle == Lifecycle.SINGLETON:
-            if descriptor.instance is None:
-                descriptor.instance = self._create_instance(descriptor)
-            return descriptor.instance
-
-        if descriptor.lifecycle == Lifecycle.SCOPED:
-            if scope_id is None:
-                raise ValueError("Scope ID required for scoped services")
-            if scope_id not in self._scoped_instances:
-                self._scoped_instances[scope_id] = {}
-            if service_type not in self._scoped_instances[scope_id]:
-                self._scoped_instances[scope_id][service_type] = self._create_instance(
-                    descriptor
-                )
-            return self._scoped_instances[scope_id][service_type]
-
-        return self._create_instance(descriptor)
-
-    def _create_instance(self, descriptor: ServiceDescriptor) -> Any:
-        """
-        Create a service instance.
-
-        :param descriptor: Service descriptor.
-        :type descriptor: ServiceDescriptor
-        :returns: New service instance.
-        :rtype: Any
-        """
-        factory = descriptor.factory
-
-        if isinstance(factory, type):
-            return self._create_with_injection(factory)
-
-        return factory()
+        return descriptor.resolver(scope_id)
 
     def _create_with_injection(self, cls: Type[T]) -> T:
         """
@@ -258,19 +417,16 @@ class Container:
         :returns: New instance with injected dependencies.
         :rtype: T
         """
-        try:
-            hints = get_type_hints(cls.__init__)
-        except Exception:
-            hints = {}
-
-        hints.pop("return", None)
-
-        kwargs = {}
-        for param_name, param_type in hints.items():
-            if param_type in self._services:
-                kwargs[param_name] = self.resolve(param_type)
+        plan = self._plans.get(cls)
+        if plan is None:
+            registered = self._service_ids or self._services
+            plan = self._plans[cls] = tuple(
+                (param_name, self._services[id(param_type)].resolver)
+                for param_name, param_type in _ctor_hints(cls)
+                if id(param_type) in registered
+            )
 
-        return cls(**kwargs)
+        return cls(**{param_name: resolver(None) for param_name, resolver in plan})
 
     def try_resolve(
         self,
@@ -301,7 +457,7 @@ class Container:
         :returns: True if registered.
         :rtype: bool
         """
-        return service_type in self._services
+        return id(service_type) in (self._service_ids or self._services)
 
     def clear_scope(self, scope_id: str) -> None:
         """
@@ -314,25 +470,29 @@ class Container:
             del self._scoped_instances[scope_id]
 
     def clear(self) -> None:
-        """Clear all registrations and instances."""
-        self._services.clear()
+        """Clear all registrations and instances, unsealing the container."""
+        self._services = {}
+        self._service_ids = None
         self._scoped_instances.clear()
+        self._plans.clear()
+        _ctor_hints.cache_clear()
 
 
 _container: Optional[Container] = None
 
 
+@cache
 def get_container() -> Container:
     """
     Get the global container instance.
 
+    The result is memoized, so only the first call pays for the
+    ``None`` check or the construction.
+
     :returns: Global Container instance.
     :rtype: Container
     """
-    global _container
-    if _container is None:
-        _container = Container()
-    return _container
+    return _container or Container()
 
 
 def configure_container(container: Container) -> None:
@@ -344,3 +504,4 @@ def configure_container(container: Container) -> None:
     """
     global _container
     _container = container
+    get_container.cache_clear()
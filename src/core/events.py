@@ -9,20 +9,90 @@ between system components. Supports async handlers and event filtering.
 """
 
 import asyncio
+import functools
+import inspect
+import itertools
 import logging
+import os
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
-from uuid import uuid4
+from datetime import datetime, timezone
+from enum import IntEnum
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+"""Shared read-only default for event payloads that carry no data."""
 
-class EventType(str, Enum):
+
+def _empty_mapping() -> Mapping[str, Any]:
+    """Return the shared empty payload without allocating."""
+    return _EMPTY
+
+
+def _reset_event_ids() -> None:
+    """Start a new process-unique event ID sequence."""
+    global _event_prefix, _event_counter
+    _event_prefix = f"{os.getpid():x}-{time.time_ns():x}-"
+    _event_counter = itertools.count()
+
+
+def _next_event_id() -> str:
+    """
+    Generate a process-unique event ID.
+
+    IDs are a PID/start-time prefix plus a counter, which avoids the
+    ``os.urandom`` syscall ``uuid4()`` makes for every event.
+
+    :returns: Event identifier.
+    :rtype: str
+    """
+    return _event_prefix + format(next(_event_counter), "x")
+
+
+_reset_event_ids()
+os.register_at_fork(after_in_child=_reset_event_ids)
+
+
+def _is_async_handler(handler: Callable[..., Any]) -> bool:
+    """
+    Check whether calling a handler returns an awaitable.
+
+    Unwraps ``functools.partial`` and also recognises callable objects
+    whose ``__call__`` is ``async def``.
+
+    :param handler: Event handler.
+    :type handler: Callable[..., Any]
+    :returns: True if the handler is a coroutine function.
+    :rtype: bool
+    """
+    while isinstance(handler, functools.partial):
+        handler = handler.func
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+        getattr(handler, "__call__", None)
+    )
+
+
+class EventType(IntEnum):
     """
     Standard event types in the trading system.
 
+    Members are small integers so they hash and compare as machine
+    words; ``wire`` gives the dotted string used on the wire.
+
     :cvar POSITION_OPENED: New position detected.
     :cvar POSITION_CLOSED: Position fully closed.
     :cvar POSITION_UPDATED: Position quantity/price changed.
@@ -40,48 +110,107 @@ class EventType(str, Enum):
     :cvar RULE_DELETED: Trading rule deleted.
     :cvar SESSION_STARTED: User session started.
     :cvar SESSION_EXPIRED: User session expired.
+    :cvar SESSIONS_SHUTDOWN: All sessions ended at shutdown, in one batch.
     :cvar SYSTEM_ERROR: System error occurred.
     :cvar BROKER_CONNECTED: Broker connection established.
     :cvar BROKER_DISCONNECTED: Broker connection lost.
     """
 
-    POSITION_OPENED = "position.opened"
-    POSITION_CLOSED = "position.closed"
-    POSITION_UPDATED = "position.updated"
-    ORDER_PLACED = "order.placed"
-    ORDER_FILLED = "order.filled"
-    ORDER_CANCELLED = "order.cancelled"
-    ORDER_REJECTED = "order.rejected"
-    PRICE_UPDATE = "price.update"
-    TP_TRIGGERED = "trigger.tp"
-    SL_TRIGGERED = "trigger.sl"
-    TIME_TRIGGER = "trigger.time"
-    RULE_MATCHED = "rule.matched"
-    RULE_CREATED = "rule.created"
-    RULE_UPDATED = "rule.updated"
-    RULE_DELETED = "rule.deleted"
-    RULE_ENABLED = "rule.enabled"
-    RULE_DISABLED = "rule.disabled"
-    SESSION_STARTED = "session.started"
-    SESSION_EXPIRED = "session.expired"
-    SYSTEM_ERROR = "system.error"
-    BROKER_CONNECTED = "broker.connected"
-    BROKER_DISCONNECTED = "broker.disconnected"
-    ENGINE_STARTED = "engine.started"
-    ENGINE_STOPPED = "engine.stopped"
-
-
-@dataclass
+    POSITION_OPENED = 1
+    POSITION_CLOSED = 2
+    POSITION_UPDATED = 3
+    ORDER_PLACED = 4
+    ORDER_FILLED = 5
+    ORDER_CANCELLED = 6
+    ORDER_REJECTED = 7
+    PRICE_UPDATE = 8
+    TP_TRIGGERED = 9
+    SL_TRIGGERED = 10
+    TIME_TRIGGER = 11
+    RULE_MATCHED = 12
+    RULE_CREATED = 13
+    RULE_UPDATED = 14
+    RULE_DELETED = 15
+    RULE_ENABLED = 16
+    RULE_DISABLED = 17
+    SESSION_STARTED = 18
+    SESSION_EXPIRED = 19
+    SYSTEM_ERROR = 20
+    BROKER_CONNECTED = 21
+    BROKER_DISCONNECTED = 22
+    ENGINE_STARTED = 23
+    ENGINE_STOPPED = 24
+    SESSIONS_SHUTDOWN = 25
+
+    @property
+    def wire(self) -> str:
+        """
+        Get the dotted wire-format name, e.g. ``"order.placed"``.
+
+        :returns: Wire name used in serialized events.
+        :rtype: str
+        """
+        return _TYPE_TO_WIRE[self]
+
+    @classmethod
+    def from_wire(cls, name: str) -> "EventType":
+        """
+        Look up an event type by its wire-format name.
+
+        :param name: Dotted wire name.
+        :type name: str
+        :returns: Matching event type.
+        :rtype: EventType
+        :raises KeyError: If the name is unknown.
+        """
+        return _STR_TO_TYPE[name]
+
+
+_TYPE_TO_WIRE: Mapping[EventType, str] = MappingProxyType(
+    {
+        EventType.POSITION_OPENED: "position.opened",
+        EventType.POSITION_CLOSED: "position.closed",
+        EventType.POSITION_UPDATED: "position.updated",
+        EventType.ORDER_PLACED: "order.placed",
+        EventType.ORDER_FILLED: "order.filled",
+        EventType.ORDER_CANCELLED: "order.cancelled",
+        EventType.ORDER_REJECTED: "order.rejected",
+        EventType.PRICE_UPDATE: "price.update",
+        EventType.TP_TRIGGERED: "trigger.tp",
+        EventType.SL_TRIGGERED: "trigger.sl",
+        EventType.TIME_TRIGGER: "trigger.time",
+        EventType.RULE_MATCHED: "rule.matched",
+        EventType.RULE_CREATED: "rule.created",
+        EventType.RULE_UPDATED: "rule.updated",
+        EventType.RULE_DELETED: "rule.deleted",
+        EventType.RULE_ENABLED: "rule.enabled",
+        EventType.RULE_DISABLED: "rule.disabled",
+        EventType.SESSION_STARTED: "session.started",
+        EventType.SESSION_EXPIRED: "session.expired",
+        EventType.SYSTEM_ERROR: "system.error",
+        EventType.BROKER_CONNECTED: "broker.connected",
+        EventType.BROKER_DISCONNECTED: "broker.disconnected",
+        EventType.ENGINE_STARTED: "engine.started",
+        EventType.ENGINE_STOPPED: "engine.stopped",
+        EventType.SESSIONS_SHUTDOWN: "session.shutdown",
+    }
+)
+_STR_TO_TYPE: Mapping[str, EventType] = MappingProxyType(
+    {wire: event_type for event_type, wire in _TYPE_TO_WIRE.items()}
+)
+
+
+@dataclass(slots=True)
 class Event:
     """
     Base event class for all system events.
 
     :ivar id: Unique event identifier.
     :ivar type: Event type from EventType enum.
-    :ivar timestamp: When the event occurred.
+    :ivar timestamp: When the event occurred, in nanoseconds since the epoch.
     :ivar user_id: Associated user ID (if applicable).
-    :ivar data: Event payload data.
-    :ivar metadata: Additional event metadata.
+    :ivar data: Event payload data (read-only empty mapping by default).
+    :ivar metadata: Additional event metadata (read-only empty by default).
 
     Example::
 
@@ -94,10 +223,46 @@ class Event:
 
     type: EventType
     user_id: Optional[str] = None
-    data: Dict[str, Any] = field(default_factory=dict)
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    id: str = field(default_factory=lambda: str(uuid4()))
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    data: Mapping[str, Any] = field(default_factory=_empty_mapping)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_mapping)
+    id: str = field(default_factory=_next_event_id)
+    timestamp: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp_dt(self) -> datetime:
+        """
+        Get the event time as a timezone-aware UTC datetime.
+
+        :returns: Event timestamp.
+        :rtype: datetime
+        """
+        return datetime.fromtimestamp(self.timestamp / 1e9, tz=timezone.utc)
+
+    def set_data(self, key: str, value: Any) -> None:
+        """
+        Set a payload value, copying the default mapping on first write.
+
+        :param key: Payload key.
+        :type key: str
+        :param value: Payload value.
+        :type value: Any
+        """
+        if not isinstance(self.data, dict):
+            self.data = dict(self.data)
+        self.data[key] = value
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """
+        Set a metadata value, copying the default mapping on first write.
+
+        :param key: Metadata key.
+        :type key: str
+        :param value: Metadata value.
+        :type value: Any
+        """
+        if not isinstance(self.metadata, dict):
+            self.metadata = dict(self.metadata)
+        self.metadata[key] = value
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -108,16 +273,21 @@ class Event:
         """
         return {
             "id": self.id,
-            "type": self.type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "type": self.type.wire,
+            "timestamp": self.timestamp_dt.isoformat(),
             "user_id": self.user_id,
-            "data": self.data,
-            "metadata": self.metadata,
+            "data": dict(self.data),
+            "metadata": dict(self.metadata),
         }
 
 
 EventHandler = Callable[[Event], Any]
 AsyncEventHandler = Callable[[Event], Any]
+HandlerEntry = Tuple[AsyncEventHandler, bool]
+"""A handler paired with whether it is a coroutine function."""
+
+_NO_HANDLERS: Tuple[HandlerEntry, ...] = ()
+"""Shared empty default for handler table lookups."""
 
 
 class EventBus:
@@ -144,10 +314,22 @@ class EventBus:
     """
 
     def __init__(self) -> None:
-        """Initialize the event bus."""
-        self._handlers: Dict[EventType, List[AsyncEventHandler]] = {}
-        self._global_handlers: List[AsyncEventHandler] = []
-        self._user_handlers: Dict[str, Dict[EventType, List[AsyncEventHandler]]] = {}
+        """
+        Initialize the event bus.
+
+        Handler tables are keyed by ``id(event_type)``; ``EventType``
+        members are singletons, so the ID is stable and hashes as a
+        plain integer on the publish path. Handlers are stored with an
+        ``is_async`` flag computed once at subscribe time.
+        Handler sequences are tuples rebuilt on (rare) subscribe and
+        unsubscribe, so the (hot) publish path iterates immutable
+        snapshots. ``_any_user_handlers`` mirrors ``bool(_user_handlers)`` so publish
+        can skip the per-user lookup when nobody has subscribed.
+        """
+        self._handlers: Dict[int, Tuple[HandlerEntry, ...]] = {}
+        self._global_handlers: Tuple[HandlerEntry, ...] = ()
+        self._user_handlers: Dict[str, Dict[int, Tuple[HandlerEntry, ...]]] = {}
+        self._any_user_handlers = False
 
     def subscribe(
         self,
@@ -178,16 +360,7 @@ class EventBus:
         def decorator(handler: AsyncEventHandler) -> AsyncEventHandler:
             types = [event_type] if isinstance(event_type, EventType) else event_type
             for et in types:
-                if user_id:
-                    if user_id not in self._user_handlers:
-                        self._user_handlers[user_id] = {}
-                    if et not in self._user_handlers[user_id]:
-                        self._user_handlers[user_id][et] = []
-                    self._user_handlers[user_id][et].append(handler)
-                else:
-                    if et not in self._handlers:
-                        self._handlers[et] = []
-                    self._handlers[et].append(handler)
+                self.add_handler(et, handler, user_id)
             return handler
 
         return decorator
@@ -203,11 +376,11 @@ class EventBus:
 
             @bus.subscribe_all()
             async def log_all_events(event):
-                logger.info(f"Event: {event.type}")
+                logger.info(f"Event: {event.type.wire}")
         """
 
         def decorator(handler: AsyncEventHandler) -> AsyncEventHandler:
-            self._global_handlers.append(handler)
+            self._global_handlers += ((handler, _is_async_handler(handler)),)
             return handler
 
         return decorator
@@ -228,16 +401,14 @@ class EventBus:
         :param user_id: Optional user ID for user-specific events.
         :type user_id: Optional[str]
         """
-        if user_id:
-            if user_id not in self._user_handlers:
-                self._user_handlers[user_id] = {}
-            if event_type not in self._user_handlers[user_id]:
-                self._user_handlers[user_id][event_type] = []
-            self._user_handlers[user_id][event_type].append(handler)
-        else:
-            if event_type not in self._handlers:
-                self._handlers[event_type] = []
-            self._handlers[event_type].append(handler)
+        table = (
+            self._user_handlers.setdefault(user_id, {}) if user_id else self._handlers
+        )
+        type_id = id(event_type)
+        table[type_id] = table.get(type_id, _NO_HANDLERS) + (
+            (handler, _is_async_handler(handler)),
+        )
+        self._any_user_handlers = bool(self._user_handlers)
 
     def remove_handler(
         self,
@@ -257,27 +428,41 @@ class EventBus:
         :returns: True if handler was removed.
         :rtype: bool
         """
-        try:
-            if user_id and user_id in self._user_handlers:
-                if event_type in self._user_handlers[user_id]:
-                    self._user_handlers[user_id][event_type].remove(handler)
-                    return True
-            elif event_type in self._handlers:
-                self._handlers[event_type].remove(handler)
-                return True
-        except ValueError:
-            pass
-        return False
+        type_id = id(event_type)
+        if user_id and user_id in self._user_handlers:
+            table = self._user_handlers[user_id]
+        else:
+            table = self._handlers
+
+        handlers = table.get(type_id)
+        if not handlers:
+            return False
+
+        remaining = tuple(entry for entry in handlers if entry[0] != handler)
+        if len(remaining) == len(handlers):
+            return False
+
+        if remaining:
+            table[type_id] = remaining
+        else:
+            del table[type_id]
+            if not table and table is not self._handlers:
+                del self._user_handlers[user_id]
+                self._any_user_handlers = bool(self._user_handlers)
+        return True
 
     def remove_user_handlers(self, user_id: str) -> None:
         """
         Remove all handlers for a specific user.
 
+        User handlers are indexed by user ID, so this is a single
+        dictionary pop regardless of how many other handlers exist.
+
         :param user_id: User ID to remove handlers for.
         :type user_id: str
         """
-        if user_id in self._user_handlers:
-            del self._user_handlers[user_id]
+        if self._user_handlers.pop(user_id, None) is not None:
+            self._any_user_handlers = bool(self._user_handlers)
 
     async def publish(self, event: Event) -> None:
         """
@@ -286,44 +471,116 @@ class EventBus:
         :param event: Event to publish.
         :type event: Event
         """
-        handlers_to_call: List[AsyncEventHandler] = []
+        type_id = id(event.type)
+        global_handlers = self._global_handlers
+        type_handlers = self._handlers.get(type_id, _NO_HANDLERS)
+        user_handlers = self._get_user_handlers(event, type_id)
+
+        if not (global_handlers or type_handlers or user_handlers):
+            return
+
+        # The three sources are walked in place rather than merged into a
+        # new list. Sync handlers run straight through ``_invoke``; only
+        # async ones produce an awaitable, so no coroutine is built for a
+        # plain function call.
+        invoke = self._invoke
+        for handlers in (global_handlers, type_handlers, user_handlers):
+            for entry in handlers:
+                pending = invoke(entry, event)
+                if pending is not None:
+                    await pending
+
+    def _get_user_handlers(self, event: Event, type_id: int) -> Sequence[HandlerEntry]:
+        """
+        Get the user-specific handlers matching an event.
 
-        handlers_to_call.extend(self._global_handlers)
+        :param event: Event being delivered.
+        :type event: Event
+        :param type_id: ``id()`` of the event type.
+        :type type_id: int
+        :returns: Matching handlers, possibly empty.
+        :rtype: Sequence[HandlerEntry]
+        """
+        if not self._any_user_handlers or not event.user_id:
+            return _NO_HANDLERS
+        by_type = self._user_handlers.get(event.user_id)
+        return by_type.get(type_id, _NO_HANDLERS) if by_type else _NO_HANDLERS
 
-        if event.type in self._handlers:
-            handlers_to_call.extend(self._handlers[event.type])
+    def _invoke(self, entry: HandlerEntry, event: Event) -> Optional[Awaitable[None]]:
+        """
+        Run a handler, deferring the await of async handlers.
 
-        if event.user_id and event.user_id in self._user_handlers:
-            if event.type in self._user_handlers[event.user_id]:
-                handlers_to_call.extend(self._user_handlers[event.user_id][event.type])
+        :param entry: Handler and its ``is_async`` flag.
+        :type entry: HandlerEntry
+        :param event: Event being delivered.
+        :type event: Event
+        :returns: Awaitable for async handlers, None for sync ones.
+        :rtype: Optional[Awaitable[None]]
+        """
+        handler, is_async = entry
+        try:
+            result = handler(event)
+        except Exception as e:
+            logger.error(f"Event handler error for {event.type.wire}: {e}")
+            return None
 
-        for handler in handlers_to_call:
-            try:
-                result = handler(event)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                logger.error(f"Event handler error for {event.type}: {e}")
+        return self._await_handler(result, event) if is_async else None
+
+    async def _await_handler(self, result: Awaitable[Any], event: Event) -> None:
+        """
+        Await an async handler result, logging any error it raises.
+
+        :param result: Coroutine returned by the handler.
+        :type result: Awaitable[Any]
+        :param event: Event being delivered.
+        :type event: Event
+        """
+        try:
+            await result
+        except Exception as e:
+            logger.error(f"Event handler error for {event.type.wire}: {e}")
 
     async def publish_many(self, events: List[Event]) -> None:
         """
         Publish multiple events.
 
+        Events are dispatched in input order. Each type's handler list is looked
+        up once per batch rather than once per event. Sync handlers run
+        inline, and async handlers are scheduled together with
+        ``asyncio.gather``.
+
         :param events: List of events to publish.
         :type events: List[Event]
         """
+        handlers_by_type: Dict[int, Sequence[HandlerEntry]] = {}
+        global_handlers = self._global_handlers
+        pending: List[Awaitable[None]] = []
         for event in events:
-            await self.publish(event)
-
-
-event_bus = EventBus()
-
-
+            type_id = id(event.type)
+            type_handlers = handlers_by_type.get(type_id)
+            if type_handlers is None:
+                type_handlers = handlers_by_type[type_id] = self._handlers.get(
+                    type_id, _NO_HANDLERS
+                )
+            user_handlers = self._get_user_handlers(event, type_id)
+            for entry in (*global_handlers, *type_handlers, *user_handlers):
+                result = self._invoke(entry, event)
+                if result is not None:
+                    pending.append(result)
+
+        if pending:
+            await asyncio.gather(*pending)
+
+
+@functools.cache
 def get_event_bus() -> EventBus:
     """
     Get the global event bus instance.
 
+    The bus is created on first use, so importing this module does
+    not allocate one.
+
     :returns: Global EventBus instance.
     :rtype: EventBus
     """
-    return event_bus
+    return EventBus()
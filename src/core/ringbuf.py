@@ -0,0 +1,193 @@
+"""
+Pre-allocated ring buffer for market data delivery.
+
+Ticker clients call back on their own thread, many times per second
+per instrument. Instead of allocating an event per tick, the ticker
+thread overwrites reused slots in a fixed ring and bumps a published
+sequence; asyncio consumers each keep their own cursor and read
+published slots contiguously.
+
+:copyright: (c) 2025
+:license: MIT
+
+Example::
+
+    ring = Ring(size=1024)
+    consumer = ring.consumer()
+
+    ring.write(408065, 1500.5)
+
+    await consumer.wait()
+    for slot in consumer.poll():
+        print(slot.token, slot.ltp)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Callable, Iterator, List, Tuple
+
+
+class TickSlot:
+    """
+    Reusable tick record.
+
+    :ivar token: Instrument token.
+    :ivar ltp: Last traded price.
+    :ivar ts_ns: Receive time on the ``time.monotonic_ns`` clock.
+    """
+
+    __slots__ = ("token", "ltp", "ts_ns")
+
+    def __init__(self) -> None:
+        """Initialize an empty slot."""
+        self.token = 0
+        self.ltp = 0.0
+        self.ts_ns = 0
+
+
+class Ring:
+    """
+    Fixed-capacity ring with per-consumer cursors.
+
+    Writes claim the next slot, fill it in place and publish its
+    sequence under a lock, so several ticker threads may share a ring.
+    Consumers never block the writer: a consumer that falls more than
+    ``size`` slots behind skips ahead and counts the lost ticks.
+
+    :param size: Number of slots; must be a power of two.
+    :type size: int
+    :param slot_factory: Callable creating one empty slot.
+    :type slot_factory: Callable[[], TickSlot]
+    :raises ValueError: If size is not a positive power of two.
+    """
+
+    def __init__(
+        self,
+        size: int = 65536,
+        slot_factory: Callable[[], TickSlot] = TickSlot,
+    ) -> None:
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"Ring size must be a power of two, got {size}")
+        self._size = size
+        self._mask = size - 1
+        self._slots = [slot_factory() for _ in range(size)]
+        self._published = -1
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def size(self) -> int:
+        """Get the ring capacity."""
+        return self._size
+
+    @property
+    def published(self) -> int:
+        """Get the sequence of the last published slot (-1 if none)."""
+        return self._published
+
+    def write(self, token: int, ltp: float, ts_ns: int = 0) -> int:
+        """
+        Write one tick into the next slot and publish it.
+
+        Safe to call from any thread.
+
+        :param token: Instrument token.
+        :type token: int
+        :param ltp: Last traded price.
+        :type ltp: float
+        :param ts_ns: Receive time; defaults to ``time.monotonic_ns()``.
+        :type ts_ns: int
+        :returns: Published sequence number.
+        :rtype: int
+        """
+        with self._lock:
+            seq = self._published + 1
+            slot = self._slots[seq & self._mask]
+            slot.token = token
+            slot.ltp = ltp
+            slot.ts_ns = ts_ns or time.monotonic_ns()
+            self._published = seq
+            waiters = self._waiters
+            if waiters:
+                self._waiters = []
+        if waiters:
+            for loop, waiter in waiters:
+                loop.call_soon_threadsafe(_wake, waiter)
+        return seq
+
+    def consumer(self) -> "RingConsumer":
+        """
+        Create a consumer that starts after the last published slot.
+
+        :returns: New consumer with its own cursor.
+        :rtype: RingConsumer
+        """
+        return RingConsumer(self)
+
+    def _slot(self, seq: int) -> TickSlot:
+        """Get the slot holding a sequence."""
+        return self._slots[seq & self._mask]
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    """Resolve a consumer's wait future if still pending."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RingConsumer:
+    """
+    Independent reader of a ``Ring``.
+
+    Slots yielded by ``poll`` are live and may be overwritten once the
+    writer laps the consumer, so copy what you need before awaiting.
+
+    :ivar overruns: Ticks skipped because the consumer fell behind.
+    """
+
+    __slots__ = ("_ring", "_cursor", "overruns")
+
+    def __init__(self, ring: Ring) -> None:
+        """
+        Initialize consumer.
+
+        :param ring: Ring to read from.
+        :type ring: Ring
+        """
+        self._ring = ring
+        self._cursor = ring.published + 1
+        self.overruns = 0
+
+    @property
+    def pending(self) -> int:
+        """Get the number of published slots not yet read."""
+        return self._ring.published + 1 - self._cursor
+
+    def poll(self) -> Iterator[TickSlot]:
+        """
+        Yield every slot published since the last poll, oldest first.
+
+        :returns: Iterator over published slots.
+        :rtype: Iterator[TickSlot]
+        """
+        ring = self._ring
+        end = ring.published + 1
+        start = self._cursor
+        if end - start > ring.size:
+            self.overruns += end - start - ring.size
+            start = end - ring.size
+        for seq in range(start, end):
+            self._cursor = seq + 1
+            yield ring._slot(seq)
+
+    async def wait(self) -> None:
+        """Wait until at least one unread slot has been published."""
+        ring = self._ring
+        while self.pending <= 0:
+            waiter = asyncio.get_running_loop().create_future()
+            with ring._lock:
+                if self.pending > 0:
+                    break
+                ring._waiters.append((waiter.get_loop(), waiter))
+            await waiter
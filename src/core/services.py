@@ -10,25 +10,68 @@ separate from API handlers and data access.
 
 import asyncio
 import logging
-from abc import ABC
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from src.brokers.base import BaseBroker
 from src.core.events import Event, EventBus, EventType, get_event_bus
-from src.core.sessions import SessionManager, UserContext, get_session_manager
-from src.models import Order, OrderResult, Position, Trade
+from src.core.sessions import (
+    SessionManager,
+    UserContext,
+    current_context,
+    get_session_manager,
+)
+from src.models import (
+    Order,
+    OrderResult,
+    OrderStatus,
+    OrderType,
+    Position,
+    ProductType,
+    Trade,
+    TransactionType,
+)
 
 logger = logging.getLogger(__name__)
 
+_ORDER_TEMPLATE = Order(
+    order_id="",
+    status=OrderStatus.PENDING,
+    tradingsymbol="",
+    exchange="",
+    transaction_type=TransactionType.BUY,
+    quantity=0,
+    order_type=OrderType.MARKET,
+    product=ProductType.NRML,
+)
+"""Validated order that ``place_order`` copies and patches per call.
+
+``model_copy`` does not validate its updates, so every patched field must be
+coerced to its declared type before copying.
+"""
+
+_TRIGGER_EVENT: Dict[str, EventType] = {
+    "TP": EventType.TP_TRIGGERED,
+    "SL": EventType.SL_TRIGGERED,
+}
+_EXIT_SIDE: Dict[bool, str] = {True: "SELL", False: "BUY"}
 
-class BaseService(ABC):
+
+class BaseService:
     """
     Base class for all services.
 
     Provides common functionality like event publishing
     and session access.
+
+    Events are queued and dispatched by a background task, so callers
+    on the order path do not wait for subscribers to run. Events published
+    with a conflation key replace any still-queued event with the same
+    type, user and key, so slow subscribers only see the latest one.
     """
 
+    EVENT_QUEUE_SIZE = 10_000
+
     def __init__(
         self,
         event_bus: Optional[EventBus] = None,
@@ -44,12 +87,17 @@ class BaseService(ABC):
         """
         self._event_bus = event_bus or get_event_bus()
         self._session_manager = session_manager or get_session_manager()
+        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=self.EVENT_QUEUE_SIZE)
+        self._drain_task: Optional[asyncio.Task] = None
+        self._pending: Dict[Tuple[EventType, Optional[str], str], Event] = {}
 
     async def _publish_event(
         self,
         event_type: EventType,
         user_id: Optional[str] = None,
         data: Optional[Dict[str, Any]] = None,
+        wait: bool = False,
+        conflate_key: Optional[str] = None,
     ) -> None:
         """
         Publish an event.
@@ -60,20 +108,70 @@ class BaseService(ABC):
         :type user_id: Optional[str]
         :param data: Event data.
         :type data: Optional[Dict[str, Any]]
+        :param wait: Dispatch to subscribers before returning instead of
+            queueing. Used on rare error paths.
+        :type wait: bool
+        :param conflate_key: Key (e.g. a symbol) under which a newer event
+            replaces a queued one of the same type and user.
+        :type conflate_key: Optional[str]
         """
-        await self._event_bus.publish(
-            Event(type=event_type, user_id=user_id, data=data or {})
-        )
+        event = Event(type=event_type, user_id=user_id, data=data or {})
+        if wait:
+            await self._event_bus.publish(event)
+            return
+
+        item: Union[Event, Tuple[EventType, Optional[str], str]] = event
+        if conflate_key is not None:
+            key = (event_type, user_id, conflate_key)
+            replaced = key in self._pending
+            self._pending[key] = event
+            if replaced:
+                return
+            item = key
+
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_events())
+        try:
+            self._event_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            await self._event_queue.put(item)
+
+    async def _drain_events(self) -> None:
+        """
+        Dispatch queued events to the event bus in order.
+
+        Conflated events are queued as their key, and the latest event
+        stored under that key is looked up when it reaches the front.
+        """
+        queue = self._event_queue
+        pending = self._pending
+        while True:
+            item = await queue.get()
+            event = item if isinstance(item, Event) else pending.pop(item)
+            try:
+                await self._event_bus.publish(event)
+            finally:
+                queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been dispatched."""
+        await self._event_queue.join()
 
     def _get_context(self, user_id: str) -> Optional[UserContext]:
         """
         Get user context.
 
+        Uses the context activated with ``SessionManager.activate`` when
+        it belongs to ``user_id``, skipping the session manager lookup.
+
         :param user_id: User identifier.
         :type user_id: str
         :returns: User context or None.
         :rtype: Optional[UserContext]
         """
+        context = current_context()
+        if context is not None and context.is_active and context.user_id == user_id:
+            return context
         return self._session_manager.get_context(user_id)
 
     def _get_broker(self, user_id: str) -> Optional[BaseBroker]:
@@ -109,8 +207,80 @@ class TradingService(BaseService):
             side="BUY",
             order_type="MARKET"
         )
+
+    Positions and orders are cached per user for ``READ_CACHE_TTL``
+    seconds and invalidated when that user places or cancels an order.
+    Cached lists are shared between callers and must not be mutated.
     """
 
+    READ_CACHE_TTL = 0.5
+    READ_CACHE_MAX = 1024
+
+    def __init__(
+        self,
+        event_bus: Optional[EventBus] = None,
+        session_manager: Optional[SessionManager] = None,
+    ) -> None:
+        """
+        Initialize trading service.
+
+        :param event_bus: Event bus for publishing events.
+        :type event_bus: Optional[EventBus]
+        :param session_manager: Session manager for user contexts.
+        :type session_manager: Optional[SessionManager]
+        """
+        super().__init__(event_bus, session_manager)
+        self._read_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._read_generation: Dict[str, int] = {}
+
+    async def _cached_read(
+        self, kind: str, user_id: str, fetch: Callable[[], Any]
+    ) -> Any:
+        """
+        Return a recent broker read or fetch it in a worker thread.
+
+        :param kind: Cache namespace, e.g. ``"positions"``.
+        :type kind: str
+        :param user_id: User identifier.
+        :type user_id: str
+        :param fetch: Blocking broker call producing the result.
+        :type fetch: Callable[[], Any]
+        :returns: Cached or freshly fetched result.
+        :rtype: Any
+        """
+        key = (kind, user_id)
+        now = time.monotonic()
+        cached = self._read_cache.get(key)
+        if cached is not None and now - cached[0] < self.READ_CACHE_TTL:
+            return cached[1]
+
+        generation = self._read_generation.get(user_id, 0)
+        result = await asyncio.to_thread(fetch)
+        if self._read_generation.get(user_id, 0) != generation:
+            return result
+        if len(self._read_cache) >= self.READ_CACHE_MAX:
+            self._read_cache = {
+                k: v
+                for k, v in self._read_cache.items()
+                if now - v[0] < self.READ_CACHE_TTL
+            }
+        self._read_cache[key] = (now, result)
+        return result
+
+    def _invalidate_reads(self, user_id: str) -> None:
+        """
+        Drop cached positions and orders for a user.
+
+        Bumps the user's read generation so fetches already in flight do
+        not store results that predate the change.
+
+        :param user_id: User identifier.
+        :type user_id: str
+        """
+        self._read_generation[user_id] = self._read_generation.get(user_id, 0) + 1
+        self._read_cache.pop(("positions", user_id), None)
+        self._read_cache.pop(("orders", user_id), None)
+
     async def get_positions(self, user_id: str) -> List[Position]:
         """
         Get all positions for a user.
@@ -126,13 +296,14 @@ class TradingService(BaseService):
             raise ValueError(f"No active session for user {user_id}")
 
         try:
-            return broker.get_positions()
+            return await self._cached_read("positions", user_id, broker.get_positions)
         except Exception as e:
-            logger.error(f"Error getting positions for {user_id}: {e}")
+            logger.error("Error getting positions for %s: %s", user_id, e)
             await self._publish_event(
                 EventType.SYSTEM_ERROR,
                 user_id=user_id,
                 data={"error": str(e), "operation": "get_positions"},
+                wait=True,
             )
             raise
 
@@ -151,9 +322,9 @@ class TradingService(BaseService):
             raise ValueError(f"No active session for user {user_id}")
 
         try:
-            return broker.get_orders()
+            return await self._cached_read("orders", user_id, broker.get_orders)
         except Exception as e:
-            logger.error(f"Error getting orders for {user_id}: {e}")
+            logger.error("Error getting orders for %s: %s", user_id, e)
             raise
 
     async def place_order(
@@ -196,26 +367,41 @@ class TradingService(BaseService):
         :rtype: OrderResult
         :raises ValueError: If user not found.
         """
-        broker = self._get_broker(user_id)
-        if not broker:
+        context = self._get_context(user_id)
+        if not context:
             raise ValueError(f"No active session for user {user_id}")
 
-        order = Order(
-            order_id="",
-            tradingsymbol=symbol,
-            exchange=exchange,
-            transaction_type=side,
-            quantity=quantity,
-            order_type=order_type,
-            product=product,
-            price=price or 0,
-            trigger_price=trigger_price or 0,
-            status="PENDING",
-            tag=tag,
-        )
-
         try:
-            result = broker.place_order(order)
+            if context.place_order_fast is not None:
+                result = await asyncio.to_thread(
+                    context.place_order_fast,
+                    tradingsymbol=symbol,
+                    exchange=exchange,
+                    transaction_type=side,
+                    quantity=quantity,
+                    order_type=order_type,
+                    product=product,
+                    price=price or 0,
+                    trigger_price=trigger_price or 0,
+                    tag=tag,
+                )
+            else:
+                order = _ORDER_TEMPLATE.model_copy(
+                    update={
+                        "tradingsymbol": str(symbol),
+                        "exchange": str(getattr(exchange, "value", exchange)),
+                        "transaction_type": TransactionType(side),
+                        "quantity": int(quantity),
+                        "order_type": OrderType(order_type),
+                        "product": ProductType(product),
+                        "price": float(price or 0),
+                        "trigger_price": float(trigger_price or 0),
+                        "tag": None if tag is None else str(tag),
+                        "meta": {},
+                    }
+                )
+                result = await asyncio.to_thread(context.broker.place_order, order)
+            self._invalidate_reads(user_id)
 
             await self._publish_event(
                 EventType.ORDER_PLACED,
@@ -233,7 +419,7 @@ class TradingService(BaseService):
             return result
 
         except Exception as e:
-            logger.error(f"Error placing order for {user_id}: {e}")
+            logger.error("Error placing order for %s: %s", user_id, e)
             await self._publish_event(
                 EventType.ORDER_REJECTED,
                 user_id=user_id,
@@ -241,9 +427,44 @@ class TradingService(BaseService):
                     "symbol": symbol,
                     "error": str(e),
                 },
+                wait=True,
             )
             raise
 
+    async def place_orders(
+        self,
+        user_id: str,
+        orders: List[Dict[str, Any]],
+    ) -> List[Union[OrderResult, BaseException]]:
+        """
+        Place several orders for a user concurrently.
+
+        Each broker call runs in a worker thread, so the batch completes
+        in roughly the latency of the slowest order rather than the sum.
+
+        :param user_id: User identifier.
+        :type user_id: str
+        :param orders: Keyword arguments for ``place_order``, one per order.
+        :type orders: List[Dict[str, Any]]
+        :returns: Order results in input order; failed orders yield their
+            exception instead of aborting the batch.
+        :rtype: List[Union[OrderResult, BaseException]]
+
+        Example::
+
+            results = await service.place_orders(
+                "user123",
+                [
+                    {"symbol": "INFY", "exchange": "NSE", "quantity": 1, "side": "BUY"},
+                    {"symbol": "TCS", "exchange": "NSE", "quantity": 1, "side": "BUY"},
+                ],
+            )
+        """
+        return await asyncio.gather(
+            *[self.place_order(user_id, **order) for order in orders],
+            return_exceptions=True,
+        )
+
     async def cancel_order(self, user_id: str, order_id: str) -> bool:
         """
         Cancel an order.
@@ -261,7 +482,8 @@ class TradingService(BaseService):
             raise ValueError(f"No active session for user {user_id}")
 
         try:
-            result = broker.cancel_order(order_id)
+            result = await asyncio.to_thread(broker.cancel_order, order_id)
+            self._invalidate_reads(user_id)
 
             if result:
                 await self._publish_event(
@@ -273,9 +495,30 @@ class TradingService(BaseService):
             return result
 
         except Exception as e:
-            logger.error(f"Error cancelling order {order_id} for {user_id}: {e}")
+            logger.error("Error cancelling order %s for %s: %s", order_id, user_id, e)
             raise
 
+    async def batch_cancel(
+        self,
+        user_id: str,
+        order_ids: List[str],
+    ) -> List[Union[bool, BaseException]]:
+        """
+        Cancel several orders for a user concurrently.
+
+        :param user_id: User identifier.
+        :type user_id: str
+        :param order_ids: Order IDs to cancel.
+        :type order_ids: List[str]
+        :returns: Cancellation results in input order; failures yield
+            their exception.
+        :rtype: List[Union[bool, BaseException]]
+        """
+        return await asyncio.gather(
+            *[self.cancel_order(user_id, order_id) for order_id in order_ids],
+            return_exceptions=True,
+        )
+
     async def get_trades(self, user_id: str) -> List[Trade]:
         """
         Get all trades for a user.
@@ -291,9 +534,9 @@ class TradingService(BaseService):
             raise ValueError(f"No active session for user {user_id}")
 
         try:
-            return broker.get_trades()
+            return await asyncio.to_thread(broker.get_trades)
         except Exception as e:
-            logger.error(f"Error getting trades for {user_id}: {e}")
+            logger.error("Error getting trades for %s: %s", user_id, e)
             raise
 
 
@@ -335,7 +578,11 @@ class RuleExecutionService(BaseService):
         self._trading_service = trading_service or TradingService(
             event_bus, session_manager
         )
-        self._monitoring_tasks: Dict[str, asyncio.Task] = {}
+        self._monitored_users: Set[str] = set()
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._poll_interval = 1.0
+        self._watched_symbols: Dict[str, Set[str]] = {}
+        self._quote_cache: Dict[str, Tuple[float, float]] = {}
 
     async def start_monitoring(
         self,
@@ -345,6 +592,10 @@ class RuleExecutionService(BaseService):
         """
         Start position monitoring for a user.
 
+        All monitored users share one background task that checks every
+        user once per tick, so timer wakeups do not grow with the number
+        of users. The most recent ``poll_interval`` applies to all users.
+
         :param user_id: User identifier.
         :type user_id: str
         :param poll_interval: Price check interval in seconds.
@@ -352,28 +603,18 @@ class RuleExecutionService(BaseService):
         :returns: True if monitoring started.
         :rtype: bool
         """
-        if user_id in self._monitoring_tasks:
+        if user_id in self._monitored_users:
             return False
 
-        context = self._get_context(user_id)
-        if not context:
+        if not self._get_context(user_id):
             raise ValueError(f"No active session for user {user_id}")
 
-        async def monitor_loop():
-            while True:
-                try:
-                    await self.check_triggers(user_id)
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    logger.error(f"Monitoring error for {user_id}: {e}")
-                await asyncio.sleep(poll_interval)
-
-        task = asyncio.create_task(monitor_loop())
-        self._monitoring_tasks[user_id] = task
-        context.add_task(task)
-
-        logger.info(f"Started monitoring for user {user_id}")
+        self._monitored_users.add(user_id)
+        self._poll_interval = poll_interval
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.create_task(self._monitor_loop())
+
+        logger.info("Started monitoring for user %s", user_id)
         return True
 
     async def stop_monitoring(self, user_id: str) -> bool:
@@ -385,21 +626,114 @@ class RuleExecutionService(BaseService):
         :returns: True if monitoring stopped.
         :rtype: bool
         """
-        task = self._monitoring_tasks.pop(user_id, None)
-        if task:
+        if user_id not in self._monitored_users:
+            return False
+
+        self._monitored_users.discard(user_id)
+        self._watched_symbols.pop(user_id, None)
+        if not self._monitored_users and self._monitor_task:
+            task, self._monitor_task = self._monitor_task, None
             task.cancel()
             try:
                 await task
             except asyncio.CancelledError:
                 pass
-            logger.info(f"Stopped monitoring for user {user_id}")
-            return True
-        return False
+        logger.info("Stopped monitoring for user %s", user_id)
+        return True
+
+    async def _monitor_loop(self) -> None:
+        """
+        Check triggers for every monitored user once per poll interval.
+
+        Users are checked concurrently. Users whose session has ended are
+        dropped, and the loop exits once nobody is monitored.
+        """
+        while self._monitored_users:
+            users = []
+            for user_id in list(self._monitored_users):
+                if self._session_manager.has_session(user_id):
+                    users.append(user_id)
+                else:
+                    self._monitored_users.discard(user_id)
+                    self._watched_symbols.pop(user_id, None)
+
+            await self._refresh_quotes(users)
+            results = await asyncio.gather(
+                *[self.check_triggers(user_id) for user_id in users],
+                return_exceptions=True,
+            )
+            for user_id, result in zip(users, results):
+                if isinstance(result, Exception):
+                    logger.error("Monitoring error for %s: %s", user_id, result)
+
+            await asyncio.sleep(self._poll_interval)
+
+    def watch_symbols(self, user_id: str, symbols: List[str]) -> None:
+        """
+        Set the symbols whose prices are fetched for a monitored user.
+
+        :param user_id: User identifier.
+        :type user_id: str
+        :param symbols: Symbols in "EXCHANGE:SYMBOL" format.
+        :type symbols: List[str]
+        """
+        self._watched_symbols[user_id] = set(symbols)
+
+    def get_cached_ltp(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """
+        Get the last price fetched by the monitor loop.
+
+        :param symbol: Symbol in "EXCHANGE:SYMBOL" format.
+        :type symbol: str
+        :returns: ``(price, monotonic_time)`` or None if never fetched.
+        :rtype: Optional[Tuple[float, float]]
+        """
+        return self._quote_cache.get(symbol)
+
+    async def _refresh_quotes(self, users: List[str]) -> None:
+        """
+        Fetch prices for every watched symbol with one call per broker.
+
+        Users sharing a broker client have their symbols merged, so each
+        symbol is requested once per tick however many users watch it.
+
+        :param users: Users being checked this tick.
+        :type users: List[str]
+        """
+        symbols_by_broker: Dict[BaseBroker, Set[str]] = {}
+        for user_id in users:
+            symbols = self._watched_symbols.get(user_id)
+            if not symbols:
+                continue
+            context = self._session_manager.get_context(user_id)
+            if context:
+                symbols_by_broker.setdefault(context.broker, set()).update(symbols)
+        if not symbols_by_broker:
+            return
+
+        brokers = list(symbols_by_broker)
+        results = await asyncio.gather(
+            *[
+                asyncio.to_thread(broker.get_ltp, list(symbols_by_broker[broker]))
+                for broker in brokers
+            ],
+            return_exceptions=True,
+        )
+        now = time.monotonic()
+        for broker, prices in zip(brokers, results):
+            if isinstance(prices, Exception):
+                logger.error("Quote fetch failed for %s: %s", broker.BROKER_ID, prices)
+                continue
+            for symbol, price in prices.items():
+                self._quote_cache[symbol] = (price, now)
 
     async def check_triggers(self, user_id: str) -> List[Dict[str, Any]]:
         """
         Check for triggered exit conditions.
 
+        Prices should be read from ``get_cached_ltp``, which the monitor
+        loop refreshes in bulk before each round of checks.
+
         :param user_id: User identifier.
         :type user_id: str
         :returns: List of triggered conditions.
@@ -429,7 +763,7 @@ class RuleExecutionService(BaseService):
         :returns: Order result or None.
         :rtype: Optional[OrderResult]
         """
-        side = "SELL" if position.quantity > 0 else "BUY"
+        side = _EXIT_SIDE[position.quantity > 0]
         quantity = abs(position.quantity)
 
         try:
@@ -444,23 +778,19 @@ class RuleExecutionService(BaseService):
                 tag=f"AUTO_{trigger_type}",
             )
 
-            event_type = (
-                EventType.TP_TRIGGERED
-                if trigger_type == "TP"
-                else EventType.SL_TRIGGERED
-            )
             await self._publish_event(
-                event_type,
+                _TRIGGER_EVENT.get(trigger_type, EventType.SL_TRIGGERED),
                 user_id=user_id,
                 data={
                     "symbol": position.tradingsymbol,
                     "trigger_price": trigger_price,
                     "order_id": result.order_id,
                 },
+                conflate_key=position.tradingsymbol,
             )
 
             return result
 
         except Exception as e:
-            logger.error(f"Failed to execute exit for {user_id}: {e}")
+            logger.error("Failed to execute exit for %s: %s", user_id, e)
             return None
@@ -9,27 +9,40 @@ and per-user broker connections.
 """
 
 import asyncio
+import heapq
 import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
-
 from src.brokers.base import BaseBroker, BaseTicker
 from src.core.events import Event, EventBus, EventType, get_event_bus
-from src.models import UserProfile
+from src.core.ringbuf import Ring
+from src.models import OrderResult, UserProfile
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_SECOND = 1_000_000_000
+
+
+def _new_session_id() -> str:
+    """Generate a random session identifier."""
+    return str(uuid4())
 
-class UserSession(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class UserSession:
     """
     User session model.
 
     Represents an active user session with broker credentials
-    and connection state.
+    and connection state. A slotted dataclass rather than a pydantic
+    model: every field comes from an authenticated broker, and sessions
+    are mutated on each refresh and touch, so validation buys nothing.
 
     :ivar session_id: Unique session identifier.
     :ivar user_id: User identifier from broker.
@@ -37,20 +50,76 @@ class UserSession(BaseModel):
     :ivar access_token: Current access token.
     :ivar refresh_token: Refresh token (if available).
     :ivar created_at: Session creation timestamp.
-    :ivar expires_at: Session expiration timestamp.
-    :ivar last_activity: Last activity timestamp.
+    :ivar expires_at: Session expiration timestamp (wall clock, for display).
+    :ivar expires_at_ns: Expiry on the ``time.monotonic_ns`` clock.
+    :ivar last_activity_ns: Last activity on the ``time.monotonic_ns`` clock.
     :ivar metadata: Additional session metadata.
+
+    Expiry and activity checks use the monotonic clock, so they are
+    integer compares and immune to wall-clock jumps. Change the expiry
+    with ``set_expiry`` or ``extend`` to keep both clocks in step.
     """
 
-    session_id: str = Field(default_factory=lambda: str(uuid4()))
     user_id: str
     broker_id: str
     access_token: str
+    session_id: str = field(default_factory=_new_session_id)
     refresh_token: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=datetime.utcnow)
     expires_at: Optional[datetime] = None
-    last_activity: datetime = Field(default_factory=datetime.utcnow)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    expires_at_ns: Optional[int] = None
+    last_activity_ns: int = field(default_factory=time.monotonic_ns)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Derive the monotonic expiry from a wall-clock ``expires_at``."""
+        if self.expires_at is not None and self.expires_at_ns is None:
+            self.set_expiry(self.expires_at)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UserSession":
+        """
+        Build a session from externally stored data, validating it.
+
+        The constructor trusts its arguments; use this for sessions
+        restored from a cache or database instead.
+
+        :param data: Stored session fields. Datetimes may be ISO strings.
+        :type data: Dict[str, Any]
+        :returns: Restored session.
+        :rtype: UserSession
+        :raises ValueError: If a required field is missing or malformed.
+        """
+        fields: Dict[str, Any] = {}
+        for name in ("user_id", "broker_id", "access_token"):
+            value = data.get(name)
+            if not isinstance(value, str) or not value:
+                raise ValueError(f"Session field {name!r} must be a non-empty string")
+            fields[name] = value
+
+        for name in ("session_id", "refresh_token"):
+            if data.get(name) is not None:
+                fields[name] = str(data[name])
+
+        for name in ("created_at", "expires_at"):
+            value = data.get(name)
+            if isinstance(value, str):
+                try:
+                    value = datetime.fromisoformat(value)
+                except ValueError as e:
+                    raise ValueError(f"Session field {name!r}: {e}") from None
+            if value is not None and not isinstance(value, datetime):
+                raise ValueError(f"Session field {name!r} must be a datetime")
+            if value is not None:
+                fields[name] = value
+
+        metadata = data.get("metadata")
+        if metadata is not None:
+            if not isinstance(metadata, dict):
+                raise ValueError("Session field 'metadata' must be a dict")
+            fields["metadata"] = dict(metadata)
+
+        return cls(**fields)
 
     @property
     def is_expired(self) -> bool:
@@ -60,13 +129,45 @@ class UserSession(BaseModel):
         :returns: True if session is expired.
         :rtype: bool
         """
-        if self.expires_at is None:
-            return False
-        return datetime.utcnow() > self.expires_at
+        return (
+            self.expires_at_ns is not None and time.monotonic_ns() > self.expires_at_ns
+        )
+
+    @property
+    def last_activity(self) -> datetime:
+        """
+        Get the last activity time as a wall-clock datetime.
+
+        :returns: Last activity timestamp.
+        :rtype: datetime
+        """
+        idle_ns = time.monotonic_ns() - self.last_activity_ns
+        return datetime.utcnow() - timedelta(microseconds=idle_ns // 1000)
+
+    def set_expiry(self, expires_at: datetime) -> None:
+        """
+        Set the session expiry from a wall-clock time.
+
+        :param expires_at: Expiration timestamp.
+        :type expires_at: datetime
+        """
+        remaining = (expires_at - datetime.utcnow()).total_seconds()
+        self.expires_at = expires_at
+        self.expires_at_ns = time.monotonic_ns() + int(remaining * _NS_PER_SECOND)
+
+    def extend(self, ttl: float) -> None:
+        """
+        Set the session to expire ``ttl`` seconds from now.
+
+        :param ttl: Time to live in seconds.
+        :type ttl: float
+        """
+        self.expires_at_ns = time.monotonic_ns() + int(ttl * _NS_PER_SECOND)
+        self.expires_at = datetime.utcnow() + timedelta(seconds=ttl)
 
     def touch(self) -> None:
         """Update last activity timestamp."""
-        self.last_activity = datetime.utcnow()
+        self.last_activity_ns = time.monotonic_ns()
 
 
 @dataclass
@@ -80,17 +181,30 @@ class UserContext:
     :ivar session: User session data.
     :ivar broker: Broker client instance.
     :ivar ticker: Ticker client instance (optional).
-    :ivar profile: User profile from broker.
+    :ivar profile: User profile from broker, fetched in the background.
     :ivar is_active: Whether context is active.
-    :ivar _tasks: Background tasks for this user.
+    :ivar profile_ready: Set once the first profile fetch has finished.
+    :ivar place_order_fast: Broker-specialized order function, if any.
+    :ivar ring: Tick ring fed by the ticker, created when it starts.
+    :ivar _tasks: Running background tasks for this user.
+    :ivar _last_touch: Monotonic time of the last session touch.
+    :ivar _profile_fetched_at: Monotonic time of the last profile fetch.
     """
 
+    TOUCH_INTERVAL = 1.0
+    PROFILE_TTL = 300.0
+
     session: UserSession
     broker: BaseBroker
     ticker: Optional[BaseTicker] = None
     profile: Optional[UserProfile] = None
     is_active: bool = True
-    _tasks: List[asyncio.Task] = field(default_factory=list)
+    profile_ready: asyncio.Event = field(default_factory=asyncio.Event)
+    place_order_fast: Optional[Callable[..., OrderResult]] = None
+    ring: Optional[Ring] = None
+    _tasks: Set[asyncio.Task] = field(default_factory=set)
+    _last_touch: float = 0.0
+    _profile_fetched_at: Optional[float] = None
 
     @property
     def user_id(self) -> str:
@@ -102,41 +216,119 @@ class UserContext:
         """Get session ID."""
         return self.session.session_id
 
-    async def start_ticker(self) -> bool:
+    def touch(self) -> None:
+        """
+        Record activity on the session, at most once per ``TOUCH_INTERVAL``.
+
+        Activity only feeds idle tracking, so second-level freshness is
+        enough and hot users skip the timestamp write on most calls.
+        """
+        now = time.monotonic()
+        if now - self._last_touch >= self.TOUCH_INTERVAL:
+            self._last_touch = now
+            self.session.touch()
+
+    async def refresh_profile(self) -> Optional[UserProfile]:
+        """
+        Fetch the user profile from the broker without blocking the loop.
+
+        :returns: Fetched profile, or the previous one if the fetch failed.
+        :rtype: Optional[UserProfile]
+        """
+        try:
+            self.profile = await asyncio.to_thread(self.broker.get_profile)
+            self._profile_fetched_at = time.monotonic()
+        except Exception as e:
+            logger.warning("Could not fetch profile for %s: %s", self.user_id, e)
+        finally:
+            self.profile_ready.set()
+        return self.profile
+
+    async def get_profile(self) -> Optional[UserProfile]:
+        """
+        Get the user profile, re-fetching it once older than ``PROFILE_TTL``.
+
+        :returns: User profile or None if it could not be fetched.
+        :rtype: Optional[UserProfile]
+        """
+        fetched_at = self._profile_fetched_at
+        if fetched_at is None or time.monotonic() - fetched_at > self.PROFILE_TTL:
+            return await self.refresh_profile()
+        return self.profile
+
+    async def start_ticker(self, connect_timeout: float = 10.0) -> bool:
         """
         Start ticker for real-time data.
 
+        The connection handshake runs in a worker thread so other users
+        are not stalled. Ticks are written into ``ring`` on the ticker
+        thread; consumers read them through ``ring.consumer()``.
+
+        :param connect_timeout: Seconds to wait for the connection.
+        :type connect_timeout: float
         :returns: True if ticker started successfully.
         :rtype: bool
         """
         if self.ticker:
+            if self.ring is None:
+                self.ring = Ring()
+            self.ticker.on_ticks = self._on_ticks
             try:
-                self.ticker.connect()
+                await asyncio.wait_for(
+                    asyncio.to_thread(self.ticker.connect), connect_timeout
+                )
                 return True
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Ticker connect timed out for %s after %ss",
+                    self.user_id,
+                    connect_timeout,
+                )
             except Exception as e:
-                logger.error(f"Failed to start ticker for {self.user_id}: {e}")
+                logger.error("Failed to start ticker for %s: %s", self.user_id, e)
         return False
 
+    def _on_ticks(self, ws: Any, ticks: List[Dict]) -> None:
+        """
+        Copy incoming ticks into the ring without allocating per tick.
+
+        :param ws: Ticker instance.
+        :type ws: Any
+        :param ticks: List of tick data dictionaries.
+        :type ticks: List[Dict]
+        """
+        write = self.ring.write
+        for tick in ticks:
+            price = tick.get("last_price")
+            if price is not None:
+                write(tick["instrument_token"], price)
+
     async def stop_ticker(self) -> None:
         """Stop ticker connection."""
         if self.ticker:
             try:
-                self.ticker.close()
+                await asyncio.to_thread(self.ticker.close)
             except Exception as e:
-                logger.error(f"Error stopping ticker for {self.user_id}: {e}")
+                logger.error("Error stopping ticker for %s: %s", self.user_id, e)
 
     def add_task(self, task: asyncio.Task) -> None:
         """
         Add a background task to this context.
 
+        The task removes itself once done, so only running tasks are
+        kept alive. The set holds strong references on purpose: the event
+        loop only keeps weak ones, so a weakly held task could be garbage
+        collected mid-flight.
+
         :param task: Asyncio task to track.
         :type task: asyncio.Task
         """
-        self._tasks.append(task)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     async def cancel_tasks(self) -> None:
         """Cancel all background tasks."""
-        for task in self._tasks:
+        for task in list(self._tasks):
             if not task.done():
                 task.cancel()
                 try:
@@ -152,12 +344,28 @@ class UserContext:
         await self.stop_ticker()
 
 
+_current_context: ContextVar[Optional[UserContext]] = ContextVar(
+    "user_context", default=None
+)
+
+
+def current_context() -> Optional[UserContext]:
+    """
+    Get the user context activated for the current task, if any.
+
+    :returns: Active user context or None.
+    :rtype: Optional[UserContext]
+    """
+    return _current_context.get()
+
+
 class SessionManager:
     """
     Manages user sessions and contexts.
 
     Handles creating, retrieving, and cleaning up user sessions.
-    Supports multiple concurrent users with isolated contexts.
+    Supports multiple concurrent users with isolated contexts. Each
+    user maps to a single ``UserContext``, which owns the session.
 
     Example::
 
@@ -191,11 +399,11 @@ class SessionManager:
         :param session_ttl: Default session TTL in seconds.
         :type session_ttl: int
         """
-        self._sessions: Dict[str, UserSession] = {}
-        self._contexts: Dict[str, UserContext] = {}
+        self._users: Dict[str, UserContext] = {}
         self._event_bus = event_bus or get_event_bus()
         self._session_ttl = session_ttl
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._expiry_heap: List[Tuple[int, str, str]] = []
 
     @property
     def active_sessions(self) -> List[str]:
@@ -205,7 +413,7 @@ class SessionManager:
         :returns: List of user IDs with active sessions.
         :rtype: List[str]
         """
-        return list(self._sessions.keys())
+        return list(self._users)
 
     @property
     def session_count(self) -> int:
@@ -215,7 +423,7 @@ class SessionManager:
         :returns: Number of active sessions.
         :rtype: int
         """
-        return len(self._sessions)
+        return len(self._users)
 
     async def create_session(
         self,
@@ -251,7 +459,7 @@ class SessionManager:
         :rtype: UserContext
         """
 
-        if user_id in self._sessions:
+        if user_id in self._users:
             await self.end_session(user_id)
 
         session = UserSession(
@@ -259,24 +467,23 @@ class SessionManager:
             broker_id=broker_id,
             access_token=access_token,
             refresh_token=refresh_token,
-            expires_at=expires_at
-            or datetime.utcnow() + timedelta(seconds=self._session_ttl),
+            expires_at=expires_at,
             metadata=metadata or {},
         )
+        if expires_at is None:
+            session.extend(self._session_ttl)
 
         context = UserContext(
             session=session,
             broker=broker,
             ticker=ticker,
+            place_order_fast=broker.build_place_order_fn(),
         )
 
-        try:
-            context.profile = broker.get_profile()
-        except Exception as e:
-            logger.warning(f"Could not fetch profile for {user_id}: {e}")
+        context.add_task(asyncio.create_task(context.refresh_profile()))
 
-        self._sessions[user_id] = session
-        self._contexts[user_id] = context
+        self._users[user_id] = context
+        self._schedule_expiry(session)
 
         await self._event_bus.publish(
             Event(
@@ -289,7 +496,7 @@ class SessionManager:
             )
         )
 
-        logger.info(f"Session created for user {user_id}")
+        logger.info("Session created for user %s", user_id)
         return context
 
     def get_session(self, user_id: str) -> Optional[UserSession]:
@@ -301,7 +508,8 @@ class SessionManager:
         :returns: User session or None.
         :rtype: Optional[UserSession]
         """
-        return self._sessions.get(user_id)
+        context = self._users.get(user_id)
+        return context.session if context else None
 
     def get_context(self, user_id: str) -> Optional[UserContext]:
         """
@@ -312,11 +520,37 @@ class SessionManager:
         :returns: User context or None.
         :rtype: Optional[UserContext]
         """
-        context = self._contexts.get(user_id)
+        context = self._users.get(user_id)
         if context:
-            context.session.touch()
+            context.touch()
         return context
 
+    @contextmanager
+    def activate(self, user_id: str) -> Iterator[Optional[UserContext]]:
+        """
+        Make a user's context current for the enclosed block.
+
+        Services called inside the block read the context from a
+        ``ContextVar`` instead of looking it up again. The lookup here
+        touches the session once for the whole block.
+
+        :param user_id: User identifier.
+        :type user_id: str
+        :returns: Context manager yielding the user context or None.
+        :rtype: Iterator[Optional[UserContext]]
+
+        Example::
+
+            with manager.activate(user_id):
+                await service.place_order(user_id=user_id, ...)
+        """
+        context = self.get_context(user_id)
+        token = _current_context.set(context)
+        try:
+            yield context
+        finally:
+            _current_context.reset(token)
+
     def has_session(self, user_id: str) -> bool:
         """
         Check if user has active session.
@@ -326,40 +560,43 @@ class SessionManager:
         :returns: True if session exists.
         :rtype: bool
         """
-        return user_id in self._sessions
+        return user_id in self._users
 
-    async def end_session(self, user_id: str) -> bool:
+    async def end_session(self, user_id: str, *, publish: bool = True) -> bool:
         """
         End a user session.
 
         :param user_id: User identifier.
         :type user_id: str
+        :param publish: Publish ``SESSION_EXPIRED`` for this session.
+            ``shutdown`` turns this off and publishes one batch event.
+        :type publish: bool
         :returns: True if session was ended.
         :rtype: bool
         """
-        if user_id not in self._sessions:
+        context = self._users.get(user_id)
+        if context is None:
             return False
 
-        context = self._contexts.get(user_id)
-        if context:
-            await context.cleanup()
+        await context.cleanup()
 
-        session = self._sessions.pop(user_id, None)
-        self._contexts.pop(user_id, None)
+        self._users.pop(user_id, None)
+        session = context.session
         self._event_bus.remove_user_handlers(user_id)
 
-        await self._event_bus.publish(
-            Event(
-                type=EventType.SESSION_EXPIRED,
-                user_id=user_id,
-                data={
-                    "session_id": session.session_id if session else None,
-                    "reason": "ended",
-                },
+        if publish:
+            await self._event_bus.publish(
+                Event(
+                    type=EventType.SESSION_EXPIRED,
+                    user_id=user_id,
+                    data={
+                        "session_id": session.session_id,
+                        "reason": "ended",
+                    },
+                )
             )
-        )
 
-        logger.info(f"Session ended for user {user_id}")
+        logger.info("Session ended for user %s", user_id)
         return True
 
     async def refresh_session(
@@ -383,7 +620,7 @@ class SessionManager:
         :returns: True if refreshed successfully.
         :rtype: bool
         """
-        session = self._sessions.get(user_id)
+        session = self.get_session(user_id)
         if not session:
             return False
 
@@ -391,39 +628,83 @@ class SessionManager:
         if new_refresh_token:
             session.refresh_token = new_refresh_token
         if new_expires_at:
-            session.expires_at = new_expires_at
+            session.set_expiry(new_expires_at)
         else:
-            session.expires_at = datetime.utcnow() + timedelta(
-                seconds=self._session_ttl
-            )
+            session.extend(self._session_ttl)
+        self._schedule_expiry(session)
 
         session.touch()
         return True
 
+    def _schedule_expiry(self, session: UserSession) -> None:
+        """
+        Record a session's expiry in the expiry heap.
+
+        Superseded entries (refreshed or ended sessions) are left in
+        place and skipped when they reach the top of the heap.
+
+        :param session: Session whose expiry changed.
+        :type session: UserSession
+        """
+        if session.expires_at_ns is not None:
+            heapq.heappush(
+                self._expiry_heap,
+                (session.expires_at_ns, session.user_id, session.session_id),
+            )
+
     async def cleanup_expired(self) -> int:
         """
         Clean up expired sessions.
 
+        Only heap entries that are already due are inspected, so the
+        cost is proportional to the sessions actually expiring.
+
         :returns: Number of sessions cleaned up.
         :rtype: int
         """
-        expired = [
-            user_id for user_id, session in self._sessions.items() if session.is_expired
-        ]
+        heap = self._expiry_heap
+        now = time.monotonic_ns()
+        expired = []
+        while heap and heap[0][0] < now:
+            expires_ns, user_id, session_id = heapq.heappop(heap)
+            session = self.get_session(user_id)
+            if (
+                session is not None
+                and session.session_id == session_id
+                and session.expires_at_ns == expires_ns
+            ):
+                expired.append(user_id)
 
         for user_id in expired:
             await self.end_session(user_id)
 
         if expired:
-            logger.info(f"Cleaned up {len(expired)} expired sessions")
+            logger.info("Cleaned up %s expired sessions", len(expired))
 
         return len(expired)
 
+    def _seconds_until_next_expiry(self, interval: float) -> float:
+        """
+        Get how long the cleanup loop should sleep.
+
+        :param interval: Upper bound in seconds.
+        :type interval: float
+        :returns: Seconds until the earliest expiry, capped at ``interval``.
+        :rtype: float
+        """
+        if not self._expiry_heap:
+            return interval
+        remaining = (self._expiry_heap[0][0] - time.monotonic_ns()) / _NS_PER_SECOND
+        return min(interval, max(0.0, remaining))
+
     async def start_cleanup_task(self, interval: int = 300) -> None:
         """
         Start periodic cleanup task.
 
-        :param interval: Cleanup interval in seconds.
+        The task wakes when the earliest session is due to expire, or
+        after ``interval`` seconds if that is sooner.
+
+        :param interval: Maximum cleanup interval in seconds.
         :type interval: int
         """
         if self._cleanup_task:
@@ -431,7 +712,7 @@ class SessionManager:
 
         async def cleanup_loop():
             while True:
-                await asyncio.sleep(interval)
+                await asyncio.sleep(self._seconds_until_next_expiry(interval))
                 await self.cleanup_expired()
 
         self._cleanup_task = asyncio.create_task(cleanup_loop())
@@ -447,11 +728,25 @@ class SessionManager:
             self._cleanup_task = None
 
     async def shutdown(self) -> None:
-        """Shutdown session manager and all sessions."""
+        """
+        Shutdown session manager and all sessions.
+
+        Sessions are ended concurrently without individual events;
+        a single ``SESSIONS_SHUTDOWN`` event lists the ended users.
+        """
         await self.stop_cleanup_task()
 
-        for user_id in list(self._sessions.keys()):
-            await self.end_session(user_id)
+        user_ids = list(self._users)
+        if user_ids:
+            await asyncio.gather(
+                *(self.end_session(user_id, publish=False) for user_id in user_ids)
+            )
+            await self._event_bus.publish(
+                Event(
+                    type=EventType.SESSIONS_SHUTDOWN,
+                    data={"user_ids": user_ids},
+                )
+            )
 
         logger.info("Session manager shut down")
 
@@ -16,6 +16,9 @@ from src.database.connection import (
     get_session,
 )
 from src.database.models import (
+    INSERT_NOTIFICATION,
+    INSERT_TRADE_LOG,
+    INSERT_USER_SESSION,
     Base,
     BrokerAccount,
     Notification,
@@ -33,7 +36,6 @@ from src.database.repositories import (
     PostgresUserRepository,
 )
 
-
 get_database_manager = get_database
 
 __all__ = [
@@ -51,6 +53,9 @@ __all__ = [
     "TradingRule",
     "TradeLog",
     "Notification",
+    "INSERT_TRADE_LOG",
+    "INSERT_NOTIFICATION",
+    "INSERT_USER_SESSION",
     "PostgresUserRepository",
     "PostgresSessionRepository",
     "PostgresRulesRepository",
@@ -8,22 +8,32 @@ and transaction management for async SQLAlchemy.
 :license: MIT
 """
 
+import asyncio
 import logging
+import os
+import threading
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from functools import cache
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Type
+from uuid import uuid4
+
+from sqlalchemy import Insert, event, insert
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
 
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
+    async_scoped_session,
     async_sessionmaker,
     create_async_engine,
 )
-from dotenv import load_dotenv
-
-from src.database.models import Base
 
+from src.config import load_env_file
+from src.database.models import INSERT_NOTIFICATION, INSERT_TRADE_LOG, Base
 
-load_dotenv()
+load_env_file()
 
 logger = logging.getLogger(__name__)
 
@@ -37,16 +47,39 @@ class DatabaseConfig:
     :ivar max_overflow: Max overflow connections.
     :ivar pool_timeout: Pool timeout in seconds.
     :ivar pool_recycle: Connection recycle time.
+    :ivar pool_pre_ping: Test connections on checkout.
+    :ivar min_size: Connections opened eagerly by ``Database.init``.
+    :ivar statement_cache_size: Prepared statements cached per connection.
+    :ivar query_cache_size: Compiled SQL statements cached by the engine.
+    :ivar application_name: Name reported in ``pg_stat_activity``.
+    :ivar jit: Allow PostgreSQL JIT compilation of query plans.
+    :ivar statement_timeout: Per-statement timeout in milliseconds.
+    :ivar idle_in_transaction_timeout: Milliseconds a session may sit idle
+        inside a transaction before the server ends it.
+    :ivar tcp_keepalives_idle: Seconds of idleness before TCP keepalives.
     :ivar echo: Echo SQL statements.
+
+    Size the pool so ``pool_size + max_overflow`` covers the number of
+    requests expected to hit the database concurrently; requests beyond
+    that wait up to ``pool_timeout`` for a connection.
     """
 
     def __init__(
         self,
         url: str | None = None,
-        pool_size: int = 5,
+        pool_size: int = 20,
         max_overflow: int = 10,
         pool_timeout: int = 30,
         pool_recycle: int = 1800,
+        pool_pre_ping: bool = False,
+        min_size: int | None = None,
+        statement_cache_size: int = 500,
+        query_cache_size: int = 1200,
+        application_name: str = "rbt",
+        jit: bool = False,
+        statement_timeout: int = 30000,
+        idle_in_transaction_timeout: int = 60000,
+        tcp_keepalives_idle: int = 60,
         echo: bool = False,
     ) -> None:
         """
@@ -64,11 +97,31 @@ class DatabaseConfig:
         :type pool_timeout: int
         :param pool_recycle: Connection recycle interval.
         :type pool_recycle: int
+        :param pool_pre_ping: Ping connections before handing them out.
+        :type pool_pre_ping: bool
+        :param min_size: Connections to open at init; defaults to pool_size.
+        :type min_size: int | None
+        :param statement_cache_size: Prepared statement cache size per
+            connection. Forced to 0 when the URL has ``pgbouncer=true``.
+        :type statement_cache_size: int
+        :param query_cache_size: Size of SQLAlchemy's compiled statement
+            cache; large enough to hold every hot query across all models.
+        :type query_cache_size: int
+        :param application_name: Connection name shown in ``pg_stat_activity``.
+        :type application_name: str
+        :param jit: Enable JIT; planning overhead outweighs the gain for
+            the short OLTP queries this app issues.
+        :type jit: bool
+        :param statement_timeout: Statement timeout in ms, 0 disables.
+        :type statement_timeout: int
+        :param idle_in_transaction_timeout: Idle-in-transaction timeout in
+            ms, 0 disables.
+        :type idle_in_transaction_timeout: int
+        :param tcp_keepalives_idle: TCP keepalive idle time in seconds.
+        :type tcp_keepalives_idle: int
         :param echo: Log SQL statements.
         :type echo: bool
         """
-        import os
-
         self.url = url or os.getenv(
             "DATABASE_URL", "postgresql+asyncpg://localhost:5432/trading"
         )
@@ -76,8 +129,115 @@ class DatabaseConfig:
         self.max_overflow = max_overflow
         self.pool_timeout = pool_timeout
         self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.min_size = pool_size if min_size is None else min(min_size, pool_size)
+        self.statement_cache_size = statement_cache_size
+        self.query_cache_size = query_cache_size
+        self.application_name = application_name
+        self.jit = jit
+        self.statement_timeout = statement_timeout
+        self.idle_in_transaction_timeout = idle_in_transaction_timeout
+        self.tcp_keepalives_idle = tcp_keepalives_idle
         self.echo = echo
 
+    def engine_args(self) -> Tuple[URL, Dict[str, Any]]:
+        """
+        Get the engine URL and driver connect arguments.
+
+        For asyncpg, repeated queries reuse prepared statements from a
+        per-connection cache. Transaction poolers such as pgbouncer hand
+        each transaction a different server connection, so a
+        ``pgbouncer=true`` query parameter disables the caches and gives
+        statements unique names instead.
+
+        Session settings (JIT, timeouts, keepalives) are sent as startup
+        parameters so no extra round-trip is needed per connection.
+        pgbouncer only accepts ``application_name`` at startup, so the
+        rest are left to the server configuration behind it.
+
+        :returns: URL without the pgbouncer flag, and connect arguments.
+        :rtype: Tuple[URL, Dict[str, Any]]
+        """
+        url = make_url(self.url)
+        pgbouncer = url.query.get("pgbouncer", "").lower() == "true"
+        url = url.difference_update_query(["pgbouncer"])
+
+        connect_args: Dict[str, Any] = {}
+        if url.get_driver_name() == "asyncpg":
+            cache_size = 0 if pgbouncer else self.statement_cache_size
+            connect_args["prepared_statement_cache_size"] = cache_size
+            connect_args["statement_cache_size"] = cache_size
+            if pgbouncer:
+                connect_args["prepared_statement_name_func"] = _unique_statement_name
+            connect_args["server_settings"] = self.server_settings(pgbouncer)
+        return url, connect_args
+
+    def server_settings(self, pgbouncer: bool = False) -> Dict[str, str]:
+        """
+        Get the PostgreSQL settings applied to each new connection.
+
+        :param pgbouncer: Restrict to parameters pgbouncer passes through.
+        :type pgbouncer: bool
+        :returns: Setting names mapped to string values.
+        :rtype: Dict[str, str]
+        """
+        settings = {"application_name": self.application_name}
+        if not pgbouncer:
+            settings.update(
+                jit="on" if self.jit else "off",
+                statement_timeout=str(self.statement_timeout),
+                idle_in_transaction_session_timeout=str(
+                    self.idle_in_transaction_timeout
+                ),
+                tcp_keepalives_idle=str(self.tcp_keepalives_idle),
+            )
+        return settings
+
+
+def _unique_statement_name() -> str:
+    """Generate a prepared statement name unique across connections."""
+    return f"__asyncpg_{uuid4().hex}__"
+
+
+class TrackedSession(Session):
+    """
+    Session that records whether it has written to the database.
+
+    ``info["readonly"]`` starts true and is cleared by the first flush or
+    non-SELECT statement, so read-only blocks can end without ``COMMIT``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.info["readonly"] = True
+
+
+@event.listens_for(TrackedSession, "after_flush")
+def _mark_flushed(session: Session, flush_context: UOWTransaction) -> None:
+    """Mark a session as written once it flushes changes."""
+    session.info["readonly"] = False
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _mark_executed(orm_execute_state: ORMExecuteState) -> None:
+    """Mark a session as written when it runs anything but a SELECT."""
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["readonly"] = False
+
+
+def _has_writes(session: AsyncSession) -> bool:
+    """
+    Check whether a session has changes that need a commit.
+
+    :param session: Session ending its unit of work.
+    :type session: AsyncSession
+    :returns: True if pending objects or executed writes must be committed.
+    :rtype: bool
+    """
+    if session.new or session.dirty or session.deleted:
+        return True
+    return session.in_transaction() and not session.info.get("readonly", False)
+
 
 class Database:
     """
@@ -95,8 +255,15 @@ class Database:
             users = result.scalars().all()
 
         await db.close()
+
+    Audit rows (trade logs, notifications) queued with ``log_trade`` and
+    ``notify`` are written by a background task in batches, so callers
+    do not wait for the commit.
     """
 
+    AUDIT_QUEUE_SIZE = 10_000
+    AUDIT_BATCH_SIZE = 256
+
     def __init__(self, config: Optional[DatabaseConfig] = None) -> None:
         """
         Initialize database manager.
@@ -107,6 +274,9 @@ class Database:
         self.config = config or DatabaseConfig()
         self._engine: Optional[AsyncEngine] = None
         self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._scoped_session: Optional[async_scoped_session[AsyncSession]] = None
+        self._audit_queue: asyncio.Queue = asyncio.Queue(maxsize=self.AUDIT_QUEUE_SIZE)
+        self._writer_task: Optional[asyncio.Task] = None
 
     @property
     def engine(self) -> AsyncEngine:
@@ -134,39 +304,103 @@ class Database:
             raise RuntimeError("Database not initialized. Call init() first.")
         return self._session_factory
 
+    @property
+    def scoped_session(self) -> async_scoped_session[AsyncSession]:
+        """
+        Get the task-scoped session registry.
+
+        Calling it returns the same session for every caller in the
+        current asyncio task; ``remove()`` closes and forgets it.
+
+        :returns: Session registry keyed by the current task.
+        :rtype: async_scoped_session[AsyncSession]
+        :raises RuntimeError: If database not initialized.
+        """
+        if self._scoped_session is None:
+            raise RuntimeError("Database not initialized. Call init() first.")
+        return self._scoped_session
+
     async def init(self) -> None:
         """
         Initialize database connection.
 
-        Creates engine and session factory.
+        Creates engine and session factory, then opens ``min_size``
+        connections so early requests check out an established
+        connection instead of paying for the connect handshake.
         """
         logger.info(f"Initializing database connection")
 
+        url, connect_args = self.config.engine_args()
         self._engine = create_async_engine(
-            self.config.url,
+            url,
+            connect_args=connect_args,
             pool_size=self.config.pool_size,
             max_overflow=self.config.max_overflow,
             pool_timeout=self.config.pool_timeout,
             pool_recycle=self.config.pool_recycle,
+            pool_pre_ping=self.config.pool_pre_ping,
+            query_cache_size=self.config.query_cache_size,
             echo=self.config.echo,
         )
 
         self._session_factory = async_sessionmaker(
             bind=self._engine,
             class_=AsyncSession,
+            sync_session_class=TrackedSession,
             expire_on_commit=False,
             autocommit=False,
             autoflush=False,
         )
+        self._scoped_session = async_scoped_session(
+            self._session_factory, scopefunc=asyncio.current_task
+        )
+        self._writer_task = asyncio.create_task(self._write_audit_rows())
+
+        if self.config.min_size > 0:
+            await self._warm_pool(self.config.min_size)
 
-        logger.info("Database connection initialized")
+        logger.info(
+            "Database connection initialized (query cache %s; %s)",
+            self.config.query_cache_size,
+            self._engine.pool.status(),
+        )
+
+    async def _warm_pool(self, count: int) -> None:
+        """
+        Open and return ``count`` connections to seed the pool.
+
+        Failures are logged rather than raised; the pool still connects
+        lazily on demand.
+
+        :param count: Number of connections to open.
+        :type count: int
+        """
+        results = await asyncio.gather(
+            *(self._engine.connect() for _ in range(count)), return_exceptions=True
+        )
+        connections = [r for r in results if not isinstance(r, BaseException)]
+        await asyncio.gather(*(conn.close() for conn in connections))
+        if len(connections) < count:
+            error = next(r for r in results if isinstance(r, BaseException))
+            logger.warning(
+                "Pre-warmed %s of %s connections: %s", len(connections), count, error
+            )
 
     async def close(self) -> None:
-        """Close database connection and cleanup."""
+        """Close database connection and cleanup, writing queued audit rows."""
+        if self._writer_task is not None:
+            await self.flush_audit()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
         if self._engine:
             await self._engine.dispose()
             self._engine = None
             self._session_factory = None
+            self._scoped_session = None
             logger.info("Database connection closed")
 
     async def connect(self) -> None:
@@ -204,6 +438,8 @@ class Database:
         Get a database session context manager.
 
         Automatically handles commit/rollback and session cleanup.
+        Blocks that only read skip ``COMMIT``; closing the session ends
+        the transaction without expiring the objects it loaded.
 
         :yields: Database session.
         :rtype: AsyncGenerator[AsyncSession, None]
@@ -221,13 +457,141 @@ class Database:
         session = self._session_factory()
         try:
             yield session
-            await session.commit()
+            if _has_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncGenerator[AsyncConnection, None]:
+        """
+        Get a Core connection for batched writes in one transaction.
+
+        Executing a statement with a list of parameter dicts goes
+        through the driver's ``executemany``, which asyncpg pipelines:
+        every row is sent without waiting for the previous one, so a
+        batch costs about one round-trip instead of one per row. The
+        ORM unit of work is bypassed entirely.
+
+        Rows must be fully resolved before the batch starts; anything
+        that depends on a result of the batch (generated IDs, lookups)
+        has to be fetched first.
+
+        :yields: Connection inside a transaction, committed on exit.
+        :rtype: AsyncGenerator[AsyncConnection, None]
+
+        Example::
+
+            async with db.pipeline() as conn:
+                await conn.execute(insert(TradeLog), rows)
+        """
+        async with self.engine.begin() as conn:
+            yield conn
+
+    async def bulk_insert(
+        self,
+        model: Type[Base],
+        rows: List[Dict[str, Any]],
+        chunk: int = 1000,
+    ) -> int:
+        """
+        Insert many rows with one statement per chunk.
+
+        Rows are sent through ``pipeline()`` in a single transaction;
+        use this instead of ``session.add`` per object for audit rows
+        such as TradeLog and Notification. Python-side column defaults
+        still apply, but ORM events and relationships do not.
+
+        :param model: Mapped model class.
+        :type model: Type[Base]
+        :param rows: Column values keyed by column name.
+        :type rows: List[Dict[str, Any]]
+        :param chunk: Maximum rows per executed batch.
+        :type chunk: int
+        :returns: Number of rows inserted.
+        :rtype: int
+        """
+        if not rows:
+            return 0
+        stmt = insert(model)
+        async with self.pipeline() as conn:
+            for start in range(0, len(rows), chunk):
+                await conn.execute(stmt, rows[start : start + chunk])
+        return len(rows)
+
+    async def log_trade(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a trade log row for the background writer.
+
+        :param row: TradeLog column values keyed by column name.
+        :type row: Dict[str, Any]
+        :raises RuntimeError: If database not initialized.
+        """
+        await self._enqueue_audit(INSERT_TRADE_LOG, row)
+
+    async def notify(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a notification row for the background writer.
+
+        :param row: Notification column values keyed by column name.
+        :type row: Dict[str, Any]
+        :raises RuntimeError: If database not initialized.
+        """
+        await self._enqueue_audit(INSERT_NOTIFICATION, row)
+
+    async def flush_audit(self) -> None:
+        """Wait until every queued audit row has been written."""
+        if self._writer_task is not None and not self._writer_task.done():
+            await self._audit_queue.join()
+
+    async def _enqueue_audit(self, stmt: Insert, row: Dict[str, Any]) -> None:
+        """
+        Queue an audit row, waiting only if the queue is full.
+
+        :param stmt: Prebuilt INSERT statement for the row's table.
+        :type stmt: Insert
+        :param row: Column values keyed by column name.
+        :type row: Dict[str, Any]
+        :raises RuntimeError: If database not initialized.
+        """
+        if self._writer_task is None:
+            raise RuntimeError("Database not initialized. Call init() first.")
+        item = (stmt, row)
+        try:
+            self._audit_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            await self._audit_queue.put(item)
+
+    async def _write_audit_rows(self) -> None:
+        """
+        Drain the audit queue, inserting up to ``AUDIT_BATCH_SIZE`` rows
+        per transaction.
+
+        Rows are grouped by statement and column set so each group is
+        one ``executemany``. A failed batch is logged and dropped.
+        """
+        queue = self._audit_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.AUDIT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            groups: Dict[Tuple[Insert, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+            for stmt, row in batch:
+                groups.setdefault((stmt, tuple(row)), []).append(row)
+            try:
+                async with self.pipeline() as conn:
+                    for (stmt, _), rows in groups.items():
+                        await conn.execute(stmt, rows)
+            except Exception as e:
+                logger.error("Failed to write %s audit rows: %s", len(batch), e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
     def get_session(self) -> AsyncSession:
         """
         Get a new session (caller must manage lifecycle).
@@ -241,19 +605,25 @@ class Database:
 
 
 _database: Optional[Database] = None
+_database_lock = threading.Lock()
 
 
+@cache
 def get_database() -> Database:
     """
     Get global database instance.
 
+    The result is memoized; the first call creates the instance under
+    a lock so concurrent callers never build two pools.
+
     :returns: Database instance.
     :rtype: Database
     """
     global _database
-    if _database is None:
-        _database = Database()
-    return _database
+    with _database_lock:
+        if _database is None:
+            _database = Database()
+        return _database
 
 
 def configure_database(config: DatabaseConfig) -> Database:
@@ -266,7 +636,9 @@ def configure_database(config: DatabaseConfig) -> Database:
     :rtype: Database
     """
     global _database
-    _database = Database(config)
+    with _database_lock:
+        _database = Database(config)
+    get_database.cache_clear()
     return _database
 
 
@@ -274,6 +646,11 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency for database sessions.
 
+    Uses the task-scoped registry, so code running in the same request
+    task that asks for a session gets this one instead of a new one.
+    The session is committed (or rolled back) and removed on exit; a
+    request that only read skips the commit.
+
     :yields: Database session.
     :rtype: AsyncGenerator[AsyncSession, None]
 
@@ -284,6 +661,14 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             result = await session.execute(select(User))
             return result.scalars().all()
     """
-    db = get_database()
-    async with db.session() as session:
+    scoped = get_database().scoped_session
+    session = scoped()
+    try:
         yield session
+        if _has_writes(session):
+            await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await scoped.remove()
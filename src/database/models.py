@@ -4,42 +4,79 @@ SQLAlchemy database models.
 This module defines all database tables using SQLAlchemy ORM.
 Supports PostgreSQL with async operations.
 
+Relationship loading is explicit, since async sessions cannot lazy
+load. ``User.broker_accounts`` and ``User.trading_rules`` are small and
+usually needed together, so they load with the user in one
+``SELECT ... WHERE user_id IN (...)`` per collection. The unbounded
+``User.sessions`` and ``User.trade_logs`` raise instead of querying;
+load them on demand::
+
+    stmt = select(User).options(selectinload(User.trade_logs))
+
+The many-to-one ``user`` attributes on the other models are plain
+foreign key lookups, so they resolve from the identity map once the
+user is loaded. Per-user lists such as a user's rules or trades cost at
+most one extra query for their ``user``, never one per row; the
+repositories do not eager load it because no caller reads it.
+
 :copyright: (c) 2025
 :license: MIT
 """
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from uuid import uuid4
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    DDL,
     DateTime,
     Float,
     ForeignKey,
+    Identity,
     Index,
     Integer,
-    JSON,
     String,
     Text,
     UniqueConstraint,
+    event,
+    func,
+    insert,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+ERROR_MESSAGE_LENGTH = 2048
+"""Maximum stored length of ``TradeLog.error_message``."""
+
+_EMPTY_OBJECT = text("'{}'::jsonb")
+_EMPTY_ARRAY = text("'[]'::jsonb")
+
 
 class Base(AsyncAttrs, DeclarativeBase):
-    """Base class for all SQLAlchemy models."""
+    """
+    Base class for all SQLAlchemy models.
+
+    Server-generated values (IDs, timestamps) are fetched with
+    RETURNING on flush, so they can be read without a lazy load.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class TimestampMixin:
-    """Mixin for created_at and updated_at timestamps."""
+    """Mixin for created_at and updated_at timestamps, set by the server."""
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
 
@@ -56,35 +93,51 @@ class User(Base, TimestampMixin):
     :ivar full_name: User's full name.
     :ivar is_active: Whether user account is active.
     :ivar is_verified: Whether email is verified.
-    :ivar settings: User preferences as JSON.
+    :ivar settings: User preferences as JSONB.
     """
 
     __tablename__ = "users"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
     )
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
-    settings: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    settings: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, server_default=_EMPTY_OBJECT, default=dict
+    )
 
     broker_accounts: Mapped[List["BrokerAccount"]] = relationship(
-        "BrokerAccount", back_populates="user", cascade="all, delete-orphan"
+        "BrokerAccount",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="selectin",
     )
     sessions: Mapped[List["UserSessionDB"]] = relationship(
-        "UserSessionDB", back_populates="user", cascade="all, delete-orphan"
+        "UserSessionDB",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     trading_rules: Mapped[List["TradingRule"]] = relationship(
-        "TradingRule", back_populates="user", cascade="all, delete-orphan"
+        "TradingRule",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="selectin",
     )
     trade_logs: Mapped[List["TradeLog"]] = relationship(
-        "TradeLog", back_populates="user", cascade="all, delete-orphan"
+        "TradeLog",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
-    __table_args__ = (Index("ix_users_email", "email"),)
+    __table_args__ = {"postgresql_with": {"fillfactor": 80}}
 
 
 class BrokerAccount(Base, TimestampMixin):
@@ -109,28 +162,30 @@ class BrokerAccount(Base, TimestampMixin):
     __tablename__ = "broker_accounts"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
     )
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     broker_id: Mapped[str] = mapped_column(String(50), nullable=False)
     broker_user_id: Mapped[str] = mapped_column(String(100), nullable=True)
     api_key: Mapped[str] = mapped_column(String(255), nullable=False)
     api_secret: Mapped[str] = mapped_column(String(255), nullable=True)
-    access_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    refresh_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    access_token: Mapped[Optional[str]] = mapped_column(String(4096), nullable=True)
+    refresh_token: Mapped[Optional[str]] = mapped_column(String(4096), nullable=True)
     token_expires_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime, nullable=True
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    metadata_: Mapped[Dict[str, Any]] = mapped_column("metadata", JSON, default=dict)
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, server_default=_EMPTY_OBJECT, default=dict
+    )
 
     user: Mapped["User"] = relationship("User", back_populates="broker_accounts")
 
     __table_args__ = (
         UniqueConstraint("user_id", "broker_id", name="uq_user_broker"),
-        Index("ix_broker_accounts_user_id", "user_id"),
+        {"postgresql_with": {"fillfactor": 80}},
     )
 
 
@@ -147,25 +202,30 @@ class UserSessionDB(Base, TimestampMixin):
     :ivar user_agent: Client user agent.
     :ivar expires_at: Session expiration.
     :ivar is_active: Whether session is active.
+
+    ``ix_user_sessions_active`` covers the active-session lookups, so
+    they are answered by index-only scans over active rows.
     """
 
     __tablename__ = "user_sessions"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
     )
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     broker_account_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("broker_accounts.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=False),
+        ForeignKey("broker_accounts.id", ondelete="SET NULL"),
+        nullable=True,
     )
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     user_agent: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     last_activity: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     user: Mapped["User"] = relationship("User", back_populates="sessions")
@@ -173,6 +233,18 @@ class UserSessionDB(Base, TimestampMixin):
     __table_args__ = (
         Index("ix_user_sessions_user_id", "user_id"),
         Index("ix_user_sessions_expires_at", "expires_at"),
+        Index(
+            "ix_user_sessions_active",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_include=[
+                "id",
+                "broker_account_id",
+                "expires_at",
+                "last_activity",
+            ],
+            postgresql_where=text("is_active"),
+        ),
     )
 
 
@@ -189,8 +261,8 @@ class TradingRule(Base, TimestampMixin):
     :ivar symbol: Trading symbol (e.g., RELIANCE, NIFTY).
     :ivar is_active: Whether rule is active.
     :ivar priority: Rule priority (lower = higher priority).
-    :ivar conditions: List of conditions (stored as JSON).
-    :ivar actions: List of actions (stored as JSON).
+    :ivar conditions: List of conditions (stored as JSONB).
+    :ivar actions: List of actions (stored as JSONB).
     :ivar symbol_pattern: Symbol matching pattern for exit rules.
     :ivar exchange: Exchange filter.
     :ivar position_type: LONG or SHORT.
@@ -200,38 +272,66 @@ class TradingRule(Base, TimestampMixin):
     :ivar metadata: Additional rule metadata.
     :ivar trigger_count: Number of times rule was triggered.
     :ivar last_triggered: Last trigger timestamp.
+
+    Like ``users`` and ``broker_accounts``, the table leaves 20% free
+    space per page (fillfactor 80) so updates to unindexed columns can
+    be HOT updates that skip index maintenance. Increment counters in
+    SQL rather than read-modify-write in Python::
+
+        update(TradingRule)
+        .where(TradingRule.id == rule_id)
+        .values(trigger_count=TradingRule.trigger_count + 1)
     """
 
     __tablename__ = "trading_rules"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
     )
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     symbol: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     priority: Mapped[int] = mapped_column(Integer, default=100)
-    conditions: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, default=list)
-    actions: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, default=list)
+    conditions: Mapped[List[Dict[str, Any]]] = mapped_column(
+        JSONB, server_default=_EMPTY_ARRAY, default=list
+    )
+    actions: Mapped[List[Dict[str, Any]]] = mapped_column(
+        JSONB, server_default=_EMPTY_ARRAY, default=list
+    )
     symbol_pattern: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     exchange: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     position_type: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
-    take_profit: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
-    stop_loss: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
-    time_conditions: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
-    metadata_: Mapped[Dict[str, Any]] = mapped_column("metadata", JSON, default=dict)
+    take_profit: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, server_default=_EMPTY_OBJECT, default=dict
+    )
+    stop_loss: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, server_default=_EMPTY_OBJECT, default=dict
+    )
+    time_conditions: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, server_default=_EMPTY_OBJECT, default=dict
+    )
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, server_default=_EMPTY_OBJECT, default=dict
+    )
     trigger_count: Mapped[int] = mapped_column(Integer, default=0)
     last_triggered: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     user: Mapped["User"] = relationship("User", back_populates="trading_rules")
 
     __table_args__ = (
-        Index("ix_trading_rules_user_id", "user_id"),
         Index("ix_trading_rules_user_active", "user_id", "is_active"),
+        Index(
+            "ix_trading_rules_active_priority",
+            "user_id",
+            "priority",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_trading_rules_conditions_gin", "conditions", postgresql_using="gin"),
+        {"postgresql_with": {"fillfactor": 80}},
     )
 
 
@@ -239,9 +339,19 @@ class TradeLog(Base):
     """
     Trade execution log model.
 
-    Records all trade executions for audit and analysis.
+    Records all trade executions for audit and analysis. The table is
+    append-only, so the key is a sequential identity: new rows always
+    land on the rightmost B-tree leaf.
+
+    The table is range-partitioned by ``executed_at`` (monthly partitions
+    are created by migrations), so time-range queries only scan the
+    matching partitions and old months can be detached cheaply.
+    Postgres requires the partition key in every unique constraint,
+    hence the ``(id, executed_at)`` primary key. A default partition is
+    created with the table to catch rows outside the monthly ranges.
 
-    :ivar id: Log entry ID.
+    :ivar id: Log entry ID (identity).
+    :ivar external_id: Optional opaque UUID handle for external references.
     :ivar user_id: Foreign key to user.
     :ivar broker_account_id: Broker account used.
     :ivar rule_id: Rule that triggered the trade (if any).
@@ -263,17 +373,22 @@ class TradeLog(Base):
 
     __tablename__ = "trade_logs"
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
+    external_id: Mapped[Optional[str]] = mapped_column(
+        UUID(as_uuid=False), nullable=True
     )
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     broker_account_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("broker_accounts.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=False),
+        ForeignKey("broker_accounts.id", ondelete="SET NULL"),
+        nullable=True,
     )
     rule_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("trading_rules.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=False),
+        ForeignKey("trading_rules.id", ondelete="SET NULL"),
+        nullable=True,
     )
     symbol: Mapped[str] = mapped_column(String(100), nullable=False)
     exchange: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -286,21 +401,40 @@ class TradeLog(Base):
     trigger_price: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     pnl: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     status: Mapped[str] = mapped_column(String(20), nullable=False)
-    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(
+        String(ERROR_MESSAGE_LENGTH), nullable=True
+    )
     executed_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, server_default=_EMPTY_OBJECT
     )
-    metadata_: Mapped[Dict[str, Any]] = mapped_column("metadata", JSON, default=dict)
 
     user: Mapped["User"] = relationship("User", back_populates="trade_logs")
 
     __table_args__ = (
-        Index("ix_trade_logs_user_id", "user_id"),
         Index("ix_trade_logs_executed_at", "executed_at"),
         Index("ix_trade_logs_symbol", "symbol", "exchange"),
+        Index("ix_trade_logs_user_executed", "user_id", text("executed_at DESC")),
+        Index("ix_trade_logs_external_id", "external_id"),
+        {"postgresql_partition_by": "RANGE (executed_at)"},
     )
 
 
+event.listen(
+    TradeLog.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS trade_logs_default "
+        "PARTITION OF trade_logs DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class Notification(Base):
     """
     Notification queue model.
@@ -323,27 +457,44 @@ class Notification(Base):
     __tablename__ = "notifications"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
     )
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     type: Mapped[str] = mapped_column(String(20), nullable=False)
     channel: Mapped[str] = mapped_column(String(20), nullable=False)
     subject: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     body: Mapped[str] = mapped_column(Text, nullable=False)
-    data: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    data: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT)
     status: Mapped[str] = mapped_column(String(20), default="pending")
     attempts: Mapped[int] = mapped_column(Integer, default=0)
     scheduled_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     __table_args__ = (
         Index("ix_notifications_user_status", "user_id", "status"),
-        Index("ix_notifications_scheduled", "scheduled_at", "status"),
+        Index(
+            "ix_notifications_pending_due",
+            "scheduled_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
+
+
+INSERT_TRADE_LOG = insert(TradeLog)
+INSERT_NOTIFICATION = insert(Notification)
+INSERT_USER_SESSION = insert(UserSessionDB)
+"""
+Core INSERT statements for hot write paths, built once at import.
+
+Execute them with a list of row dicts (keyed by column name) for
+executemany semantics, bypassing the ORM unit of work::
+
+    await session.execute(INSERT_TRADE_LOG, [row, ...])
+"""
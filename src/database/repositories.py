@@ -7,13 +7,35 @@ Concrete implementations of repository interfaces using SQLAlchemy.
 :license: MIT
 """
 
+import asyncio
+import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, TypeVar
-
-from sqlalchemy import and_, delete, select, update
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, TypeVar
+from uuid import uuid4
+
+from sqlalchemy import (
+    DateTime,
+    Row,
+    Select,
+    and_,
+    bindparam,
+    delete,
+    event,
+    exists,
+    func,
+    insert,
+    inspect,
+    lambda_stmt,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload
 
+from src.cache.redis import RedisCache
 from src.core.repositories import (
     BaseRepository,
     RulesRepository,
@@ -21,6 +43,7 @@ from src.core.repositories import (
     TradeLogRepository,
 )
 from src.database.models import (
+    ERROR_MESSAGE_LENGTH,
     BrokerAccount,
     TradeLog,
     TradingRule,
@@ -32,6 +55,141 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+SESSION_CACHE_TTL = 30
+"""Seconds a session read from Postgres is served from Redis."""
+
+_PENDING_INVALIDATIONS = "pending_session_invalidations"
+"""``Session.info`` key of cache keys to drop when the transaction commits."""
+
+_UTC_NOW = func.timezone("UTC", func.now(), type_=DateTime)
+"""Database clock as naive UTC, matching ``UserSessionDB.expires_at``."""
+
+STREAM_BATCH_SIZE = 500
+"""Rows fetched per round-trip when streaming large result sets."""
+
+_NO_LAZY_SQL = raiseload("*", sql_only=True)
+"""List query option: lazy loads that would emit SQL raise instead."""
+
+
+_RULE_FIELDS = (
+    "name",
+    "description",
+    "is_active",
+    "priority",
+    "symbol_pattern",
+    "exchange",
+    "position_type",
+    "take_profit",
+    "stop_loss",
+    "time_conditions",
+)
+"""TradingRule columns written by ``PostgresRulesRepository.save_rules``."""
+
+
+def _upsert_rules() -> Insert:
+    """
+    Build the INSERT ... ON CONFLICT statement used by ``save_rules``.
+
+    A conflicting row is only rewritten when it belongs to the same user
+    and one of the saved fields actually changed, so resaving a rule set
+    leaves unchanged rules untouched.
+    """
+    stmt = pg_insert(TradingRule)
+    excluded = stmt.excluded
+    table = TradingRule.__table__.c
+    return stmt.on_conflict_do_update(
+        index_elements=[TradingRule.id],
+        set_={
+            **{name: excluded[name] for name in _RULE_FIELDS},
+            "updated_at": func.now(),
+        },
+        where=and_(
+            TradingRule.user_id == excluded.user_id,
+            tuple_(*(table[name] for name in _RULE_FIELDS)).is_distinct_from(
+                tuple_(*(excluded[name] for name in _RULE_FIELDS))
+            ),
+        ),
+    )
+
+
+_UPSERT_RULES = _upsert_rules()
+
+_TRADE_HISTORY_COLUMNS = (
+    TradeLog.id,
+    TradeLog.symbol,
+    TradeLog.exchange,
+    TradeLog.side,
+    TradeLog.quantity,
+    TradeLog.price,
+    TradeLog.order_id,
+    TradeLog.order_type,
+    TradeLog.trigger_type,
+    TradeLog.trigger_price,
+    TradeLog.pnl,
+    TradeLog.status,
+    TradeLog.executed_at,
+)
+"""TradeLog columns returned as trade history records."""
+
+_COPY_KEYS = (
+    "external_id",
+    "user_id",
+    "broker_account_id",
+    "rule_id",
+    "symbol",
+    "exchange",
+    "side",
+    "quantity",
+    "price",
+    "order_id",
+    "order_type",
+    "trigger_type",
+    "trigger_price",
+    "pnl",
+    "status",
+    "error_message",
+)
+_COPY_COLUMNS = [*_COPY_KEYS, "metadata"]
+"""trade_logs columns loaded by COPY; id and executed_at use defaults."""
+
+_USER_BY_EMAIL = lambda_stmt(
+    lambda: select(User).where(User.email == bindparam("email"))
+)
+_USER_EXISTS = lambda_stmt(lambda: select(exists().where(User.id == bindparam("id"))))
+_ACCOUNT_EXISTS = lambda_stmt(
+    lambda: select(exists().where(BrokerAccount.id == bindparam("id")))
+)
+_ACCOUNT_BY_USER_AND_BROKER = lambda_stmt(
+    lambda: select(BrokerAccount).where(
+        BrokerAccount.user_id == bindparam("user_id"),
+        BrokerAccount.broker_id == bindparam("broker_id"),
+    )
+)
+_ACTIVE_ACCOUNT_BY_USER = lambda_stmt(
+    lambda: select(BrokerAccount).where(
+        BrokerAccount.user_id == bindparam("user_id"),
+        BrokerAccount.is_active == True,
+    )
+)
+"""Per-request lookups, built once; parameters are passed at execute."""
+
+
+def _column_values(entity: Any) -> Dict[str, Any]:
+    """
+    Get the column attributes set on an entity, without primary keys.
+
+    :param entity: Mapped instance carrying the new values.
+    :type entity: Any
+    :returns: Attribute names mapped to values for an UPDATE.
+    :rtype: Dict[str, Any]
+    """
+    return {
+        attr.key: entity.__dict__[attr.key]
+        for attr in inspect(entity).mapper.column_attrs
+        if attr.key in entity.__dict__
+        and not any(column.primary_key for column in attr.columns)
+    }
+
 
 class PostgresUserRepository(BaseRepository[User]):
     """
@@ -41,6 +199,7 @@ class PostgresUserRepository(BaseRepository[User]):
     """
 
     model_class = User
+    _FILTER_COLUMNS = frozenset(attr.key for attr in User.__mapper__.column_attrs)
 
     def __init__(self, session: AsyncSession) -> None:
         """
@@ -60,8 +219,7 @@ class PostgresUserRepository(BaseRepository[User]):
         :returns: User or None.
         :rtype: Optional[User]
         """
-        result = await self.session.execute(select(User).where(User.id == id))
-        return result.scalar_one_or_none()
+        return await self.session.get(User, id)
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -72,7 +230,7 @@ class PostgresUserRepository(BaseRepository[User]):
         :returns: User or None.
         :rtype: Optional[User]
         """
-        result = await self.session.execute(select(User).where(User.email == email))
+        result = await self.session.execute(_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
     async def get_all(self) -> List[User]:
@@ -94,10 +252,9 @@ class PostgresUserRepository(BaseRepository[User]):
         :returns: Matching users.
         :rtype: List[User]
         """
-        query = select(User)
-        for key, value in filters.items():
-            if hasattr(User, key):
-                query = query.where(getattr(User, key) == value)
+        query = select(User).filter_by(
+            **{k: v for k, v in filters.items() if k in self._FILTER_COLUMNS}
+        )
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
@@ -126,17 +283,14 @@ class PostgresUserRepository(BaseRepository[User]):
         :returns: Updated user or None.
         :rtype: Optional[User]
         """
-        existing = await self.get(id)
-        if not existing:
-            return None
-
-        for key, value in entity.__dict__.items():
-            if not key.startswith("_") and hasattr(existing, key):
-                setattr(existing, key, value)
+        values = _column_values(entity)
+        if not values:
+            return await self.get(id)
 
-        await self.session.flush()
-        await self.session.refresh(existing)
-        return existing
+        result = await self.session.execute(
+            update(User).where(User.id == id).values(**values).returning(User)
+        )
+        return result.scalar_one_or_none()
 
     async def delete(self, id: str) -> bool:
         """
@@ -159,27 +313,91 @@ class PostgresUserRepository(BaseRepository[User]):
         :returns: True if exists.
         :rtype: bool
         """
-        result = await self.session.execute(
-            select(User.id).where(User.id == id).limit(1)
-        )
-        return result.scalar_one_or_none() is not None
+        result = await self.session.execute(_USER_EXISTS, {"id": id})
+        return bool(result.scalar())
 
 
 class PostgresSessionRepository(SessionRepository):
     """
     PostgreSQL implementation for session repository.
 
+    Session lookups run on every authenticated request, so when a Redis
+    cache is given they are read through it: hits skip Postgres, misses
+    are stored for ``cache_ttl`` seconds, and every write invalidates
+    the user's entry after the transaction commits.
+
     :ivar session: Database session.
+    :ivar cache: Optional Redis read-through cache.
+    :ivar cache_ttl: Seconds a cached session is served.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: Optional[RedisCache] = None,
+        cache_ttl: int = SESSION_CACHE_TTL,
+    ) -> None:
         """
         Initialize repository.
 
         :param session: Database session.
         :type session: AsyncSession
+        :param cache: Redis cache for session lookups.
+        :type cache: Optional[RedisCache]
+        :param cache_ttl: Cache entry lifetime in seconds.
+        :type cache_ttl: int
         """
         self.session = session
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self._drop_tasks: Set[asyncio.Task] = set()
+
+    def _cache_key(self, user_id: str) -> str:
+        """Get the cache key for a user's session."""
+        return f"session:{user_id}"
+
+    def _invalidate(self, user_id: str) -> None:
+        """
+        Drop a user's cached session once the current transaction commits.
+
+        Deleting the entry before the commit would let a concurrent
+        ``get_session`` re-cache the old row in between, so keys are
+        collected on the session and removed from its ``after_commit``
+        hook; a rollback discards them.
+
+        :param user_id: User whose session changed.
+        :type user_id: str
+        """
+        if self.cache is None:
+            return
+        info = self.session.info
+        if _PENDING_INVALIDATIONS not in info:
+            info[_PENDING_INVALIDATIONS] = set()
+            sync_session = self.session.sync_session
+            event.listen(sync_session, "after_commit", self._after_commit)
+            event.listen(sync_session, "after_rollback", self._after_rollback)
+        info[_PENDING_INVALIDATIONS].add(self._cache_key(user_id))
+
+    def _after_commit(self, sync_session: Session) -> None:
+        """Schedule deletion of the keys invalidated by the transaction."""
+        keys = sync_session.info.get(_PENDING_INVALIDATIONS)
+        if keys:
+            task = asyncio.get_running_loop().create_task(self._drop_cached(list(keys)))
+            self._drop_tasks.add(task)
+            task.add_done_callback(self._drop_tasks.discard)
+            keys.clear()
+
+    def _after_rollback(self, sync_session: Session) -> None:
+        """Forget invalidations of a rolled back transaction."""
+        sync_session.info.get(_PENDING_INVALIDATIONS, set()).clear()
+
+    async def _drop_cached(self, keys: List[str]) -> None:
+        """Delete committed-stale session entries from the cache."""
+        for key in keys:
+            try:
+                await self.cache.delete(key)
+            except Exception as e:
+                logger.warning("Failed to invalidate cached %s: %s", key, e)
 
     async def get_session(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -190,28 +408,46 @@ class PostgresSessionRepository(SessionRepository):
         :returns: Session data or None.
         :rtype: Optional[Dict[str, Any]]
         """
+        if self.cache is not None:
+            cached = await self.cache.get(self._cache_key(user_id))
+            if (
+                cached
+                and datetime.fromisoformat(cached["expires_at"]) > datetime.utcnow()
+            ):
+                return cached
+
         result = await self.session.execute(
-            select(UserSessionDB)
+            select(
+                UserSessionDB.id,
+                UserSessionDB.user_id,
+                UserSessionDB.broker_account_id,
+                UserSessionDB.expires_at,
+                UserSessionDB.last_activity,
+            )
             .where(
                 and_(
                     UserSessionDB.user_id == user_id,
                     UserSessionDB.is_active == True,
-                    UserSessionDB.expires_at > datetime.utcnow(),
+                    UserSessionDB.expires_at > _UTC_NOW,
                 )
             )
             .order_by(UserSessionDB.created_at.desc())
             .limit(1)
         )
-        session_db = result.scalar_one_or_none()
-        if session_db:
-            return {
-                "session_id": session_db.id,
-                "user_id": session_db.user_id,
-                "broker_account_id": session_db.broker_account_id,
-                "expires_at": session_db.expires_at.isoformat(),
-                "last_activity": session_db.last_activity.isoformat(),
-            }
-        return None
+        session_db = result.one_or_none()
+        if not session_db:
+            return None
+
+        data = {
+            "session_id": session_db.id,
+            "user_id": session_db.user_id,
+            "broker_account_id": session_db.broker_account_id,
+            "expires_at": session_db.expires_at.isoformat(),
+            "last_activity": session_db.last_activity.isoformat(),
+        }
+        if self.cache is not None:
+            await self.cache.set(self._cache_key(user_id), data, ttl=self.cache_ttl)
+        return data
 
     async def save_session(
         self,
@@ -231,21 +467,18 @@ class PostgresSessionRepository(SessionRepository):
         :returns: True if saved.
         :rtype: bool
         """
-        from datetime import timedelta
-
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl or 86400)
-
         session_db = UserSessionDB(
             id=session_data.get("session_id"),
             user_id=user_id,
             broker_account_id=session_data.get("broker_account_id"),
             ip_address=session_data.get("ip_address"),
             user_agent=session_data.get("user_agent"),
-            expires_at=expires_at,
+            expires_at=_UTC_NOW + timedelta(seconds=ttl or 86400),
             is_active=True,
         )
         self.session.add(session_db)
         await self.session.flush()
+        self._invalidate(user_id)
         return True
 
     async def delete_session(self, user_id: str) -> bool:
@@ -262,6 +495,7 @@ class PostgresSessionRepository(SessionRepository):
             .where(UserSessionDB.user_id == user_id)
             .values(is_active=False)
         )
+        self._invalidate(user_id)
         return result.rowcount > 0
 
     async def refresh_session(self, user_id: str, ttl: int) -> bool:
@@ -275,9 +509,6 @@ class PostgresSessionRepository(SessionRepository):
         :returns: True if refreshed.
         :rtype: bool
         """
-        from datetime import timedelta
-
-        new_expires = datetime.utcnow() + timedelta(seconds=ttl)
         result = await self.session.execute(
             update(UserSessionDB)
             .where(
@@ -286,8 +517,12 @@ class PostgresSessionRepository(SessionRepository):
                     UserSessionDB.is_active == True,
                 )
             )
-            .values(expires_at=new_expires, last_activity=datetime.utcnow())
+            .values(
+                expires_at=_UTC_NOW + timedelta(seconds=ttl),
+                last_activity=func.now(),
+            )
         )
+        self._invalidate(user_id)
         return result.rowcount > 0
 
     async def get_all_active_sessions(self) -> List[str]:
@@ -302,13 +537,33 @@ class PostgresSessionRepository(SessionRepository):
             .where(
                 and_(
                     UserSessionDB.is_active == True,
-                    UserSessionDB.expires_at > datetime.utcnow(),
+                    UserSessionDB.expires_at > _UTC_NOW,
                 )
             )
             .distinct()
         )
         return [row[0] for row in result.fetchall()]
 
+    async def delete_expired(self) -> int:
+        """
+        Delete expired sessions.
+
+        The DELETE returns the owning user IDs, so their cache entries
+        are dropped without a separate SELECT.
+
+        :returns: Number of sessions deleted.
+        :rtype: int
+        """
+        result = await self.session.execute(
+            delete(UserSessionDB)
+            .where(UserSessionDB.expires_at <= _UTC_NOW)
+            .returning(UserSessionDB.user_id)
+        )
+        user_ids = result.scalars().all()
+        for user_id in set(user_ids):
+            self._invalidate(user_id)
+        return len(user_ids)
+
 
 class PostgresRulesRepository(RulesRepository):
     """
@@ -337,6 +592,7 @@ class PostgresRulesRepository(RulesRepository):
         """
         result = await self.session.execute(
             select(TradingRule)
+            .options(_NO_LAZY_SQL)
             .where(TradingRule.user_id == user_id)
             .order_by(TradingRule.priority)
         )
@@ -368,6 +624,10 @@ class PostgresRulesRepository(RulesRepository):
         """
         Save rules for user.
 
+        Rules carrying an ``id`` are upserted in place; rules without one
+        get a new ID here so every row binds the same columns. The user's
+        rules missing from ``rules`` are deleted.
+
         :param user_id: User ID.
         :type user_id: str
         :param rules: Rules configuration.
@@ -375,28 +635,36 @@ class PostgresRulesRepository(RulesRepository):
         :returns: True if saved.
         :rtype: bool
         """
-
-        await self.session.execute(
-            delete(TradingRule).where(TradingRule.user_id == user_id)
-        )
-
+        rows = []
+        kept_ids = []
         for rule_data in rules.get("rules", []):
-            rule = TradingRule(
-                user_id=user_id,
-                name=rule_data.get("name", "Unnamed Rule"),
-                description=rule_data.get("description"),
-                is_active=rule_data.get("is_active", True),
-                priority=rule_data.get("priority", 100),
-                symbol_pattern=rule_data.get("symbol_pattern"),
-                exchange=rule_data.get("exchange"),
-                position_type=rule_data.get("position_type"),
-                take_profit=rule_data.get("take_profit", {}),
-                stop_loss=rule_data.get("stop_loss", {}),
-                time_conditions=rule_data.get("time_conditions", {}),
+            rule_id = rule_data.get("id")
+            if rule_id:
+                kept_ids.append(rule_id)
+            rows.append(
+                {
+                    "id": rule_id or str(uuid4()),
+                    "user_id": user_id,
+                    "name": rule_data.get("name", "Unnamed Rule"),
+                    "description": rule_data.get("description"),
+                    "is_active": rule_data.get("is_active", True),
+                    "priority": rule_data.get("priority", 100),
+                    "symbol_pattern": rule_data.get("symbol_pattern"),
+                    "exchange": rule_data.get("exchange"),
+                    "position_type": rule_data.get("position_type"),
+                    "take_profit": rule_data.get("take_profit", {}),
+                    "stop_loss": rule_data.get("stop_loss", {}),
+                    "time_conditions": rule_data.get("time_conditions", {}),
+                }
             )
-            self.session.add(rule)
 
-        await self.session.flush()
+        await self.session.execute(
+            delete(TradingRule).where(
+                TradingRule.user_id == user_id, TradingRule.id.not_in(kept_ids)
+            )
+        )
+        if rows:
+            await self.session.execute(_UPSERT_RULES, rows)
         return True
 
     async def delete_rules(self, user_id: str) -> bool:
@@ -422,10 +690,7 @@ class PostgresRulesRepository(RulesRepository):
         :returns: Trading rule or None.
         :rtype: Optional[TradingRule]
         """
-        result = await self.session.execute(
-            select(TradingRule).where(TradingRule.id == rule_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.session.get(TradingRule, rule_id)
 
     async def get(self, rule_id: str) -> Optional[TradingRule]:
         """Alias for get_rule_by_id."""
@@ -483,6 +748,7 @@ class PostgresRulesRepository(RulesRepository):
         """
         result = await self.session.execute(
             select(TradingRule)
+            .options(_NO_LAZY_SQL)
             .where(TradingRule.user_id == user_id)
             .order_by(TradingRule.priority)
         )
@@ -512,7 +778,11 @@ class PostgresRulesRepository(RulesRepository):
         :returns: List of trading rules.
         :rtype: List[TradingRule]
         """
-        query = select(TradingRule).where(TradingRule.user_id == user_id)
+        query = (
+            select(TradingRule)
+            .options(_NO_LAZY_SQL)
+            .where(TradingRule.user_id == user_id)
+        )
 
         if is_active is not None:
             query = query.where(TradingRule.is_active == is_active)
@@ -576,27 +846,113 @@ class PostgresTradeLogRepository(TradeLogRepository):
         :returns: Trade log ID.
         :rtype: str
         """
-        trade_log = TradeLog(
-            user_id=user_id,
-            broker_account_id=trade_data.get("broker_account_id"),
-            rule_id=trade_data.get("rule_id"),
-            symbol=trade_data["symbol"],
-            exchange=trade_data["exchange"],
-            side=trade_data["side"],
-            quantity=trade_data["quantity"],
-            price=trade_data["price"],
-            order_id=trade_data.get("order_id"),
-            order_type=trade_data.get("order_type", "MARKET"),
-            trigger_type=trade_data.get("trigger_type"),
-            trigger_price=trade_data.get("trigger_price"),
-            pnl=trade_data.get("pnl"),
-            status=trade_data.get("status", "EXECUTED"),
-            error_message=trade_data.get("error_message"),
-            metadata_=trade_data.get("metadata", {}),
-        )
+        trade_log = TradeLog(**self._trade_row(user_id, trade_data))
         self.session.add(trade_log)
         await self.session.flush()
-        return trade_log.id
+        return str(trade_log.id)
+
+    async def log_trades(
+        self,
+        user_id: str,
+        trades: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Log many trade executions in one bulk load.
+
+        On asyncpg the rows are streamed with ``COPY ... FROM STDIN`` in
+        binary format; other drivers fall back to a multi-row INSERT.
+        The load runs on its own connection and commits on return,
+        independently of this repository's session, like the other
+        audit writers.
+
+        :param user_id: User ID.
+        :type user_id: str
+        :param trades: Trade data, as accepted by ``log_trade``.
+        :type trades: List[Dict[str, Any]]
+        :returns: Number of trades logged.
+        :rtype: int
+        """
+        if not trades:
+            return 0
+
+        rows = [self._trade_row(user_id, trade_data) for trade_data in trades]
+        async with self.session.bind.connect() as conn:
+            if conn.dialect.driver == "asyncpg":
+                raw = await conn.get_raw_connection()
+                await raw.driver_connection.copy_records_to_table(
+                    TradeLog.__tablename__,
+                    records=[
+                        (
+                            *(row[key] for key in _COPY_KEYS),
+                            json.dumps(row["metadata_"]),
+                        )
+                        for row in rows
+                    ],
+                    columns=_COPY_COLUMNS,
+                )
+            else:
+                await conn.execute(
+                    insert(TradeLog.__table__),
+                    [
+                        {key: row[key] for key in _COPY_KEYS}
+                        | {"metadata": row["metadata_"]}
+                        for row in rows
+                    ],
+                )
+                await conn.commit()
+        return len(rows)
+
+    @staticmethod
+    def _trade_row(user_id: str, trade_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map trade data to TradeLog attribute values."""
+        error_message = trade_data.get("error_message")
+        if error_message:
+            error_message = error_message[:ERROR_MESSAGE_LENGTH]
+
+        return {
+            "external_id": trade_data.get("external_id"),
+            "user_id": user_id,
+            "broker_account_id": trade_data.get("broker_account_id"),
+            "rule_id": trade_data.get("rule_id"),
+            "symbol": trade_data["symbol"],
+            "exchange": trade_data["exchange"],
+            "side": trade_data["side"],
+            "quantity": trade_data["quantity"],
+            "price": trade_data["price"],
+            "order_id": trade_data.get("order_id"),
+            "order_type": trade_data.get("order_type", "MARKET"),
+            "trigger_type": trade_data.get("trigger_type"),
+            "trigger_price": trade_data.get("trigger_price"),
+            "pnl": trade_data.get("pnl"),
+            "status": trade_data.get("status", "EXECUTED"),
+            "error_message": error_message,
+            "metadata_": trade_data.get("metadata", {}),
+        }
+
+    def _history_query(
+        self,
+        user_id: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        limit: Optional[int],
+    ) -> Select:
+        """Build the trade history query, newest first."""
+        query = select(*_TRADE_HISTORY_COLUMNS).where(TradeLog.user_id == user_id)
+
+        if start_date:
+            query = query.where(TradeLog.executed_at >= start_date)
+        if end_date:
+            query = query.where(TradeLog.executed_at <= end_date)
+
+        return query.order_by(TradeLog.executed_at.desc()).limit(limit)
+
+    @staticmethod
+    def _history_record(row: Row) -> Dict[str, Any]:
+        """Convert a trade history row to its API dict."""
+        record = dict(row._mapping)
+        record["id"] = str(row.id)
+        record["executed_at"] = row.executed_at.isoformat()
+        return record
 
     async def get_trade_history(
         self,
@@ -619,36 +975,44 @@ class PostgresTradeLogRepository(TradeLogRepository):
         :returns: List of trade records.
         :rtype: List[Dict[str, Any]]
         """
-        query = select(TradeLog).where(TradeLog.user_id == user_id)
+        result = await self.session.execute(
+            self._history_query(user_id, start_date, end_date, limit)
+        )
+        return [self._history_record(row) for row in result]
 
-        if start_date:
-            query = query.where(TradeLog.executed_at >= start_date)
-        if end_date:
-            query = query.where(TradeLog.executed_at <= end_date)
+    async def stream_trade_history(
+        self,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream trade history for user.
 
-        query = query.order_by(TradeLog.executed_at.desc()).limit(limit)
+        Rows are fetched from a server-side cursor ``batch_size`` at a
+        time, so exports and long histories use bounded memory.
 
-        result = await self.session.execute(query)
-        trades = result.scalars().all()
-
-        return [
-            {
-                "id": t.id,
-                "symbol": t.symbol,
-                "exchange": t.exchange,
-                "side": t.side,
-                "quantity": t.quantity,
-                "price": t.price,
-                "order_id": t.order_id,
-                "order_type": t.order_type,
-                "trigger_type": t.trigger_type,
-                "trigger_price": t.trigger_price,
-                "pnl": t.pnl,
-                "status": t.status,
-                "executed_at": t.executed_at.isoformat(),
-            }
-            for t in trades
-        ]
+        :param user_id: User ID.
+        :type user_id: str
+        :param start_date: Start date filter.
+        :type start_date: Optional[datetime]
+        :param end_date: End date filter.
+        :type end_date: Optional[datetime]
+        :param limit: Max records, or None for all.
+        :type limit: Optional[int]
+        :param batch_size: Rows fetched per round-trip.
+        :type batch_size: int
+        :yields: Trade records, newest first.
+        :rtype: AsyncIterator[Dict[str, Any]]
+        """
+        query = self._history_query(user_id, start_date, end_date, limit)
+        result = await self.session.stream(
+            query.execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield self._history_record(row)
 
     async def get_by_user(
         self,
@@ -677,7 +1041,9 @@ class PostgresTradeLogRepository(TradeLogRepository):
         :returns: List of trade logs.
         :rtype: List[TradeLog]
         """
-        query = select(TradeLog).where(TradeLog.user_id == user_id)
+        query = (
+            select(TradeLog).options(_NO_LAZY_SQL).where(TradeLog.user_id == user_id)
+        )
 
         if symbol:
             query = query.where(TradeLog.symbol == symbol)
@@ -700,6 +1066,9 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
     """
 
     model_class = BrokerAccount
+    _FILTER_COLUMNS = frozenset(
+        attr.key for attr in BrokerAccount.__mapper__.column_attrs
+    )
 
     def __init__(self, session: AsyncSession) -> None:
         """
@@ -719,10 +1088,7 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
         :returns: Broker account or None.
         :rtype: Optional[BrokerAccount]
         """
-        result = await self.session.execute(
-            select(BrokerAccount).where(BrokerAccount.id == id)
-        )
-        return result.scalar_one_or_none()
+        return await self.session.get(BrokerAccount, id)
 
     async def get_by_user_and_broker(
         self, user_id: str, broker_id: str
@@ -738,12 +1104,7 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
         :rtype: Optional[BrokerAccount]
         """
         result = await self.session.execute(
-            select(BrokerAccount).where(
-                and_(
-                    BrokerAccount.user_id == user_id,
-                    BrokerAccount.broker_id == broker_id,
-                )
-            )
+            _ACCOUNT_BY_USER_AND_BROKER, {"user_id": user_id, "broker_id": broker_id}
         )
         return result.scalar_one_or_none()
 
@@ -754,7 +1115,7 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
         :returns: List of accounts.
         :rtype: List[BrokerAccount]
         """
-        result = await self.session.execute(select(BrokerAccount))
+        result = await self.session.execute(select(BrokerAccount).options(_NO_LAZY_SQL))
         return list(result.scalars().all())
 
     async def find(self, **filters: Any) -> List[BrokerAccount]:
@@ -766,10 +1127,13 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
         :returns: Matching accounts.
         :rtype: List[BrokerAccount]
         """
-        query = select(BrokerAccount)
-        for key, value in filters.items():
-            if hasattr(BrokerAccount, key):
-                query = query.where(getattr(BrokerAccount, key) == value)
+        query = (
+            select(BrokerAccount)
+            .options(_NO_LAZY_SQL)
+            .filter_by(
+                **{k: v for k, v in filters.items() if k in self._FILTER_COLUMNS}
+            )
+        )
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
@@ -798,17 +1162,17 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
         :returns: Updated account or None.
         :rtype: Optional[BrokerAccount]
         """
-        existing = await self.get(id)
-        if not existing:
-            return None
-
-        for key, value in entity.__dict__.items():
-            if not key.startswith("_") and hasattr(existing, key):
-                setattr(existing, key, value)
+        values = _column_values(entity)
+        if not values:
+            return await self.get(id)
 
-        await self.session.flush()
-        await self.session.refresh(existing)
-        return existing
+        result = await self.session.execute(
+            update(BrokerAccount)
+            .where(BrokerAccount.id == id)
+            .values(**values)
+            .returning(BrokerAccount)
+        )
+        return result.scalar_one_or_none()
 
     async def update_tokens(
         self,
@@ -865,10 +1229,8 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
         :returns: True if exists.
         :rtype: bool
         """
-        result = await self.session.execute(
-            select(BrokerAccount.id).where(BrokerAccount.id == id).limit(1)
-        )
-        return result.scalar_one_or_none() is not None
+        result = await self.session.execute(_ACCOUNT_EXISTS, {"id": id})
+        return bool(result.scalar())
 
     async def get_active_by_user(self, user_id: str) -> Optional[BrokerAccount]:
         """
@@ -880,12 +1242,7 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
         :rtype: Optional[BrokerAccount]
         """
         result = await self.session.execute(
-            select(BrokerAccount).where(
-                and_(
-                    BrokerAccount.user_id == user_id,
-                    BrokerAccount.is_active == True,
-                )
-            )
+            _ACTIVE_ACCOUNT_BY_USER, {"user_id": user_id}
         )
         return result.scalar_one_or_none()
 
@@ -899,7 +1256,9 @@ class PostgresBrokerAccountRepository(BaseRepository[BrokerAccount]):
         :rtype: List[BrokerAccount]
         """
         result = await self.session.execute(
-            select(BrokerAccount).where(BrokerAccount.user_id == user_id)
+            select(BrokerAccount)
+            .options(_NO_LAZY_SQL)
+            .where(BrokerAccount.user_id == user_id)
         )
         return list(result.scalars().all())
 
@@ -11,14 +11,24 @@ and common operations used throughout the trading framework.
 import csv
 import hashlib
 import logging
-from io import StringIO
+from io import StringIO, TextIOWrapper
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, Iterable, List, Optional, Union
 
 import dateutil.parser
 
 log = logging.getLogger(__name__)
 
+_MF_FLOAT_FIELDS = (
+    "minimum_purchase_amount",
+    "purchase_amount_multiplier",
+    "minimum_additional_purchase_amount",
+    "minimum_redemption_quantity",
+    "redemption_quantity_multiplier",
+    "last_price",
+)
+_MF_BOOL_FIELDS = ("purchase_allowed", "redemption_allowed")
+
 
 def generate_checksum(api_key: str, token: str, api_secret: str) -> str:
     """
@@ -142,14 +152,35 @@ def format_date(d: Optional[date]) -> Optional[str]:
     return str(d)
 
 
+def _csv_lines(
+    data: Union[str, bytes, bytearray, memoryview, IO[bytes]],
+) -> Iterable[str]:
+    """
+    Wrap CSV payloads as an iterable of text lines for ``csv`` readers.
+
+    Binary file-like objects (e.g. a streamed ``response.raw``) are decoded
+    incrementally so the full body never has to be buffered.
+
+    :param data: CSV data as string, bytes or a binary stream.
+    :type data: Union[str, bytes, IO[bytes]]
+    :returns: Iterable of CSV text lines.
+    :rtype: Iterable[str]
+    """
+    if isinstance(data, str):
+        return StringIO(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return StringIO(bytes(data).decode("utf-8").strip())
+    return TextIOWrapper(data, encoding="utf-8", newline="")
+
+
 def parse_instruments_csv(
-    data: Union[str, bytes, bytearray, memoryview],
+    data: Union[str, bytes, bytearray, memoryview, IO[bytes]],
 ) -> List[Dict[str, Any]]:
     """
     Parse instruments CSV data from the API.
 
-    :param data: CSV data as string or bytes.
-    :type data: Union[str, bytes]
+    :param data: CSV data as string, bytes or a binary stream.
+    :type data: Union[str, bytes, IO[bytes]]
     :returns: List of instrument dictionaries.
     :rtype: List[Dict[str, Any]]
 
@@ -159,11 +190,8 @@ def parse_instruments_csv(
         for inst in instruments:
             print(inst["tradingsymbol"], inst["instrument_token"])
     """
-    if isinstance(data, (bytes, bytearray, memoryview)):
-        data = bytes(data).decode("utf-8").strip()
-
     records = []
-    reader = csv.DictReader(StringIO(data))
+    reader = csv.DictReader(_csv_lines(data))
 
     for row in reader:
         row["instrument_token"] = int(row.get("instrument_token", 0))
@@ -183,14 +211,33 @@ def parse_instruments_csv(
     return records
 
 
+def _parse_iso_date(value: str) -> Optional[date]:
+    """
+    Parse a ``YYYY-MM-DD`` date, falling back to the generic parser.
+
+    :param value: The date string to parse.
+    :type value: str
+    :returns: Parsed date object or None if parsing fails.
+    :rtype: Optional[date]
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return parse_date(value)
+
+
 def parse_mf_instruments_csv(
-    data: Union[str, bytes, bytearray, memoryview],
+    data: Union[str, bytes, bytearray, memoryview, IO[bytes]],
 ) -> List[Dict[str, Any]]:
     """
     Parse mutual fund instruments CSV data from the API.
 
-    :param data: CSV data as string or bytes.
-    :type data: Union[str, bytes]
+    Rows are read with a plain ``csv.reader`` and zipped against the
+    header once, which avoids the per-row overhead of ``DictReader``
+    on the multi-megabyte MF dump.
+
+    :param data: CSV data as string, bytes or a binary stream.
+    :type data: Union[str, bytes, IO[bytes]]
     :returns: List of mutual fund instrument dictionaries.
     :rtype: List[Dict[str, Any]]
 
@@ -198,32 +245,22 @@ def parse_mf_instruments_csv(
 
         mf_instruments = parse_mf_instruments_csv(csv_data)
     """
-    if isinstance(data, (bytes, bytearray, memoryview)):
-        data = bytes(data).decode("utf-8").strip()
-
     records = []
-    reader = csv.DictReader(StringIO(data))
+    reader = csv.reader(_csv_lines(data))
+    header = next(reader, [])
 
-    for row in reader:
-        row["minimum_purchase_amount"] = float(row.get("minimum_purchase_amount", 0))
-        row["purchase_amount_multiplier"] = float(
-            row.get("purchase_amount_multiplier", 0)
-        )
-        row["minimum_additional_purchase_amount"] = float(
-            row.get("minimum_additional_purchase_amount", 0)
-        )
-        row["minimum_redemption_quantity"] = float(
-            row.get("minimum_redemption_quantity", 0)
-        )
-        row["redemption_quantity_multiplier"] = float(
-            row.get("redemption_quantity_multiplier", 0)
-        )
-        row["purchase_allowed"] = bool(int(row.get("purchase_allowed", 0)))
-        row["redemption_allowed"] = bool(int(row.get("redemption_allowed", 0)))
-        row["last_price"] = float(row.get("last_price", 0))
+    for values in reader:
+        if not values:
+            continue
+
+        row = dict(zip(header, values))
+        for field in _MF_FLOAT_FIELDS:
+            row[field] = float(row.get(field, 0))
+        for field in _MF_BOOL_FIELDS:
+            row[field] = bool(int(row.get(field, 0)))
         last_price_date = row.get("last_price_date", "")
         if last_price_date and len(last_price_date) == 10:
-            row["last_price_date"] = parse_date(last_price_date)
+            row["last_price_date"] = _parse_iso_date(last_price_date)
         else:
             row["last_price_date"] = None
 
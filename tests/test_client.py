@@ -0,0 +1,200 @@
+"""
+Tests for KiteClient.
+
+Tests GTT payload building, request encoding helpers, batched order
+calls and streamed instrument dumps.
+"""
+
+import io
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import sys
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+
+from src.brokers.kite.client import KiteClient
+from src.exceptions import InputException, OrderException
+
+
+@pytest.fixture
+def client():
+    """Create a client without touching the network."""
+    return KiteClient(api_key="test_key", access_token="test_token")
+
+
+GTT_ORDER = {
+    "transaction_type": "SELL",
+    "quantity": "10",
+    "order_type": "LIMIT",
+    "product": "CNC",
+    "price": 1500,
+}
+
+
+class TestGTTPayload:
+    """Tests for KiteClient._get_gtt_payload."""
+
+    def test_payload_is_valid_json(self, client):
+        """Test condition and orders decode to the expected structures."""
+        payload = client._get_gtt_payload(
+            KiteClient.GTT_TYPE_OCO,
+            'WEIRD"SYM',
+            "NSE",
+            [1400.0, 1600.5],
+            1500.25,
+            [GTT_ORDER, GTT_ORDER],
+        )
+
+        assert json.loads(payload.condition) == {
+            "exchange": "NSE",
+            "tradingsymbol": 'WEIRD"SYM',
+            "trigger_values": [1400.0, 1600.5],
+            "last_price": 1500.25,
+        }
+        orders = json.loads(payload.orders)
+        assert len(orders) == 2
+        assert orders[0] == {
+            "exchange": "NSE",
+            "tradingsymbol": 'WEIRD"SYM',
+            "transaction_type": "SELL",
+            "quantity": 10,
+            "order_type": "LIMIT",
+            "product": "CNC",
+            "price": 1500.0,
+        }
+
+    def test_trigger_count_mismatch(self, client):
+        """Test single-leg GTTs reject two trigger values."""
+        with pytest.raises(InputException):
+            client._get_gtt_payload(
+                KiteClient.GTT_TYPE_SINGLE, "INFY", "NSE", [1, 2], 1.5, [GTT_ORDER]
+            )
+
+    def test_unknown_trigger_type(self, client):
+        """Test unsupported GTT types are rejected up front."""
+        with pytest.raises(InputException, match="trigger_type"):
+            client._get_gtt_payload("three-leg", "INFY", "NSE", [1], 1.5, [GTT_ORDER])
+
+    def test_missing_order_field(self, client):
+        """Test order legs must carry every required field."""
+        order = dict(GTT_ORDER)
+        del order["price"]
+        with pytest.raises(InputException, match="price"):
+            client._get_gtt_payload(
+                KiteClient.GTT_TYPE_SINGLE, "INFY", "NSE", [1], 1.5, [order]
+            )
+
+
+def order(symbol: str) -> dict:
+    """Build place_order keyword arguments for a symbol."""
+    return {
+        "variety": KiteClient.VARIETY_REGULAR,
+        "exchange": "NSE",
+        "tradingsymbol": symbol,
+        "transaction_type": "BUY",
+        "quantity": 1,
+        "product": "CNC",
+        "order_type": "MARKET",
+    }
+
+
+class TestBatchedOrders:
+    """Tests for concurrent placement and batched margins."""
+
+    def test_place_orders_concurrent(self, client):
+        """Test results keep input order and failures are captured per order."""
+        delays = {"INFY": 0.05, "TCS": 0.0, "BAD": 0.01, "SBIN": 0.02}
+
+        def request(route, method, params=None, **kwargs):
+            symbol = params["tradingsymbol"]
+            time.sleep(delays[symbol])
+            if symbol == "BAD":
+                raise OrderException("rejected")
+            return {"order_id": f"O-{symbol}"}
+
+        client._request = MagicMock(side_effect=request)
+
+        results = client.place_orders_concurrent(
+            [order(symbol) for symbol in delays], max_workers=4
+        )
+
+        assert results[0] == "O-INFY"
+        assert results[1] == "O-TCS"
+        assert isinstance(results[2], OrderException)
+        assert results[3] == "O-SBIN"
+        assert client._request.call_count == 4
+
+    def test_concurrency_capped_by_pool_size(self):
+        """Test workers never exceed the HTTP adapter's pool size."""
+        client = KiteClient(
+            api_key="test_key", access_token="test_token", pool={"pool_maxsize": 1}
+        )
+        active = []
+        peak = []
+
+        def request(route, method, params=None, **kwargs):
+            active.append(1)
+            peak.append(len(active))
+            time.sleep(0.01)
+            active.pop()
+            return {"order_id": params["tradingsymbol"]}
+
+        client._request = MagicMock(side_effect=request)
+
+        assert client.place_orders_concurrent(
+            [order("A"), order("B"), order("C")], max_workers=8
+        ) == ["A", "B", "C"]
+        assert max(peak) == 1
+
+    def test_order_margins_batch(self, client):
+        """Test per-leg margins come from one basket request."""
+        legs = [order("INFY"), order("TCS")]
+        client._request = MagicMock(
+            return_value={
+                "orders": [{"tradingsymbol": "INFY"}, {"tradingsymbol": "TCS"}]
+            }
+        )
+
+        margins = client.order_margins_batch(legs)
+
+        assert [m["tradingsymbol"] for m in margins] == ["INFY", "TCS"]
+        client._request.assert_called_once()
+        args, kwargs = client._request.call_args
+        assert args == ("order.margins.basket", "POST")
+        assert kwargs["params"] == legs and kwargs["is_json"]
+
+    def test_order_margins_batch_empty_response(self, client):
+        """Test an empty basket response yields no margins."""
+        client._request = MagicMock(return_value=None)
+        assert client.order_margins_batch([order("INFY")]) == []
+
+
+class TestStreamedInstruments:
+    """Tests for the streamed CSV branch of KiteClient._request."""
+
+    def test_instruments_parse_stream_and_close(self, client):
+        """Test a CSV dump is parsed from the raw stream and then closed."""
+        body = (
+            b"instrument_token,exchange_token,tradingsymbol,last_price,"
+            b"expiry,strike,tick_size,lot_size\n"
+            b"408065,1594,INFY,0,,0,0.05,1\n"
+        )
+        response = MagicMock(
+            status_code=200,
+            headers={"content-type": "text/csv"},
+            raw=io.BytesIO(body),
+        )
+        response.__enter__.return_value = response
+        response.__exit__.side_effect = lambda *exc: response.raw.close()
+        client.reqsession.request = MagicMock(return_value=response)
+
+        instruments = client.instruments("NSE")
+
+        assert client.reqsession.request.call_args.kwargs["stream"] is True
+        assert [i["tradingsymbol"] for i in instruments] == ["INFY"]
+        assert instruments[0]["instrument_token"] == 408065
+        assert response.raw.closed
@@ -0,0 +1,149 @@
+"""
+Tests for the dependency injection Container.
+
+Tests lifecycles, constructor injection and scope handling.
+"""
+
+import pytest
+
+import sys
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+
+from src.core.container import Container, Lifecycle
+
+
+class Config:
+    """Dependency with a no-arg constructor."""
+
+
+class Repository:
+    """Dependency that needs Config injected."""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Service:
+    """Service depending on Repository."""
+
+    def __init__(self, repo: Repository, name: str = "svc") -> None:
+        self.repo = repo
+        self.name = name
+
+
+class LateBound:
+    """Service whose dependency is a string annotation."""
+
+    def __init__(self, config: "Config") -> None:
+        self.config = config
+
+
+class TestContainer:
+    """Tests for Container resolution."""
+
+    def test_singleton(self):
+        """Test singletons are created once."""
+        container = Container().register(Config)
+        assert container.resolve(Config) is container.resolve(Config)
+
+    def test_transient_injection(self):
+        """Test transient services get fresh instances with injected deps."""
+        container = Container()
+        container.register(Config)
+        container.register(Repository)
+        container.register(Service, lifecycle=Lifecycle.TRANSIENT)
+
+        first = container.resolve(Service)
+        second = container.resolve(Service)
+        assert first is not second
+        assert first.repo is second.repo
+        assert first.repo.config is container.resolve(Config)
+        assert first.name == "svc"
+
+    def test_forward_ref_injection(self):
+        """Test string annotations are resolved for injection."""
+        container = Container().register(Config).register(LateBound)
+        assert container.resolve(LateBound).config is container.resolve(Config)
+
+    def test_register_factory(self):
+        """Test factories receive the container."""
+        container = Container().register(Config)
+        container.register_factory(
+            Repository,
+            lambda c: Repository(c.resolve(Config)),
+            lifecycle=Lifecycle.TRANSIENT,
+        )
+        assert container.resolve(Repository).config is container.resolve(Config)
+
+    def test_register_instance(self):
+        """Test registered instances are returned as-is."""
+        config = Config()
+        container = Container().register_instance(Config, config)
+        assert container.resolve(Config) is config
+
+    def test_scoped(self):
+        """Test scoped services are shared within a scope only."""
+        container = Container()
+        container.register(Config, lifecycle=Lifecycle.SCOPED)
+
+        a1 = container.resolve(Config, scope_id="a")
+        assert container.resolve(Config, scope_id="a") is a1
+        assert container.resolve(Config, scope_id="b") is not a1
+
+        container.clear_scope("a")
+        assert container.resolve(Config, scope_id="a") is not a1
+
+    def test_scope_eviction(self):
+        """Test least recently used scopes are evicted past the limit."""
+        container = Container(max_scopes=2)
+        container.register(Config, lifecycle=Lifecycle.SCOPED)
+
+        a = container.resolve(Config, scope_id="a")
+        container.resolve(Config, scope_id="b")
+        assert container.resolve(Config, scope_id="a") is a
+        container.resolve(Config, scope_id="c")
+
+        assert container.resolve(Config, scope_id="a") is a
+        assert "b" not in container._scoped_instances
+
+    def test_enter_scope(self):
+        """Test the current scope applies to resolution and injection."""
+        container = Container()
+        container.register(Config, lifecycle=Lifecycle.SCOPED)
+        container.register(Repository, lifecycle=Lifecycle.TRANSIENT)
+
+        with container.enter_scope("req-1"):
+            config = container.resolve(Config)
+            assert container.resolve(Repository).config is config
+        assert container.resolve(Config, scope_id="req-1") is config
+
+        with pytest.raises(ValueError):
+            container.resolve(Config)
+
+    def test_scoped_requires_scope(self):
+        """Test scoped resolution without a scope fails."""
+        container = Container().register(Config, lifecycle=Lifecycle.SCOPED)
+        with pytest.raises(ValueError):
+            container.resolve(Config)
+
+    def test_seal(self):
+        """Test sealed containers resolve but reject new registrations."""
+        container = Container().register(Config).register(Repository).seal()
+
+        assert container.resolve(Repository).config is container.resolve(Config)
+        assert container.is_registered(Config)
+        with pytest.raises(RuntimeError):
+            container.register(Service)
+
+        container.clear()
+        container.register(Service)
+        assert container.is_registered(Service)
+
+    def test_unregistered(self):
+        """Test resolving unknown services raises KeyError."""
+        container = Container()
+        with pytest.raises(KeyError):
+            container.resolve(Config)
+        assert container.try_resolve(Config) is None
+        assert not container.is_registered(Config)
@@ -0,0 +1,153 @@
+"""
+Tests for database configuration.
+
+Tests engine arguments derived from DatabaseConfig and session scoping.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import sys
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+
+from src.database.connection import (
+    Database,
+    DatabaseConfig,
+    configure_database,
+    get_database,
+)
+from src.database.models import User
+
+
+class TestDatabaseConfig:
+    """Tests for DatabaseConfig engine arguments."""
+
+    def test_statement_cache(self):
+        """Test asyncpg connections cache prepared statements."""
+        config = DatabaseConfig(
+            url="postgresql+asyncpg://db/trading", statement_cache_size=250
+        )
+        url, connect_args = config.engine_args()
+
+        assert url.database == "trading"
+        assert connect_args["prepared_statement_cache_size"] == 250
+        assert connect_args["statement_cache_size"] == 250
+        assert "prepared_statement_name_func" not in connect_args
+
+    def test_pgbouncer_disables_statement_cache(self):
+        """Test the pgbouncer flag is stripped and disables caching."""
+        config = DatabaseConfig(url="postgresql+asyncpg://db/trading?pgbouncer=true")
+        url, connect_args = config.engine_args()
+
+        assert "pgbouncer" not in url.query
+        assert connect_args["statement_cache_size"] == 0
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
+        assert connect_args["server_settings"] == {"application_name": "rbt"}
+
+    def test_server_settings(self):
+        """Test session settings are sent as asyncpg startup parameters."""
+        config = DatabaseConfig(
+            url="postgresql+asyncpg://db/trading", statement_timeout=5000
+        )
+        _, connect_args = config.engine_args()
+        settings = connect_args["server_settings"]
+
+        assert settings["jit"] == "off"
+        assert settings["statement_timeout"] == "5000"
+        assert settings["idle_in_transaction_session_timeout"] == "60000"
+
+    def test_other_drivers(self):
+        """Test non-asyncpg URLs get no driver-specific arguments."""
+        _, connect_args = DatabaseConfig(url="sqlite+aiosqlite://").engine_args()
+        assert connect_args == {}
+
+
+class TestGlobalDatabase:
+    """Tests for the global database instance."""
+
+    def test_get_database_is_shared(self):
+        """Test the global instance is created once and replaced on configure."""
+        first = get_database()
+        assert get_database() is first
+
+        config = DatabaseConfig(url="postgresql+asyncpg://db/other")
+        configured = configure_database(config)
+        try:
+            assert configured is not first
+            assert get_database() is configured
+        finally:
+            configure_database(first.config)
+
+
+class TestDatabase:
+    """Tests for Database session handling."""
+
+    @pytest.mark.asyncio
+    async def test_scoped_session_per_task(self):
+        """Test the scoped registry shares a session within a task only."""
+        db = Database(DatabaseConfig(url="postgresql+asyncpg://db/trading", min_size=0))
+        await db.init()
+        try:
+            session = db.scoped_session()
+            assert db.scoped_session() is session
+
+            async def session_in_task():
+                return db.scoped_session()
+
+            assert await asyncio.create_task(session_in_task()) is not session
+
+            await db.scoped_session.remove()
+            assert db.scoped_session() is not session
+        finally:
+            await db.close()
+
+    @pytest.mark.asyncio
+    async def test_audit_rows_written_in_batches(self):
+        """Test queued audit rows are grouped into one executemany per table."""
+        db = Database(DatabaseConfig(url="postgresql+asyncpg://db/trading", min_size=0))
+        conn = AsyncMock()
+
+        @asynccontextmanager
+        async def pipeline():
+            yield conn
+
+        db.pipeline = pipeline
+        await db.init()
+        try:
+            trade = {"user_id": "u1", "symbol": "INFY", "quantity": 1}
+            await db.log_trade(trade)
+            await db.log_trade(dict(trade, symbol="TCS"))
+            await db.notify({"user_id": "u1", "body": "filled"})
+            await db.flush_audit()
+        finally:
+            await db.close()
+
+        written = {
+            call.args[0].table.name: call.args[1]
+            for call in conn.execute.call_args_list
+        }
+        assert [row["symbol"] for row in written["trade_logs"]] == ["INFY", "TCS"]
+        assert written["notifications"] == [{"user_id": "u1", "body": "filled"}]
+
+    @pytest.mark.asyncio
+    async def test_session_commits_only_writes(self):
+        """Test read-only session blocks end without a commit."""
+        db = Database(DatabaseConfig(url="postgresql+asyncpg://db/trading", min_size=0))
+        await db.init()
+        try:
+            with patch.object(AsyncSession, "commit", AsyncMock()) as commit:
+                async with db.session() as session:
+                    assert session.info["readonly"] is True
+                commit.assert_not_awaited()
+
+                async with db.session() as session:
+                    session.add(User(email="a@example.com"))
+                commit.assert_awaited_once()
+        finally:
+            await db.close()
@@ -0,0 +1,163 @@
+"""
+Tests for the EventBus.
+
+Tests subscription, user-scoped handlers and publishing.
+"""
+
+import functools
+
+import pytest
+
+import sys
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+
+from src.core.events import Event, EventBus, EventType
+
+
+class TestEventBus:
+    """Tests for EventBus publish/subscribe."""
+
+    @pytest.mark.asyncio
+    async def test_sync_and_async_handlers(self):
+        """Test both handler kinds receive matching events only."""
+        bus = EventBus()
+        received = []
+
+        @bus.subscribe(EventType.ORDER_PLACED)
+        def on_sync(event):
+            received.append(("sync", event.data["order_id"]))
+
+        @bus.subscribe([EventType.ORDER_PLACED, EventType.ORDER_FILLED])
+        async def on_async(event):
+            received.append(("async", event.type))
+
+        await bus.publish(Event(type=EventType.ORDER_PLACED, data={"order_id": "1"}))
+        await bus.publish(Event(type=EventType.PRICE_UPDATE))
+
+        assert received == [("sync", "1"), ("async", EventType.ORDER_PLACED)]
+
+    @pytest.mark.asyncio
+    async def test_async_callables_and_partials_are_awaited(self):
+        """Test async callable objects and partials are detected as async."""
+        bus = EventBus()
+        received = []
+
+        class Recorder:
+            async def __call__(self, event):
+                received.append(("object", event.type))
+
+        async def record(tag, event):
+            received.append((tag, event.type))
+
+        bus.add_handler(EventType.ORDER_PLACED, Recorder())
+        bus.add_handler(EventType.ORDER_PLACED, functools.partial(record, "partial"))
+        bus.subscribe_all()(functools.partial(functools.partial(record), "global"))
+
+        await bus.publish(Event(type=EventType.ORDER_PLACED))
+
+        assert sorted(received) == [
+            ("global", EventType.ORDER_PLACED),
+            ("object", EventType.ORDER_PLACED),
+            ("partial", EventType.ORDER_PLACED),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_global_and_user_handlers(self):
+        """Test global handlers see everything, user handlers their user."""
+        bus = EventBus()
+        seen_global = []
+        seen_user = []
+
+        bus.subscribe_all()(lambda event: seen_global.append(event.type))
+        bus.add_handler(EventType.TP_TRIGGERED, seen_user.append, user_id="u1")
+
+        await bus.publish(Event(type=EventType.TP_TRIGGERED, user_id="u1"))
+        await bus.publish(Event(type=EventType.TP_TRIGGERED, user_id="u2"))
+        await bus.publish(Event(type=EventType.SL_TRIGGERED))
+
+        assert len(seen_global) == 3
+        assert [e.user_id for e in seen_user] == ["u1"]
+
+        bus.remove_user_handlers("u1")
+        assert not bus._any_user_handlers
+        await bus.publish(Event(type=EventType.TP_TRIGGERED, user_id="u1"))
+        assert len(seen_user) == 1
+
+    @pytest.mark.asyncio
+    async def test_remove_handler(self):
+        """Test removed handlers stop receiving events."""
+        bus = EventBus()
+        calls = []
+        bus.add_handler(EventType.RULE_CREATED, calls.append)
+
+        assert bus.remove_handler(EventType.RULE_CREATED, calls.append)
+        assert not bus.remove_handler(EventType.RULE_CREATED, calls.append)
+
+        await bus.publish(Event(type=EventType.RULE_CREATED))
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_are_isolated(self):
+        """Test a failing handler does not stop later handlers."""
+        bus = EventBus()
+        calls = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        bus.add_handler(EventType.SYSTEM_ERROR, broken)
+        bus.add_handler(EventType.SYSTEM_ERROR, calls.append)
+
+        await bus.publish(Event(type=EventType.SYSTEM_ERROR))
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_many(self):
+        """Test publish_many delivers every event in input order."""
+        bus = EventBus()
+        calls = []
+        bus.add_handler(EventType.PRICE_UPDATE, calls.append)
+        bus.add_handler(EventType.ORDER_PLACED, calls.append)
+
+        await bus.publish_many(
+            [
+                Event(type=EventType.PRICE_UPDATE),
+                Event(type=EventType.ORDER_PLACED),
+                Event(type=EventType.PRICE_UPDATE),
+            ]
+        )
+        assert [e.type for e in calls] == [
+            EventType.PRICE_UPDATE,
+            EventType.ORDER_PLACED,
+            EventType.PRICE_UPDATE,
+        ]
+
+    def test_data_copy_on_write(self):
+        """Test default payloads are shared and copied on first write."""
+        first = Event(type=EventType.ENGINE_STARTED)
+        second = Event(type=EventType.ENGINE_STARTED)
+        assert first.data is second.data
+
+        first.set_data("reason", "manual")
+        first.set_metadata("source", "test")
+        assert first.data == {"reason": "manual"}
+        assert first.metadata == {"source": "test"}
+        assert second.data == {}
+        assert second.metadata == {}
+
+    def test_to_dict(self):
+        """Test events serialize to a JSON-friendly dict."""
+        event = Event(type=EventType.ORDER_PLACED, user_id="u1", data={"a": 1})
+        payload = event.to_dict()
+
+        assert payload["type"] == "order.placed"
+        assert payload["user_id"] == "u1"
+        assert payload["data"] == {"a": 1}
+        assert isinstance(payload["timestamp"], str)
+        assert payload["id"]
+
+    def test_wire_names_round_trip(self):
+        """Test every event type maps to a unique wire name and back."""
+        for event_type in EventType:
+            assert EventType.from_wire(event_type.wire) is event_type
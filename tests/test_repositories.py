@@ -0,0 +1,277 @@
+"""
+Tests for the PostgreSQL repositories.
+
+Tests query behavior that can be checked without a live database.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import sys
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+
+from src.database.models import User
+from src.database.repositories import (
+    STREAM_BATCH_SIZE,
+    _UPSERT_RULES,
+    PostgresRulesRepository,
+    PostgresSessionRepository,
+    PostgresTradeLogRepository,
+    PostgresUserRepository,
+)
+
+
+def cached_session(expires_in: int) -> dict:
+    """Build a cached session payload expiring in ``expires_in`` seconds."""
+    expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+    return {
+        "session_id": "s1",
+        "user_id": "u1",
+        "broker_account_id": None,
+        "expires_at": expires_at.isoformat(),
+        "last_activity": datetime.utcnow().isoformat(),
+    }
+
+
+def executing_session(result) -> AsyncSession:
+    """Build an unbound AsyncSession whose ``execute`` returns ``result``."""
+    session = AsyncSession()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+class HistoryRow:
+    """Stand-in for a trade history result row."""
+
+    def __init__(self, **values):
+        self._mapping = values
+        self.__dict__.update(values)
+
+
+class StreamResult:
+    """Async-iterable stand-in for a streamed result."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def __aiter__(self):
+        for row in self.rows:
+            yield row
+
+
+class TestSessionCache:
+    """Tests for the session repository read-through cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(self):
+        """Test a live cached session is returned without a query."""
+        session = AsyncMock()
+        cache = AsyncMock()
+        cache.get.return_value = cached_session(60)
+        repo = PostgresSessionRepository(session, cache=cache)
+
+        data = await repo.get_session("u1")
+
+        assert data["session_id"] == "s1"
+        cache.get.assert_awaited_once_with("session:u1")
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_reads_database(self):
+        """Test an expired cached session falls through to Postgres."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            one_or_none=MagicMock(return_value=None)
+        )
+        cache = AsyncMock()
+        cache.get.return_value = cached_session(-1)
+        repo = PostgresSessionRepository(session, cache=cache)
+
+        assert await repo.get_session("u1") is None
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cache_after_commit(self):
+        """Test session writes drop the cached entry only once committed."""
+        session = executing_session(MagicMock(rowcount=1))
+        cache = AsyncMock()
+        repo = PostgresSessionRepository(session, cache=cache)
+
+        await repo.refresh_session("u1", 60)
+        await repo.delete_session("u1")
+        cache.delete.assert_not_awaited()
+
+        await session.commit()
+        await asyncio.sleep(0)
+        cache.delete.assert_awaited_once_with("session:u1")
+
+    @pytest.mark.asyncio
+    async def test_rollback_keeps_cache(self):
+        """Test a rolled back write leaves the cached entry alone."""
+        session = executing_session(MagicMock(rowcount=1))
+        cache = AsyncMock()
+        repo = PostgresSessionRepository(session, cache=cache)
+
+        await session.begin()
+        await repo.delete_session("u1")
+        await session.rollback()
+        await session.commit()
+        await asyncio.sleep(0)
+
+        cache.delete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_expired_invalidates_owners(self):
+        """Test expired sessions are deleted and their users uncached."""
+        session = executing_session(
+            MagicMock(
+                scalars=MagicMock(
+                    return_value=MagicMock(
+                        all=MagicMock(return_value=["u1", "u1", "u2"])
+                    )
+                )
+            )
+        )
+        cache = AsyncMock()
+        repo = PostgresSessionRepository(session, cache=cache)
+
+        assert await repo.delete_expired() == 3
+        await session.commit()
+        await asyncio.sleep(0)
+
+        assert {call.args[0] for call in cache.delete.await_args_list} == {
+            "session:u1",
+            "session:u2",
+        }
+
+
+class TestUserRepository:
+    """Tests for PostgresUserRepository statements."""
+
+    @pytest.mark.asyncio
+    async def test_update_returns_row_in_one_statement(self):
+        """Test update issues a single UPDATE ... RETURNING for set columns."""
+        session = AsyncMock()
+        updated = User(id="u1", email="new@example.com")
+        session.execute.return_value = MagicMock(
+            scalar_one_or_none=MagicMock(return_value=updated)
+        )
+        repo = PostgresUserRepository(session)
+
+        result = await repo.update("u1", User(email="new@example.com"))
+
+        assert result is updated
+        session.execute.assert_awaited_once()
+        stmt = session.execute.call_args.args[0]
+        assert stmt.is_update and stmt._returning
+        assert "email" in str(stmt) and "SET id" not in str(stmt)
+
+    @pytest.mark.asyncio
+    async def test_find_ignores_unknown_filters(self):
+        """Test find filters on columns and drops other keys."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        repo = PostgresUserRepository(session)
+
+        await repo.find(email="a@example.com", broker_accounts=[], bogus=1)
+
+        where = str(session.execute.call_args.args[0].whereclause)
+        assert where == "users.email = :email_1"
+
+
+class TestRulesRepository:
+    """Tests for PostgresRulesRepository writes."""
+
+    @pytest.mark.asyncio
+    async def test_save_rules_mixes_new_and_existing(self):
+        """Test new and existing rules upsert with the same bound columns."""
+        session = AsyncMock()
+        repo = PostgresRulesRepository(session)
+
+        await repo.save_rules(
+            "u1",
+            {
+                "rules": [
+                    {"name": "new"},
+                    {"id": "r1", "name": "edited"},
+                    {"name": "another"},
+                ]
+            },
+        )
+
+        assert session.execute.await_count == 2
+        delete_stmt = session.execute.await_args_list[0].args[0]
+        assert delete_stmt.is_delete
+        assert delete_stmt.compile().params["id_1"] == ["r1"]
+
+        stmt, rows = session.execute.await_args_list[1].args
+        assert stmt is _UPSERT_RULES
+        assert len({frozenset(row) for row in rows}) == 1
+        assert rows[1]["id"] == "r1"
+        assert len({row["id"] for row in rows}) == 3
+        assert [row["name"] for row in rows] == ["new", "edited", "another"]
+
+
+class TestTradeLogRepository:
+    """Tests for PostgresTradeLogRepository queries."""
+
+    @pytest.mark.asyncio
+    async def test_stream_trade_history(self):
+        """Test history streams records through a batched cursor."""
+        executed_at = datetime(2025, 1, 2, 9, 15)
+        session = AsyncMock()
+        session.stream.return_value = StreamResult(
+            [HistoryRow(id=7, symbol="INFY", executed_at=executed_at)]
+        )
+        repo = PostgresTradeLogRepository(session)
+
+        records = [r async for r in repo.stream_trade_history("u1")]
+
+        assert records == [
+            {"id": "7", "symbol": "INFY", "executed_at": executed_at.isoformat()}
+        ]
+        query = session.stream.call_args.args[0]
+        assert query.get_execution_options()["yield_per"] == STREAM_BATCH_SIZE
+
+    @pytest.mark.asyncio
+    async def test_log_trades_copies_records(self):
+        """Test bulk trade logs are loaded with one COPY on asyncpg."""
+        driver = AsyncMock()
+        conn = AsyncMock()
+        conn.dialect.driver = "asyncpg"
+        conn.get_raw_connection.return_value = MagicMock(driver_connection=driver)
+
+        @asynccontextmanager
+        async def connect():
+            yield conn
+
+        session = AsyncMock()
+        session.bind = MagicMock(connect=connect)
+        repo = PostgresTradeLogRepository(session)
+        trade = {"symbol": "INFY", "exchange": "NSE", "side": "BUY"}
+
+        count = await repo.log_trades(
+            "u1",
+            [
+                dict(trade, quantity=1, price=1500.0),
+                dict(trade, quantity=2, price=1501.0, metadata={"leg": 2}),
+            ],
+        )
+
+        assert count == 2
+        driver.copy_records_to_table.assert_awaited_once()
+        call = driver.copy_records_to_table.call_args
+        assert call.args == ("trade_logs",)
+        columns = call.kwargs["columns"]
+        records = [dict(zip(columns, r)) for r in call.kwargs["records"]]
+        assert [r["quantity"] for r in records] == [1, 2]
+        assert records[0]["order_type"] == "MARKET"
+        assert json.loads(records[1]["metadata"]) == {"leg": 2}
+        session.add.assert_not_called()
@@ -0,0 +1,62 @@
+"""
+Tests for the tick ring buffer.
+
+Tests slot reuse, independent consumers, overruns and wakeups.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+import sys
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+
+from src.core.ringbuf import Ring
+
+
+class TestRing:
+    """Tests for Ring and RingConsumer."""
+
+    def test_size_must_be_power_of_two(self):
+        """Test non power-of-two sizes are rejected."""
+        with pytest.raises(ValueError):
+            Ring(size=100)
+
+    def test_consumers_read_independently(self):
+        """Test each consumer sees every published tick once."""
+        ring = Ring(size=8)
+        first = ring.consumer()
+        ring.write(1, 10.0)
+        second = ring.consumer()
+        ring.write(2, 20.0)
+
+        assert [(s.token, s.ltp) for s in first.poll()] == [(1, 10.0), (2, 20.0)]
+        assert [s.token for s in second.poll()] == [2]
+        assert list(first.poll()) == []
+
+    def test_slots_are_reused(self):
+        """Test writes past capacity reuse slots and count overruns."""
+        ring = Ring(size=4)
+        consumer = ring.consumer()
+        for token in range(6):
+            ring.write(token, float(token))
+
+        assert [s.token for s in consumer.poll()] == [2, 3, 4, 5]
+        assert consumer.overruns == 2
+        assert ring._slot(0) is ring._slot(4)
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_thread_write(self):
+        """Test a waiting consumer is woken by a write from another thread."""
+        ring = Ring(size=8)
+        consumer = ring.consumer()
+        waiting = asyncio.create_task(consumer.wait())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        threading.Thread(target=ring.write, args=(7, 1.5)).start()
+        await asyncio.wait_for(waiting, 1)
+
+        assert [s.token for s in consumer.poll()] == [7]
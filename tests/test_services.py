@@ -0,0 +1,300 @@
+"""
+Tests for the service layer.
+
+Tests TradingService broker calls and batched order operations.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+
+import sys
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+
+from src.brokers.base import BaseBroker
+from src.core.events import EventBus, EventType
+from src.core.services import RuleExecutionService, TradingService
+from src.core.sessions import SessionManager
+from src.models import (
+    Exchange,
+    OrderResult,
+    OrderType,
+    Position,
+    TransactionType,
+)
+
+ORDER = {"symbol": "INFY", "exchange": "NSE", "quantity": 1, "side": "BUY"}
+
+
+@pytest.fixture
+def bus():
+    """Create an isolated event bus."""
+    return EventBus()
+
+
+@pytest.fixture
+def broker():
+    """Create a broker stub returning successful results."""
+    broker = MagicMock(spec=BaseBroker)
+    broker.place_order.side_effect = lambda order: OrderResult(
+        success=True, order_id=order.tradingsymbol
+    )
+    broker.cancel_order.return_value = True
+    broker.build_place_order_fn.return_value = None
+    return broker
+
+
+@pytest_asyncio.fixture
+async def service(bus, broker):
+    """Create a trading service with an active session for user u1."""
+    manager = SessionManager(event_bus=bus)
+    await manager.create_session("u1", "kite", "token", broker=broker)
+    return TradingService(event_bus=bus, session_manager=manager)
+
+
+class TestTradingService:
+    """Tests for TradingService."""
+
+    @pytest.mark.asyncio
+    async def test_place_order_publishes_event(self, service, bus):
+        """Test a placed order is returned and announced."""
+        placed = []
+        bus.add_handler(EventType.ORDER_PLACED, placed.append)
+
+        result = await service.place_order("u1", **ORDER)
+        await service.flush()
+
+        assert result.order_id == "INFY"
+        assert [e.data["order_id"] for e in placed] == ["INFY"]
+
+    @pytest.mark.asyncio
+    async def test_place_order_builds_fresh_orders(self, service, broker):
+        """Test orders copied from the template are typed and independent."""
+        await service.place_order("u1", **ORDER, order_type="LIMIT", price=10)
+        await service.place_order("u1", **dict(ORDER, side="SELL"))
+        first, second = (c.args[0] for c in broker.place_order.call_args_list)
+
+        assert first.transaction_type is TransactionType.BUY
+        assert first.order_type is OrderType.LIMIT
+        assert first.price == 10.0
+        assert second.transaction_type is TransactionType.SELL
+        assert second.price == 0.0
+        assert first.meta is not second.meta
+
+        with pytest.raises(ValueError):
+            await service.place_order("u1", **dict(ORDER, side="HOLD"))
+
+    @pytest.mark.asyncio
+    async def test_place_order_coerces_template_fields(self, service, broker):
+        """Test caller values are coerced to the Order field types."""
+        await service.place_order(
+            "u1", **dict(ORDER, quantity="5", exchange=Exchange.NSE)
+        )
+        order = broker.place_order.call_args.args[0]
+
+        assert order.quantity == 5 and isinstance(order.quantity, int)
+        assert type(order.exchange) is str and order.exchange == "NSE"
+
+        with pytest.raises(ValueError):
+            await service.place_order("u1", **dict(ORDER, quantity="five"))
+
+    @pytest.mark.asyncio
+    async def test_place_order_fast_path(self, bus, broker):
+        """Test a broker-specialized order function bypasses Order building."""
+        fast = MagicMock(return_value=OrderResult(success=True, order_id="F1"))
+        broker.build_place_order_fn.return_value = fast
+        manager = SessionManager(event_bus=bus)
+        await manager.create_session("u1", "kite", "token", broker=broker)
+        service = TradingService(event_bus=bus, session_manager=manager)
+
+        result = await service.place_order("u1", **ORDER, price=10.5)
+
+        assert result.order_id == "F1"
+        broker.place_order.assert_not_called()
+        assert fast.call_args.kwargs["tradingsymbol"] == "INFY"
+        assert fast.call_args.kwargs["price"] == 10.5
+
+    @pytest.mark.asyncio
+    async def test_place_orders_keeps_order_and_failures(self, service, broker):
+        """Test batch placement returns results and exceptions in order."""
+
+        def place(order):
+            if order.tradingsymbol == "BAD":
+                raise RuntimeError("rejected")
+            return OrderResult(success=True, order_id=order.tradingsymbol)
+
+        broker.place_order.side_effect = place
+        results = await service.place_orders(
+            "u1", [ORDER, dict(ORDER, symbol="BAD"), dict(ORDER, symbol="TCS")]
+        )
+
+        assert results[0].order_id == "INFY"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].order_id == "TCS"
+
+    @pytest.mark.asyncio
+    async def test_batch_cancel(self, service, broker):
+        """Test batch cancellation cancels every order."""
+        assert await service.batch_cancel("u1", ["a", "b"]) == [True, True]
+        assert broker.cancel_order.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rejection_is_published_immediately(self, service, broker, bus):
+        """Test rejected orders are dispatched before place_order raises."""
+        rejected = []
+        bus.add_handler(EventType.ORDER_REJECTED, rejected.append)
+        broker.place_order.side_effect = RuntimeError("rejected")
+
+        with pytest.raises(RuntimeError):
+            await service.place_order("u1", **ORDER)
+        assert len(rejected) == 1
+
+    @pytest.mark.asyncio
+    async def test_conflated_events_keep_latest(self, service, bus):
+        """Test queued events sharing a conflation key collapse to the last."""
+        seen = []
+        bus.add_handler(EventType.TP_TRIGGERED, lambda e: seen.append(e.data["n"]))
+
+        for n in range(3):
+            await service._publish_event(
+                EventType.TP_TRIGGERED, "u1", {"n": n}, conflate_key="INFY"
+            )
+        await service._publish_event(
+            EventType.TP_TRIGGERED, "u1", {"n": 9}, conflate_key="TCS"
+        )
+        await service.flush()
+
+        assert seen == [2, 9]
+
+    @pytest.mark.asyncio
+    async def test_profile_fetched_in_background(self, service, broker):
+        """Test session creation fetches the profile off the critical path."""
+        context = service._get_context("u1")
+        await context.profile_ready.wait()
+
+        assert context.profile is broker.get_profile.return_value
+        assert await context.get_profile() is context.profile
+        broker.get_profile.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_positions_cached_until_order(self, service, broker):
+        """Test positions are reused briefly and refetched after an order."""
+        broker.get_positions.return_value = []
+
+        await service.get_positions("u1")
+        await service.get_positions("u1")
+        assert broker.get_positions.call_count == 1
+
+        await service.place_order("u1", **ORDER)
+        await service.get_positions("u1")
+        assert broker.get_positions.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_racing_invalidation_is_not_cached(self, service, broker):
+        """Test a read overlapping an invalidation does not cache stale data."""
+        stale, fresh = [MagicMock()], []
+
+        def fetch():
+            if broker.get_positions.call_count == 1:
+                service._invalidate_reads("u1")
+                return stale
+            return fresh
+
+        broker.get_positions.side_effect = fetch
+
+        assert await service.get_positions("u1") is stale
+        assert await service.get_positions("u1") is fresh
+        assert await service.get_positions("u1") is fresh
+        assert broker.get_positions.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_activated_context(self, service):
+        """Test an activated context is used only for its own user."""
+        manager = service._session_manager
+        with manager.activate("u1") as context:
+            manager._users.clear()
+            assert service._get_context("u1") is context
+            assert service._get_context("u2") is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_user(self, service):
+        """Test operations without a session raise ValueError."""
+        with pytest.raises(ValueError):
+            await service.get_positions("nobody")
+
+
+class TestRuleExecutionService:
+    """Tests for RuleExecutionService monitoring."""
+
+    @pytest.mark.asyncio
+    async def test_single_monitor_task(self, bus, broker):
+        """Test all monitored users share one task that checks each user."""
+        manager = SessionManager(event_bus=bus)
+        for user_id in ("u1", "u2"):
+            await manager.create_session(user_id, "kite", "token", broker=broker)
+        service = RuleExecutionService(event_bus=bus, session_manager=manager)
+        checked = asyncio.Event()
+        seen = set()
+
+        async def check_triggers(user_id):
+            seen.add(user_id)
+            if len(seen) == 2:
+                checked.set()
+            return []
+
+        service.check_triggers = check_triggers
+        assert await service.start_monitoring("u1", poll_interval=0.01)
+        assert await service.start_monitoring("u2", poll_interval=0.01)
+        assert not await service.start_monitoring("u1")
+        task = service._monitor_task
+
+        await asyncio.wait_for(checked.wait(), 1)
+        assert seen == {"u1", "u2"}
+
+        assert await service.stop_monitoring("u1")
+        assert service._monitor_task is task
+        assert await service.stop_monitoring("u2")
+        assert service._monitor_task is None
+        assert task.done()
+
+    @pytest.mark.asyncio
+    async def test_quotes_batched_per_broker(self, bus, broker):
+        """Test users sharing a broker trigger one merged quote request."""
+        manager = SessionManager(event_bus=bus)
+        for user_id in ("u1", "u2"):
+            await manager.create_session(user_id, "kite", "token", broker=broker)
+        broker.get_ltp.return_value = {"NSE:INFY": 1500.0, "NSE:TCS": 3500.0}
+        service = RuleExecutionService(event_bus=bus, session_manager=manager)
+        service.watch_symbols("u1", ["NSE:INFY"])
+        service.watch_symbols("u2", ["NSE:INFY", "NSE:TCS"])
+
+        await service._refresh_quotes(["u1", "u2"])
+
+        broker.get_ltp.assert_called_once()
+        assert sorted(broker.get_ltp.call_args.args[0]) == ["NSE:INFY", "NSE:TCS"]
+        assert service.get_cached_ltp("NSE:INFY")[0] == 1500.0
+
+    @pytest.mark.asyncio
+    async def test_execute_exit_short_stop_loss(self, service, broker, bus):
+        """Test a short position exits with a BUY and an SL event."""
+        triggered = []
+        bus.add_handler(EventType.SL_TRIGGERED, triggered.append)
+        rules = RuleExecutionService(
+            event_bus=bus,
+            session_manager=service._session_manager,
+            trading_service=service,
+        )
+        position = Position(
+            tradingsymbol="INFY", exchange="NSE", product="NRML", quantity=-5
+        )
+
+        result = await rules.execute_exit("u1", position, "SL", 1510.0)
+        await rules.flush()
+
+        order = broker.place_order.call_args.args[0]
+        assert result.order_id == "INFY"
+        assert (order.transaction_type, order.quantity) == (TransactionType.BUY, 5)
+        assert [e.data["trigger_price"] for e in triggered] == [1510.0]
@@ -0,0 +1,181 @@
+"""
+Tests for session management.
+
+Tests session expiry and SessionManager lifecycle handling.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+import sys
+
+sys.path.insert(0, str(__file__).rsplit("/tests", 1)[0])
+
+from src.brokers.base import BaseBroker, BaseTicker
+from src.core.events import EventBus, EventType
+from src.core.sessions import SessionManager, UserContext, UserSession
+
+
+def make_session(**kwargs) -> UserSession:
+    """Create a session with placeholder credentials."""
+    return UserSession(user_id="u1", broker_id="kite", access_token="t", **kwargs)
+
+
+class TestUserSession:
+    """Tests for UserSession expiry tracking."""
+
+    def test_no_expiry(self):
+        """Test sessions without an expiry never expire."""
+        assert not make_session().is_expired
+
+    def test_wall_clock_expiry(self):
+        """Test a wall-clock expiry is mirrored on the monotonic clock."""
+        assert make_session(
+            expires_at=datetime.utcnow() - timedelta(seconds=1)
+        ).is_expired
+        assert not make_session(
+            expires_at=datetime.utcnow() + timedelta(hours=1)
+        ).is_expired
+
+    def test_extend(self):
+        """Test extending moves both expiry clocks forward."""
+        session = make_session(expires_at=datetime.utcnow() - timedelta(seconds=1))
+        session.extend(60)
+        assert not session.is_expired
+        assert session.expires_at > datetime.utcnow()
+
+    def test_from_dict(self):
+        """Test stored sessions are parsed and validated."""
+        session = UserSession.from_dict(
+            {
+                "user_id": "u1",
+                "broker_id": "kite",
+                "access_token": "t",
+                "session_id": "s1",
+                "expires_at": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+            }
+        )
+        assert session.session_id == "s1"
+        assert not session.is_expired
+
+        with pytest.raises(ValueError):
+            UserSession.from_dict({"user_id": "u1", "broker_id": "kite"})
+
+    def test_touch(self):
+        """Test touching records recent activity."""
+        session = make_session()
+        before = session.last_activity_ns
+        session.touch()
+        assert session.last_activity_ns >= before
+        assert datetime.utcnow() - session.last_activity < timedelta(seconds=1)
+
+
+class TestUserContext:
+    """Tests for UserContext task tracking."""
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_are_dropped(self):
+        """Test completed tasks leave the set and running ones are cancelled."""
+        context = UserContext(session=make_session(), broker=MagicMock(spec=BaseBroker))
+        done = asyncio.create_task(asyncio.sleep(0))
+        pending = asyncio.create_task(asyncio.sleep(10))
+        context.add_task(done)
+        context.add_task(pending)
+
+        await done
+        await asyncio.sleep(0)
+        assert context._tasks == {pending}
+
+        await context.cancel_tasks()
+        assert pending.cancelled()
+        assert not context._tasks
+
+    @pytest.mark.asyncio
+    async def test_ticker_feeds_ring(self):
+        """Test starting the ticker routes its ticks into the ring."""
+        ticker = MagicMock(spec=BaseTicker)
+        context = UserContext(
+            session=make_session(), broker=MagicMock(spec=BaseBroker), ticker=ticker
+        )
+        assert await context.start_ticker()
+        consumer = context.ring.consumer()
+
+        ticker.on_ticks(ticker, [{"instrument_token": 5, "last_price": 99.5}])
+
+        assert [(s.token, s.ltp) for s in consumer.poll()] == [(5, 99.5)]
+
+    @pytest.mark.asyncio
+    async def test_ticker_connect_timeout(self):
+        """Test a hanging ticker handshake fails without blocking the loop."""
+        ticker = MagicMock(spec=BaseTicker)
+        ticker.connect.side_effect = lambda: time.sleep(0.2)
+        context = UserContext(
+            session=make_session(), broker=MagicMock(spec=BaseBroker), ticker=ticker
+        )
+
+        assert not await context.start_ticker(connect_timeout=0.01)
+        await context.stop_ticker()
+        ticker.close.assert_called_once()
+
+
+class TestSessionManager:
+    """Tests for SessionManager expiry cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired(self):
+        """Test only due sessions are ended, ignoring superseded expiries."""
+        manager = SessionManager(event_bus=EventBus())
+        past = datetime.utcnow() - timedelta(seconds=1)
+        for user_id in ("u1", "u2", "u3"):
+            await manager.create_session(
+                user_id,
+                "kite",
+                "t",
+                broker=MagicMock(spec=BaseBroker),
+                expires_at=past if user_id != "u3" else None,
+            )
+        await manager.refresh_session("u2", "t2")
+
+        assert await manager.cleanup_expired() == 1
+        assert sorted(manager.active_sessions) == ["u2", "u3"]
+        assert await manager.cleanup_expired() == 0
+
+    @pytest.mark.asyncio
+    async def test_end_session_drops_only_user_handlers(self):
+        """Test ending a session removes that user's handlers and no others."""
+        bus = EventBus()
+        manager = SessionManager(event_bus=bus)
+        for user_id in ("u1", "u2"):
+            await manager.create_session(
+                user_id, "kite", "t", broker=MagicMock(spec=BaseBroker)
+            )
+            bus.add_handler(EventType.ORDER_PLACED, lambda e: None, user_id=user_id)
+        bus.add_handler(EventType.ORDER_PLACED, lambda e: None)
+
+        assert await manager.end_session("u1")
+
+        assert list(bus._user_handlers) == ["u2"]
+        assert bus._handlers[id(EventType.ORDER_PLACED)]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_publishes_one_batch_event(self):
+        """Test shutdown ends every session and emits a single batch event."""
+        bus = EventBus()
+        seen = []
+        bus.subscribe_all()(seen.append)
+        manager = SessionManager(event_bus=bus)
+        for user_id in ("u1", "u2"):
+            await manager.create_session(
+                user_id, "kite", "t", broker=MagicMock(spec=BaseBroker)
+            )
+        seen.clear()
+
+        await manager.shutdown()
+
+        assert manager.session_count == 0
+        assert [e.type for e in seen] == [EventType.SESSIONS_SHUTDOWN]
+        assert seen[0].data["user_ids"] == ["u1", "u2"]